@@ -7,6 +7,8 @@ Responsibilities:
 Implementation deferred to Phase 6.
 """
 
+import multiprocessing
+
 from icr.frontend import flow
 
 
@@ -21,4 +23,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds start process-pool workers by re-running
+    # this executable; freeze_support hands those launches to the worker.
+    multiprocessing.freeze_support()
     main()
@@ -6,13 +6,16 @@ Responsibilities:
 - Phase 7B delivery actions (future)
 """
 
-from .email import EmailDeliveryPlan, EmailDeliveryResult, deliver_emails
+from .common import DeliveryResults
+from .email import EmailDeliveryPlan, EmailDeliveryResult, deliver_emails, deliver_emails_async
 from .pdf import PdfResult, generate_pdfs
 
 __all__ = [
+    "DeliveryResults",
     "EmailDeliveryPlan",
     "EmailDeliveryResult",
     "PdfResult",
     "deliver_emails",
+    "deliver_emails_async",
     "generate_pdfs",
 ]
@@ -0,0 +1,33 @@
+"""Filesystem helpers shared by delivery phases."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def iter_files_with_suffix(root: Path, suffix: str) -> list[Path]:
+    """Return files under ``root`` whose name ends with ``suffix``, sorted.
+
+    Walks with ``os.scandir`` so directory entry types come from the OS
+    listing instead of an extra ``stat`` per file, and only builds ``Path``
+    objects for matches. Suffix matching follows the platform's case rules,
+    like ``Path.rglob``.
+    """
+
+    suffix = os.path.normcase(suffix)
+    found: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.normcase(entry.name).endswith(suffix) and entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    found.sort()
+    return found
@@ -0,0 +1,171 @@
+"""Shared artifact lookup by file stem for delivery phases.
+
+Delivery locates per-vessel artifacts (.eml drafts, HTML reports) by
+matching the vessel identifier against file stems: an exact,
+case-insensitive stem match wins, otherwise the shortest stem containing
+the identifier. The index is built once per run so each vessel lookup
+avoids rescanning and re-lowercasing every file name.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+_GRAM = 3
+# Below this many (key, file) pairs the automaton setup costs more than it saves.
+_AUTOMATON_MIN_PAIRS = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class StemIndex:
+    """Exact and substring lookup of files by case-insensitive stem.
+
+    Stored as parallel vectors (path, lowercased stem, stem length) so the
+    per-vessel lookups never recompute ``stem.lower()`` or ``len(stem)``.
+    """
+
+    paths: list[Path]
+    stems_lower: list[str]
+    stem_lengths: list[int]
+    exact: dict[str, int]
+    grams: dict[str, list[int]]
+    substring_hits: dict[str, int | None]
+
+    @classmethod
+    def build(cls, paths: Iterable[Path], keys: Iterable[str] = ()) -> StemIndex:
+        """Build the index; ``keys`` lets large batches precompute matches."""
+
+        path_list = list(paths)
+        stems = [path.stem.lower() for path in path_list]
+        exact: dict[str, int] = {}
+        grams: dict[str, list[int]] = {}
+        for index, stem in enumerate(stems):
+            exact.setdefault(stem, index)
+            for gram in {stem[i : i + _GRAM] for i in range(len(stem) - _GRAM + 1)}:
+                grams.setdefault(gram, []).append(index)
+        index = cls(
+            paths=path_list,
+            stems_lower=stems,
+            stem_lengths=[len(path.stem) for path in path_list],
+            exact=exact,
+            grams=grams,
+            substring_hits={},
+        )
+        index._precompute_substring_hits(keys)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def find(self, key: str) -> Path | None:
+        """Return the best file for ``key`` or None when nothing matches."""
+
+        normalized = key.strip().lower()
+        if not normalized:
+            return None
+
+        exact = self.exact.get(normalized)
+        if exact is not None:
+            return self.paths[exact]
+
+        if normalized in self.substring_hits:
+            hit = self.substring_hits[normalized]
+            return None if hit is None else self.paths[hit]
+
+        stems = self.stems_lower
+        best = min(
+            (index for index in self._candidates(normalized) if normalized in stems[index]),
+            key=self._rank,
+            default=None,
+        )
+        return None if best is None else self.paths[best]
+
+    def _rank(self, index: int) -> tuple[int, str]:
+        # Shortest stem wins; ties break on the full path.
+        return (self.stem_lengths[index], str(self.paths[index]))
+
+    def _precompute_substring_hits(self, keys: Iterable[str]) -> None:
+        # For large batches, one Aho-Corasick pass over all stems finds every
+        # key's substring matches at once. Uses the optional pyahocorasick
+        # package; without it lookups fall back to the trigram index.
+        pending = {key.strip().lower() for key in keys} - {""}
+        pending.difference_update(self.exact)
+        if len(pending) * len(self.paths) < _AUTOMATON_MIN_PAIRS:
+            return
+        automaton = _load_automaton()
+        if automaton is None:
+            return
+
+        for key in pending:
+            automaton.add_word(key, key)
+        automaton.make_automaton()
+
+        hits: dict[str, int | None] = dict.fromkeys(pending)
+        for index, stem in enumerate(self.stems_lower):
+            for _, key in automaton.iter(stem):
+                current = hits[key]
+                if current is None or self._rank(index) < self._rank(current):
+                    hits[key] = index
+        self.substring_hits.update(hits)
+
+    def _candidates(self, normalized: str) -> Iterable[int]:
+        # Every substring match must contain all of the key's trigrams, so
+        # intersecting their posting lists narrows the candidates before the
+        # final substring check.
+        if len(normalized) < _GRAM:
+            return range(len(self.paths))
+
+        postings: list[list[int]] = []
+        for gram in {normalized[i : i + _GRAM] for i in range(len(normalized) - _GRAM + 1)}:
+            posting = self.grams.get(gram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return candidates
+
+
+def lazy_stem_index(
+    list_files: Callable[[], Iterable[Path]],
+    list_keys: Callable[[], Iterable[str]] | None = None,
+) -> Callable[[], StemIndex]:
+    """Return a thunk that lists files and builds the index on first call.
+
+    Vessels with explicit artifact paths never need the index, so the
+    filesystem walk is deferred until a lookup actually falls back to it.
+    The thunk is safe to share between delivery worker threads.
+    """
+
+    index: StemIndex | None = None
+    lock = threading.Lock()
+
+    def _get() -> StemIndex:
+        nonlocal index
+        if index is None:
+            with lock:
+                if index is None:
+                    index = StemIndex.build(list_files(), list_keys() if list_keys else ())
+        return index
+
+    return _get
+
+
+def _load_automaton() -> Any | None:
+    try:
+        import ahocorasick  # type: ignore[import-not-found]
+    except Exception:
+        return None
+
+    try:
+        return ahocorasick.Automaton()
+    except Exception:
+        return None
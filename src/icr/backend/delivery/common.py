@@ -0,0 +1,79 @@
+"""Result containers shared by delivery phases."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Callable, TypeVar, overload
+
+ResultT = TypeVar("ResultT")
+
+
+class DeliveryResults(Sequence[ResultT], Mapping[str, ResultT]):
+    """Per-vessel results in dispatch order, also addressable by vessel id.
+
+    Behaves as a sequence (integer indexing, slicing, iteration over
+    results) and as a mapping keyed by vessel id (``results["VESSEL_A"]``,
+    ``keys()``, ``get()``). The id index is built once at construction, so
+    callers never rebuild ``{result.vessel_id: result}`` dicts. When ids
+    repeat (for example several ``UNKNOWN`` rows) the last result wins, as
+    it would in such a dict.
+    """
+
+    __slots__ = ("_items", "_index")
+
+    def __init__(self, results: Iterable[ResultT], *, key: Callable[[ResultT], str]) -> None:
+        self._items = list(results)
+        self._index = {key(result): position for position, result in enumerate(self._items)}
+
+    @overload
+    def __getitem__(self, item: int) -> ResultT: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> list[ResultT]: ...
+
+    @overload
+    def __getitem__(self, item: str) -> ResultT: ...
+
+    def __getitem__(self, item: int | slice | str) -> ResultT | list[ResultT]:
+        if isinstance(item, str):
+            return self._items[self._index[item]]
+        return self._items[item]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[ResultT]:
+        return iter(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, str):
+            return item in self._index
+        return item in self._items
+
+    def __reversed__(self) -> Iterator[ResultT]:
+        return reversed(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DeliveryResults):
+            return self._items == other._items
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return self._items == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def keys(self):  # type: ignore[override]
+        return self._index.keys()
+
+    def values(self):  # type: ignore[override]
+        return [self._items[position] for position in self._index.values()]
+
+    def items(self):  # type: ignore[override]
+        return [(key, self._items[position]) for key, position in self._index.items()]
+
+    def get(self, key: str, default: object = None) -> ResultT | object:  # type: ignore[override]
+        position = self._index.get(key)
+        return default if position is None else self._items[position]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
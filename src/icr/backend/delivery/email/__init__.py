@@ -1,5 +1,15 @@
 """Email delivery utilities for Phase 7B."""
 
-from .dispatch import EmailDeliveryPlan, EmailDeliveryResult, deliver_emails
+from .dispatch import (
+    EmailDeliveryPlan,
+    EmailDeliveryResult,
+    deliver_emails,
+    deliver_emails_async,
+)
 
-__all__ = ["EmailDeliveryPlan", "EmailDeliveryResult", "deliver_emails"]
+__all__ = [
+    "EmailDeliveryPlan",
+    "EmailDeliveryResult",
+    "deliver_emails",
+    "deliver_emails_async",
+]
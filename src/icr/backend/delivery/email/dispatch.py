@@ -6,12 +6,32 @@ transports without inspecting or modifying content.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import queue
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Iterable, Mapping, Protocol
+from typing import Callable, Iterable, Mapping, Protocol
 
+from .._fsutil import iter_files_with_suffix
+from .._stem_index import StemIndex, lazy_stem_index
+from ..common import DeliveryResults
 from .models import EmailDeliveryPlan, EmailDeliveryResult
-from .transports import EmailTransport, SmtpConfig, SmtpTransport, TransportResult
+from .transports import (
+    AsyncSmtpTransport,
+    EmailTransport,
+    SmtpConfig,
+    SmtpTransport,
+    TransportResult,
+    is_transient_error,
+    load_aiosmtplib,
+)
+
+
+_Getter = Callable[[str, object], object]
 
 
 class _LoggerLike(Protocol):
@@ -24,137 +44,510 @@ class _LoggerLike(Protocol):
     def exception(self, msg: str, *args: object, **kwargs: object) -> None: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ResolvedTransport:
     transport: EmailTransport | None
     name: str | None
     reason: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class _RetryPolicy:
+    max_retries: int = 0
+    base_seconds: float = 0.5
+    cap_seconds: float = 30.0
+
+    def delay(self, attempt: int) -> float:
+        # Capped exponential backoff plus jitter so parallel workers do not
+        # retry in lockstep.
+        backoff = min(self.cap_seconds, self.base_seconds * 2**attempt)
+        return backoff + random.uniform(0, self.base_seconds)
+
+
 def deliver_emails(
     run_paths: object,
     vessels: Iterable[object],
     delivery_plan: EmailDeliveryPlan | Mapping[str, object] | object,
     logger: _LoggerLike | None,
+) -> DeliveryResults[EmailDeliveryResult]:
+    """Send existing .eml drafts via the configured transport.
+
+    When the plan requests ``async_concurrency > 1`` over SMTP and
+    ``aiosmtplib`` is installed, delivery runs through
+    ``deliver_emails_async``. Callers already inside an event loop should
+    await that coroutine directly.
+    """
+
+    return _results(_deliver_emails(run_paths, vessels, delivery_plan, logger))
+
+
+def _deliver_emails(
+    run_paths: object,
+    vessels: Iterable[object],
+    delivery_plan: EmailDeliveryPlan | Mapping[str, object] | object,
+    logger: _LoggerLike | None,
 ) -> list[EmailDeliveryResult]:
-    """Send existing .eml drafts via the configured transport."""
 
-    send_now = bool(_get_option(delivery_plan, "send_now", False))
-    confirm_send = bool(_get_option(delivery_plan, "confirm_send", False))
+    vessel_list = list(vessels)
+    skipped = _skip_without_intent(vessel_list, delivery_plan)
+    if skipped is not None:
+        return skipped
 
-    if not send_now:
-        return _skip_all(
-            vessels,
-            reason="Email delivery disabled by user.",
-            transport=_get_option(delivery_plan, "transport", None),
-        )
-    if send_now and not confirm_send:
-        return _skip_all(
-            vessels,
-            reason="Email delivery not confirmed.",
-            transport=_get_option(delivery_plan, "transport", None),
-        )
+    if _async_requested(delivery_plan):
+        return asyncio.run(_deliver_emails_async(run_paths, vessel_list, delivery_plan, logger))
 
     resolved = _resolve_transport(delivery_plan)
     if resolved.transport is None:
         reason = resolved.reason or "Email transport unavailable."
-        return _skip_all(vessels, reason=reason, transport=resolved.name)
+        return _skip_all(vessel_list, reason=reason, transport=resolved.name)
 
     root = _resolve_run_root(run_paths)
-    eml_files = _list_eml_files(root)
+    eml_index = lazy_stem_index(
+        lambda: _list_eml_files(root),
+        lambda: [_coerce_vessel_id(vessel) for vessel in vessel_list],
+    )
+
+    concurrency = _coerce_positive_int(_get_option(delivery_plan, "concurrency", 1)) or 1
+    retry = _resolve_retry_policy(delivery_plan)
+
+    if concurrency > 1 and len(vessel_list) > 1:
+        transports = [resolved.transport]
+        for _ in range(min(concurrency, len(vessel_list)) - 1):
+            extra = _resolve_transport(delivery_plan).transport
+            if extra is None or extra is resolved.transport:
+                # Workers never share a session; run with fewer workers instead.
+                break
+            transports.append(extra)
+        if len(transports) > 1:
+            return _deliver_concurrently(
+                transports,
+                vessel_list,
+                root=root,
+                eml_index=eml_index,
+                transport_name=resolved.name,
+                retry=retry,
+                logger=logger,
+            )
 
     results: list[EmailDeliveryResult] = []
 
-    for vessel in vessels:
-        vessel_id = _coerce_vessel_id(vessel)
-        if not vessel_id:
+    with _transport_session(resolved.transport) as transport:
+        for vessel in vessel_list:
             results.append(
-                EmailDeliveryResult(
-                    vessel_id="UNKNOWN",
-                    status="skipped",
-                    reason="Missing vessel identifier.",
-                    transport=resolved.name,
-                    provider_message_id=None,
+                _deliver_one(
+                    transport,
+                    vessel,
+                    root=root,
+                    eml_index=eml_index,
+                    transport_name=resolved.name,
+                    retry=retry,
+                    logger=logger,
                 )
             )
-            continue
 
-        eml_path = _resolve_eml_path(vessel, vessel_id, root, eml_files)
-        if not eml_path or not eml_path.exists():
-            results.append(
-                EmailDeliveryResult(
-                    vessel_id=vessel_id,
-                    status="skipped",
-                    reason="Missing .eml draft for vessel.",
-                    transport=resolved.name,
-                    provider_message_id=None,
-                )
-            )
-            if logger:
-                logger.warning("Email delivery skipped: missing draft for %s", vessel_id)
-            continue
+    return results
 
-        result = _send_eml(resolved.transport, eml_path)
-        if result.success:
-            results.append(
-                EmailDeliveryResult(
-                    vessel_id=vessel_id,
-                    status="sent",
-                    reason=None,
-                    transport=resolved.name,
-                    provider_message_id=result.provider_message_id,
-                )
-            )
-            if logger:
-                logger.info("Email sent for %s", vessel_id)
-            continue
 
+async def deliver_emails_async(
+    run_paths: object,
+    vessels: Iterable[object],
+    delivery_plan: EmailDeliveryPlan | Mapping[str, object] | object,
+    logger: _LoggerLike | None,
+) -> DeliveryResults[EmailDeliveryResult]:
+    """Send existing .eml drafts over a pool of async SMTP sessions.
+
+    Up to ``async_concurrency`` sessions each log in once and are shared
+    by many sends, so handshakes overlap instead of running back to back.
+    Plans that do not qualify for the async path fall back to the
+    synchronous ``deliver_emails`` in a worker thread.
+    """
+
+    return _results(await _deliver_emails_async(run_paths, vessels, delivery_plan, logger))
+
+
+async def _deliver_emails_async(
+    run_paths: object,
+    vessels: Iterable[object],
+    delivery_plan: EmailDeliveryPlan | Mapping[str, object] | object,
+    logger: _LoggerLike | None,
+) -> list[EmailDeliveryResult]:
+
+    vessel_list = list(vessels)
+    skipped = _skip_without_intent(vessel_list, delivery_plan)
+    if skipped is not None:
+        return skipped
+
+    aiosmtplib = load_aiosmtplib()
+    if aiosmtplib is None or not _async_requested(delivery_plan):
+        return await asyncio.to_thread(
+            _deliver_emails, run_paths, vessel_list, delivery_plan, logger
+        )
+
+    config = _resolve_smtp_config(delivery_plan)
+    if not config:
+        return _skip_all(vessel_list, reason="SMTP configuration missing.", transport="smtp")
+
+    workers = min(
+        _coerce_positive_int(_get_option(delivery_plan, "async_concurrency", 1)) or 1,
+        max(len(vessel_list), 1),
+    )
+    try:
+        transports = [AsyncSmtpTransport(config, aiosmtplib) for _ in range(workers)]
+    except ValueError as exc:
+        return _skip_all(vessel_list, reason=str(exc), transport="smtp")
+
+    root = _resolve_run_root(run_paths)
+    eml_index = lazy_stem_index(
+        lambda: _list_eml_files(root),
+        lambda: [_coerce_vessel_id(vessel) for vessel in vessel_list],
+    )
+    retry = _resolve_retry_policy(delivery_plan)
+
+    # The queue of idle sessions bounds concurrency: a delivery waits until a
+    # session is free and never shares one with another in-flight send.
+    idle: asyncio.Queue[AsyncSmtpTransport] = asyncio.Queue()
+    for transport in transports:
+        idle.put_nowait(transport)
+
+    def _load_draft(vessel: object) -> tuple[str, Path, bytes] | EmailDeliveryResult:
+        located = _locate_draft(
+            vessel, root=root, eml_index=eml_index, transport_name="smtp", logger=logger
+        )
+        if isinstance(located, EmailDeliveryResult):
+            return located
+        vessel_id, eml_path = located
+        try:
+            eml_bytes = SmtpTransport.load(eml_path)
+        except Exception as exc:  # noqa: BLE001
+            return _delivery_result(vessel_id, _failed_result(exc), "smtp", logger)
+        return vessel_id, eml_path, eml_bytes
+
+    async def _deliver(vessel: object) -> EmailDeliveryResult:
+        # A session is claimed before the draft is read, so at most
+        # ``workers`` messages (attachments included) are held at once.
+        transport = await idle.get()
+        try:
+            # Locating the draft may walk the run tree to build the stem
+            # index, and loading it reads the file; both stay off the
+            # caller's loop. The index thunk is safe to share between threads.
+            loaded = await asyncio.to_thread(_load_draft, vessel)
+            if isinstance(loaded, EmailDeliveryResult):
+                return loaded
+            vessel_id, eml_path, eml_bytes = loaded
+            result = await _send_async(transport, eml_path, eml_bytes, retry, logger)
+            return _delivery_result(vessel_id, result, "smtp", logger)
+        finally:
+            idle.put_nowait(transport)
+
+    try:
+        outcomes = await asyncio.gather(
+            *(_deliver(vessel) for vessel in vessel_list), return_exceptions=True
+        )
+    finally:
+        for transport in transports:
+            await transport.close()
+
+    results: list[EmailDeliveryResult] = []
+    for vessel, outcome in zip(vessel_list, outcomes):
+        if isinstance(outcome, EmailDeliveryResult):
+            results.append(outcome)
+            continue
         results.append(
             EmailDeliveryResult(
-                vessel_id=vessel_id,
+                vessel_id=_coerce_vessel_id(vessel) or "UNKNOWN",
                 status="failed",
-                reason=result.error or "Email transport failed.",
-                transport=resolved.name,
-                provider_message_id=result.provider_message_id,
+                reason=f"{type(outcome).__name__}: {outcome}",
+                transport="smtp",
+                provider_message_id=None,
             )
         )
-        if logger:
-            logger.error("Email delivery failed for %s", vessel_id)
 
-    # TODO: Append email delivery outcomes to summary.json in append-only fashion.
     return results
 
 
-def _send_eml(transport: EmailTransport, eml_path: Path) -> TransportResult:
-    try:
-        return transport.send(eml_path)
-    except Exception as exc:  # noqa: BLE001
-        return TransportResult(
-            success=False,
+async def _send_async(
+    transport: AsyncSmtpTransport,
+    eml_path: Path,
+    eml_bytes: bytes,
+    retry: _RetryPolicy,
+    logger: _LoggerLike | None,
+) -> TransportResult:
+    attempt = 0
+    while True:
+        result = await transport.send_bytes(eml_bytes)
+        if result.success or not result.retryable or attempt >= retry.max_retries:
+            return result
+        if logger:
+            logger.warning(
+                "Transient email failure for %s (attempt %d): %s",
+                eml_path.name,
+                attempt + 1,
+                result.error,
+            )
+        await transport.close()
+        await asyncio.sleep(retry.delay(attempt))
+        attempt += 1
+
+
+def _deliver_concurrently(
+    transports: list[EmailTransport],
+    vessels: list[object],
+    *,
+    root: Path,
+    eml_index: Callable[[], StemIndex],
+    transport_name: str | None,
+    retry: _RetryPolicy,
+    logger: _LoggerLike | None,
+) -> list[EmailDeliveryResult]:
+    # Each worker owns one transport (and therefore one SMTP session) for its
+    # lifetime and pulls vessels from a shared queue. Results are stored by
+    # vessel position so the output order matches the input order.
+    jobs: queue.Queue[tuple[int, object]] = queue.Queue()
+    for index, vessel in enumerate(vessels):
+        jobs.put((index, vessel))
+
+    slots: list[EmailDeliveryResult | None] = [None] * len(vessels)
+
+    def _worker(worker_transport: EmailTransport) -> None:
+        with _transport_session(worker_transport) as transport:
+            while True:
+                try:
+                    index, vessel = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                slots[index] = _deliver_one(
+                    transport,
+                    vessel,
+                    root=root,
+                    eml_index=eml_index,
+                    transport_name=transport_name,
+                    retry=retry,
+                    logger=logger,
+                )
+
+    with ThreadPoolExecutor(max_workers=len(transports)) as executor:
+        for future in [executor.submit(_worker, transport) for transport in transports]:
+            future.result()
+
+    return [result for result in slots if result is not None]
+
+
+def _deliver_one(
+    transport: EmailTransport,
+    vessel: object,
+    *,
+    root: Path,
+    eml_index: Callable[[], StemIndex],
+    transport_name: str | None,
+    retry: _RetryPolicy,
+    logger: _LoggerLike | None,
+) -> EmailDeliveryResult:
+    located = _locate_draft(
+        vessel, root=root, eml_index=eml_index, transport_name=transport_name, logger=logger
+    )
+    if isinstance(located, EmailDeliveryResult):
+        return located
+    vessel_id, eml_path = located
+    result = _send_eml(transport, eml_path, retry, logger)
+    return _delivery_result(vessel_id, result, transport_name, logger)
+
+
+def _locate_draft(
+    vessel: object,
+    *,
+    root: Path,
+    eml_index: Callable[[], StemIndex],
+    transport_name: str | None,
+    logger: _LoggerLike | None,
+) -> tuple[str, Path] | EmailDeliveryResult:
+    get = _make_getter(vessel)
+    vessel_id = _coerce_vessel_id(vessel, get)
+    if not vessel_id:
+        return EmailDeliveryResult(
+            vessel_id="UNKNOWN",
+            status="skipped",
+            reason="Missing vessel identifier.",
+            transport=transport_name,
             provider_message_id=None,
-            error=f"{type(exc).__name__}: {exc}",
         )
 
+    eml_path = _resolve_eml_path(get, vessel_id, root, eml_index)
+    if not eml_path:
+        if logger:
+            logger.warning("Email delivery skipped: missing draft for %s", vessel_id)
+        return EmailDeliveryResult(
+            vessel_id=vessel_id,
+            status="skipped",
+            reason="Missing .eml draft for vessel.",
+            transport=transport_name,
+            provider_message_id=None,
+        )
+    return vessel_id, eml_path
+
+
+def _delivery_result(
+    vessel_id: str,
+    result: TransportResult,
+    transport_name: str | None,
+    logger: _LoggerLike | None,
+) -> EmailDeliveryResult:
+    if result.success:
+        if logger:
+            logger.info("Email sent for %s", vessel_id)
+        return EmailDeliveryResult(
+            vessel_id=vessel_id,
+            status="sent",
+            reason=None,
+            transport=transport_name,
+            provider_message_id=result.provider_message_id,
+        )
+
+    if logger:
+        logger.error("Email delivery failed for %s", vessel_id)
+    return EmailDeliveryResult(
+        vessel_id=vessel_id,
+        status="failed",
+        reason=result.error or "Email transport failed.",
+        transport=transport_name,
+        provider_message_id=result.provider_message_id,
+    )
+
+
+def _send_eml(
+    transport: EmailTransport,
+    eml_path: Path,
+    retry: _RetryPolicy | None = None,
+    logger: _LoggerLike | None = None,
+) -> TransportResult:
+    retry = retry or _RetryPolicy()
+    load = getattr(transport, "load", None)
+    send_bytes = getattr(transport, "send_bytes", None)
+    eml_bytes: bytes | None = None
+    if callable(load) and callable(send_bytes):
+        # Read once; retries resend the same buffer.
+        try:
+            eml_bytes = load(eml_path)
+        except Exception as exc:  # noqa: BLE001
+            return _failed_result(exc)
+
+    attempt = 0
+    while True:
+        try:
+            if eml_bytes is not None:
+                result = send_bytes(eml_bytes)  # type: ignore[misc]
+            else:
+                result = transport.send(eml_path)
+        except Exception as exc:  # noqa: BLE001
+            result = _failed_result(exc)
+        if result.success or not result.retryable or attempt >= retry.max_retries:
+            return result
+
+        if logger:
+            logger.warning(
+                "Transient email failure for %s (attempt %d): %s",
+                eml_path.name,
+                attempt + 1,
+                result.error,
+            )
+        # Drop the (possibly dead) session; the next send reconnects.
+        close = getattr(transport, "close", None)
+        if callable(close):
+            close()
+        time.sleep(retry.delay(attempt))
+        attempt += 1
+
+
+def _failed_result(exc: Exception) -> TransportResult:
+    return TransportResult(
+        success=False,
+        provider_message_id=None,
+        error=f"{type(exc).__name__}: {exc}",
+        retryable=is_transient_error(exc),
+    )
+
+
+def _transport_session(
+    transport: EmailTransport,
+) -> AbstractContextManager[EmailTransport]:
+    # Transports that manage a connection (e.g. SMTP) keep one session open
+    # for the whole batch; plain transports are used as-is.
+    if hasattr(transport, "__enter__") and hasattr(transport, "__exit__"):
+        return transport  # type: ignore[return-value]
+    return nullcontext(transport)
+
 
 def _resolve_transport(plan: object) -> _ResolvedTransport:
     name = _get_option(plan, "transport", None)
     if not name:
         return _ResolvedTransport(None, None, "No transport selected.")
 
-    normalized = str(name).strip().lower()
-    if normalized == "smtp":
-        config = _coerce_smtp_config(_get_option(plan, "transport_config", None))
-        if not config:
-            config = _coerce_smtp_config(_get_option(plan, "smtp_config", None))
-        if not config:
-            return _ResolvedTransport(None, "smtp", "SMTP configuration missing.")
-        return _ResolvedTransport(SmtpTransport(config), "smtp", None)
+    normalized = _normalize_transport_name(name)
+    factory = _TRANSPORT_FACTORIES.get(normalized)
+    if factory is None:
+        return _ResolvedTransport(None, normalized, "Unsupported transport selected.")
+    return factory(plan)
+
 
-    if normalized in {"nicemail", "nice"}:
-        # TODO: Wire Nicemail transport when available.
-        return _ResolvedTransport(None, "nicemail", "Nicemail transport not implemented.")
+def _normalize_transport_name(name: object) -> str:
+    return str(name or "").strip().lower()
 
-    return _ResolvedTransport(None, normalized, "Unsupported transport selected.")
+
+def _build_smtp(plan: object) -> _ResolvedTransport:
+    config = _resolve_smtp_config(plan)
+    if not config:
+        return _ResolvedTransport(None, "smtp", "SMTP configuration missing.")
+    try:
+        transport = SmtpTransport(config)
+    except ValueError as exc:
+        return _ResolvedTransport(None, "smtp", str(exc))
+    return _ResolvedTransport(transport, "smtp", None)
+
+
+def _build_nicemail(plan: object) -> _ResolvedTransport:
+    # TODO: Wire Nicemail transport when available.
+    return _ResolvedTransport(None, "nicemail", "Nicemail transport not implemented.")
+
+
+# Normalized transport name -> factory. New transports register here.
+_TRANSPORT_FACTORIES: dict[str, Callable[[object], _ResolvedTransport]] = {
+    "smtp": _build_smtp,
+    "nicemail": _build_nicemail,
+    "nice": _build_nicemail,
+}
+
+
+def _resolve_smtp_config(plan: object) -> SmtpConfig | None:
+    config = _coerce_smtp_config(_get_option(plan, "transport_config", None))
+    if not config:
+        config = _coerce_smtp_config(_get_option(plan, "smtp_config", None))
+    # The plan's per-session cap, when set, overrides the config's, so the
+    # transport is the only place sends are counted and sessions recycled.
+    cap = _coerce_positive_int(_get_option(plan, "max_per_connection", None))
+    if config and cap:
+        config = replace(config, messages_per_connection=cap)
+    return config
+
+
+def _async_requested(plan: object) -> bool:
+    workers = _coerce_positive_int(_get_option(plan, "async_concurrency", 1)) or 1
+    if workers < 2:
+        return False
+    if _normalize_transport_name(_get_option(plan, "transport", None)) != "smtp":
+        return False
+    return load_aiosmtplib() is not None
+
+
+def _resolve_retry_policy(plan: object) -> _RetryPolicy:
+    defaults = _RetryPolicy()
+    return _RetryPolicy(
+        max_retries=_coerce_positive_int(_get_option(plan, "max_retries", 0)) or 0,
+        base_seconds=_coerce_seconds(
+            _get_option(plan, "retry_base_seconds", None), defaults.base_seconds
+        ),
+        cap_seconds=_coerce_seconds(
+            _get_option(plan, "retry_cap_seconds", None), defaults.cap_seconds
+        ),
+    )
 
 
 def _coerce_smtp_config(value: object) -> SmtpConfig | None:
@@ -168,12 +561,48 @@ def _coerce_smtp_config(value: object) -> SmtpConfig | None:
     return None
 
 
+def _skip_without_intent(
+    vessels: list[object], plan: object
+) -> list[EmailDeliveryResult] | None:
+    # Sending is never implicit: without send_now and confirm_send every
+    # vessel is skipped before any transport is resolved.
+    send_now = bool(_get_option(plan, "send_now", False))
+    confirm_send = bool(_get_option(plan, "confirm_send", False))
+
+    if not send_now:
+        return _skip_all(
+            vessels,
+            reason="Email delivery disabled by user.",
+            transport=_get_option(plan, "transport", None),
+        )
+    if not confirm_send:
+        return _skip_all(
+            vessels,
+            reason="Email delivery not confirmed.",
+            transport=_get_option(plan, "transport", None),
+        )
+    return None
+
+
+def _results(results: list[EmailDeliveryResult]) -> DeliveryResults[EmailDeliveryResult]:
+    # Every delivery path, sync or async, returns to callers through here.
+    # TODO: Append email delivery outcomes to summary.json in append-only fashion.
+    return DeliveryResults(results, key=_result_vessel_id)
+
+
+def _result_vessel_id(result: EmailDeliveryResult) -> str:
+    return result.vessel_id
+
+
 def _skip_all(
     vessels: Iterable[object], *, reason: str, transport: str | None
 ) -> list[EmailDeliveryResult]:
+    # Built directly rather than via dataclasses.replace on a template:
+    # replace() re-runs the frozen __init__ and adds a field scan on top.
     return [
         EmailDeliveryResult(
-            vessel_id=_coerce_vessel_id(vessel) or "UNKNOWN",
+            vessel_id=(vessel.strip() if isinstance(vessel, str) else _coerce_vessel_id(vessel))
+            or "UNKNOWN",
             status="skipped",
             reason=reason,
             transport=transport,
@@ -195,36 +624,28 @@ def _resolve_run_root(run_paths: object) -> Path:
 
 
 def _list_eml_files(root: Path) -> list[Path]:
-    if not root.exists():
-        return []
-    return sorted(path for path in root.rglob("*.eml") if path.is_file())
+    return iter_files_with_suffix(root, ".eml")
 
 
 def _resolve_eml_path(
-    vessel: object,
+    get: _Getter,
     vessel_id: str,
     root: Path,
-    eml_files: list[Path],
+    eml_index: Callable[[], StemIndex],
 ) -> Path | None:
-    explicit = _extract_eml_path(vessel, root)
+    # Only returns paths known to exist: explicit paths are checked here
+    # and index hits come from the directory walk, so callers skip a
+    # second stat.
+    explicit = _extract_eml_path(get, root)
     if explicit and explicit.exists():
         return explicit
 
-    normalized = vessel_id.strip().lower()
-    exact = [path for path in eml_files if path.stem.lower() == normalized]
-    if exact:
-        return exact[0]
-
-    contains = [path for path in eml_files if normalized and normalized in path.stem.lower()]
-    if not contains:
-        return None
+    return eml_index().find(vessel_id)
 
-    return sorted(contains, key=_path_sort_key)[0]
 
-
-def _extract_eml_path(vessel: object, root: Path) -> Path | None:
+def _extract_eml_path(get: _Getter, root: Path) -> Path | None:
     for key in ("eml_path", "draft_path", "eml_file", "eml_filename"):
-        value = _get_option(vessel, key, None)
+        value = get(key, None)
         if not value:
             continue
         path = Path(str(value))
@@ -234,14 +655,12 @@ def _extract_eml_path(vessel: object, root: Path) -> Path | None:
     return None
 
 
-def _coerce_vessel_id(vessel: object) -> str:
+def _coerce_vessel_id(vessel: object, get: _Getter | None = None) -> str:
     if isinstance(vessel, str):
         return vessel.strip()
-    for key in ("ship_id", "vessel_id", "id"):
-        value = _get_option(vessel, key, None)
-        if value:
-            return str(value).strip()
-    return ""
+    get = get or _make_getter(vessel)
+    value = get("ship_id", None) or get("vessel_id", None) or get("id", None)
+    return str(value).strip() if value else ""
 
 
 def _get_option(container: object, name: str, default: object) -> object:
@@ -249,10 +668,37 @@ def _get_option(container: object, name: str, default: object) -> object:
         return default
     if isinstance(container, Mapping):
         return container.get(name, default)
-    if hasattr(container, name):
-        return getattr(container, name)
+    return getattr(container, name, default)
+
+
+def _make_getter(container: object) -> _Getter:
+    # Resolve the container shape once per vessel instead of per lookup.
+    if container is None:
+        return _default_getter
+    if isinstance(container, Mapping):
+        return container.get
+    return lambda name, default: getattr(container, name, default)
+
+
+def _default_getter(name: str, default: object) -> object:
     return default
 
 
-def _path_sort_key(path: Path) -> tuple[int, str]:
-    return (len(path.stem), str(path))
+def _coerce_positive_int(value: object) -> int | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _coerce_seconds(value: object, default: float) -> float:
+    if value is None or isinstance(value, bool):
+        return default
+    try:
+        seconds = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+    return seconds if seconds >= 0 else default
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmailDeliveryPlan:
     """User-directed delivery intent for a single run."""
 
@@ -13,9 +13,15 @@ class EmailDeliveryPlan:
     confirm_send: bool
     transport: str | None
     transport_config: object | None = None
+    concurrency: int = 1
+    max_per_connection: int | None = None
+    max_retries: int = 0
+    retry_base_seconds: float = 0.5
+    retry_cap_seconds: float = 30.0
+    async_concurrency: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmailDeliveryResult:
     """Per-vessel email delivery outcome."""
 
@@ -1,6 +1,15 @@
 """Transport implementations for email delivery."""
 
+from .async_smtp import AsyncSmtpTransport, load_aiosmtplib
 from .base import EmailTransport, TransportResult
-from .smtp import SmtpConfig, SmtpTransport
+from .smtp import SmtpConfig, SmtpTransport, is_transient_error
 
-__all__ = ["EmailTransport", "TransportResult", "SmtpConfig", "SmtpTransport"]
+__all__ = [
+    "AsyncSmtpTransport",
+    "EmailTransport",
+    "TransportResult",
+    "SmtpConfig",
+    "SmtpTransport",
+    "is_transient_error",
+    "load_aiosmtplib",
+]
@@ -0,0 +1,106 @@
+"""Asynchronous SMTP transport for high-fanout Phase 7B delivery.
+
+Built on the optional ``aiosmtplib`` package, which is imported lazily so
+the synchronous transport keeps working without it. Drafts are still sent
+as opaque bytes.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import TransportResult
+from .smtp import TRANSIENT_SMTP_CODES, SmtpConfig, is_transient_error
+
+
+def load_aiosmtplib() -> Any | None:
+    """Return the aiosmtplib module, or None when it is not installed."""
+
+    try:
+        import aiosmtplib  # type: ignore[import-not-found]
+    except Exception:
+        return None
+    return aiosmtplib
+
+
+class AsyncSmtpTransport:
+    """Async SMTP session that sends many drafts over one login."""
+
+    name = "smtp"
+
+    def __init__(self, config: SmtpConfig, aiosmtplib: Any) -> None:
+        if not config.envelope_from:
+            raise ValueError("Missing SMTP envelope_from configuration.")
+        if not config.envelope_to:
+            raise ValueError("Missing SMTP envelope_to configuration.")
+        self._config = config
+        self._aiosmtplib = aiosmtplib
+        self._envelope_from = config.envelope_from
+        self._envelope_to = tuple(config.envelope_to)
+        self._client: Any | None = None
+        self._sent_count = 0
+
+    async def close(self) -> None:
+        """Quit the SMTP session if one is open."""
+
+        client = self._client
+        self._client = None
+        if client is None:
+            return
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+    async def send_bytes(self, eml_bytes: bytes) -> TransportResult:
+        try:
+            client = await self._live_client()
+            errors, _ = await client.sendmail(self._envelope_from, self._envelope_to, eml_bytes)
+            if errors:
+                return TransportResult(
+                    success=False,
+                    provider_message_id=None,
+                    error=f"SMTP send errors: {errors}",
+                )
+            return TransportResult(success=True, provider_message_id=None, error=None)
+        except Exception as exc:  # noqa: BLE001
+            return TransportResult(
+                success=False,
+                provider_message_id=None,
+                error=f"{type(exc).__name__}: {exc}",
+                retryable=self._is_transient(exc),
+            )
+
+    async def _live_client(self) -> Any:
+        cap = self._config.messages_per_connection
+        if self._client is not None and cap and self._sent_count >= cap:
+            await self.close()
+        if self._client is None:
+            self._client = await self._connect()
+            self._sent_count = 0
+        self._sent_count += 1
+        return self._client
+
+    async def _connect(self) -> Any:
+        config = self._config
+        client = self._aiosmtplib.SMTP(
+            hostname=config.host,
+            port=config.port,
+            timeout=config.timeout_seconds,
+            use_tls=config.use_ssl,
+            start_tls=config.use_tls and not config.use_ssl,
+        )
+        await client.connect()
+        if config.username:
+            await client.login(config.username, config.password or "")
+        return client
+
+    def _is_transient(self, exc: BaseException) -> bool:
+        module = self._aiosmtplib
+        disconnected = getattr(module, "SMTPServerDisconnected", None)
+        if disconnected is not None and isinstance(exc, disconnected):
+            return True
+        response_error = getattr(module, "SMTPResponseException", None)
+        if response_error is not None and isinstance(exc, response_error):
+            return getattr(exc, "code", None) in TRANSIENT_SMTP_CODES
+        return is_transient_error(exc)
@@ -7,20 +7,23 @@ from pathlib import Path
 from typing import Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransportResult:
     """Result of a transport send attempt."""
 
     success: bool
     provider_message_id: str | None
     error: str | None
+    retryable: bool = False
 
 
 class EmailTransport(Protocol):
     """Minimal transport interface.
 
     Implementations must treat .eml files as opaque bytes and never modify
-    or parse their contents.
+    or parse their contents. Transports that hold a connection may also
+    implement the context manager protocol; the dispatcher then keeps one
+    session open for the whole batch.
     """
 
     name: str
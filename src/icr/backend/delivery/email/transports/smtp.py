@@ -6,13 +6,18 @@ This module sends pre-rendered .eml drafts as opaque bytes.
 from __future__ import annotations
 
 import smtplib
+import socket
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
 from .base import TransportResult
 
+# Reply codes that signal a temporary condition worth retrying.
+TRANSIENT_SMTP_CODES = frozenset({421, 450, 451, 452, 454})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SmtpConfig:
     """SMTP configuration for sending draft emails."""
 
@@ -25,52 +30,93 @@ class SmtpConfig:
     timeout_seconds: int = 30
     envelope_from: str | None = None
     envelope_to: tuple[str, ...] = ()
+    messages_per_connection: int | None = 100
 
 
 class SmtpTransport:
-    """SMTP transport that sends .eml files without modification."""
+    """SMTP transport that sends .eml files without modification.
+
+    Used as a context manager, a single SMTP session (connect, STARTTLS,
+    login) is shared by every ``send`` inside the block and recycled after
+    ``messages_per_connection`` messages. Outside a session, each ``send``
+    connects and quits on its own. An instance may be shared between threads:
+    sends on the shared session are serialized so SMTP commands from
+    different messages never interleave on one socket.
+    """
 
     name = "smtp"
 
     def __init__(self, config: SmtpConfig) -> None:
+        if not config.envelope_from:
+            raise ValueError("Missing SMTP envelope_from configuration.")
+        if not config.envelope_to:
+            raise ValueError("Missing SMTP envelope_to configuration.")
         self._config = config
+        self._envelope_from = config.envelope_from
+        self._envelope_to = tuple(config.envelope_to)
+        self._server: smtplib.SMTP | None = None
+        self._in_session = False
+        self._sent_count = 0
+        # Re-entrant: send_bytes may recycle the session via close()/open().
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> SmtpTransport:
+        self._in_session = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._in_session = False
+        self.close()
+
+    def open(self) -> smtplib.SMTP:
+        """Open (or return the already open) SMTP session."""
+
+        with self._lock:
+            if self._server is None:
+                self._server = self._connect()
+                self._sent_count = 0
+            return self._server
+
+    def close(self) -> None:
+        """Close the SMTP session if one is open."""
+
+        with self._lock:
+            server = self._server
+            self._server = None
+        if server is not None:
+            _quit(server)
 
     def send(self, eml_path: Path) -> TransportResult:
         try:
-            eml_bytes = eml_path.read_bytes()
+            eml_bytes = self.load(eml_path)
         except Exception as exc:  # noqa: BLE001
             return TransportResult(
                 success=False,
                 provider_message_id=None,
                 error=f"{type(exc).__name__}: {exc}",
             )
+        return self.send_bytes(eml_bytes)
 
-        if not self._config.envelope_from:
-            return TransportResult(
-                success=False,
-                provider_message_id=None,
-                error="Missing SMTP envelope_from configuration.",
-            )
-        if not self._config.envelope_to:
-            return TransportResult(
-                success=False,
-                provider_message_id=None,
-                error="Missing SMTP envelope_to configuration.",
-            )
+    @staticmethod
+    def load(eml_path: Path) -> bytes:
+        """Read a draft once so retries can resend the same buffer."""
+
+        with open(eml_path, "rb", buffering=0) as handle:
+            return handle.readall()
+
+    def send_bytes(self, eml_bytes: bytes) -> TransportResult:
+        """Send already loaded .eml bytes, reusing an open session."""
 
         try:
-            server = self._connect()
-            try:
-                response = server.sendmail(
-                    self._config.envelope_from,
-                    list(self._config.envelope_to),
-                    eml_bytes,
-                )
-            finally:
+            if self._in_session or self._server is not None:
+                with self._lock:
+                    response = self._transmit(self._live_server(), eml_bytes)
+            else:
+                server = self._connect()
                 try:
-                    server.quit()
-                except Exception:
-                    server.close()
+                    response = self._transmit(server, eml_bytes)
+                finally:
+                    _quit(server)
 
             if response:
                 return TransportResult(
@@ -89,8 +135,32 @@ class SmtpTransport:
                 success=False,
                 provider_message_id=None,
                 error=f"{type(exc).__name__}: {exc}",
+                retryable=is_transient_error(exc),
             )
 
+    def _transmit(self, server: smtplib.SMTP, eml_bytes: bytes) -> dict[str, object]:
+        return server.sendmail(self._envelope_from, self._envelope_to, eml_bytes)
+
+    def _live_server(self) -> smtplib.SMTP:
+        server = self._server
+        cap = self._config.messages_per_connection
+        if server is not None and cap and self._sent_count >= cap:
+            # Providers throttle or drop long-lived sessions; start fresh.
+            self.close()
+            server = None
+        if server is not None:
+            try:
+                code, _ = server.noop()
+            except smtplib.SMTPServerDisconnected:
+                code = None
+            if code is not None and 200 <= code < 300:
+                self._sent_count += 1
+                return server
+            self.close()
+        server = self.open()
+        self._sent_count += 1
+        return server
+
     def _connect(self) -> smtplib.SMTP:
         config = self._config
         if config.use_ssl:
@@ -111,3 +181,24 @@ class SmtpTransport:
         if config.username:
             server.login(config.username, config.password or "")
         return server
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True when a send failure is likely to succeed on retry."""
+
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code in TRANSIENT_SMTP_CODES
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return bool(exc.recipients) and all(
+            code in TRANSIENT_SMTP_CODES for code, _ in exc.recipients.values()
+        )
+    return isinstance(exc, (socket.timeout, ConnectionResetError))
+
+
+def _quit(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        server.close()
@@ -6,13 +6,21 @@ run workspace without mutating report content.
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, Protocol
+from typing import Callable, Iterable, Mapping, Protocol
 
+from .._fsutil import iter_files_with_suffix
+from .._stem_index import StemIndex, lazy_stem_index
+from ..common import DeliveryResults
 from .engine import PdfRenderer, choose_renderer
 
 
+_Getter = Callable[[str, object], object]
+
+
 class _LoggerLike(Protocol):
     def info(self, msg: str, *args: object, **kwargs: object) -> None: ...
 
@@ -23,7 +31,7 @@ class _LoggerLike(Protocol):
     def exception(self, msg: str, *args: object, **kwargs: object) -> None: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PdfResult:
     """Per-vessel PDF generation outcome."""
 
@@ -40,8 +48,23 @@ def generate_pdfs(
     vessels: Iterable[object],
     options: object,
     logger: _LoggerLike | None,
+) -> DeliveryResults[PdfResult]:
+    """Generate PDFs from existing HTML reports without altering HTML.
+
+    Results keep vessel order and can also be looked up by vessel id.
+    """
+
+    return DeliveryResults(
+        _generate_pdfs(run_paths, vessels, options, logger), key=_result_vessel_id
+    )
+
+
+def _generate_pdfs(
+    run_paths: object,
+    vessels: Iterable[object],
+    options: object,
+    logger: _LoggerLike | None,
 ) -> list[PdfResult]:
-    """Generate PDFs from existing HTML reports without altering HTML."""
 
     pdf_enabled = bool(_get_option(options, "pdf_enabled", False))
     renderer_preference = _get_option(options, "pdf_renderer", None) or _get_option(
@@ -49,28 +72,29 @@ def generate_pdfs(
     )
 
     if not pdf_enabled:
-        return [
-            PdfResult(
-                vessel_id=_coerce_vessel_id(vessel) or "UNKNOWN",
-                status="skipped",
-                pdf_path=None,
-                reason="PDF generation disabled by user.",
-                renderer_name=None,
-                renderer_version=None,
-            )
-            for vessel in vessels
-        ]
+        return _skip_all(vessels, reason="PDF generation disabled by user.")
 
     renderer = choose_renderer(renderer_preference)
+    if renderer is None:
+        # Nothing can be rendered, so skip report discovery entirely.
+        if logger:
+            logger.warning("PDF skipped: no PDF renderer available")
+        return _skip_all(vessels, reason="No PDF renderer available.")
     renderer_name, renderer_version = _renderer_metadata(renderer)
 
     reports_root = _resolve_reports_root(run_paths)
-    html_files = _list_html_files(reports_root)
+    vessel_list = list(vessels)
+    html_index = lazy_stem_index(
+        lambda: _list_html_files(reports_root),
+        lambda: [_coerce_vessel_id(vessel) for vessel in vessel_list],
+    )
 
-    results: list[PdfResult] = []
+    results: list[PdfResult | None] = []
+    jobs: list[tuple[int, str, Path, Path]] = []
 
-    for vessel in vessels:
-        vessel_id = _coerce_vessel_id(vessel)
+    for vessel in vessel_list:
+        get = _make_getter(vessel)
+        vessel_id = _coerce_vessel_id(vessel, get)
         if not vessel_id:
             results.append(
                 PdfResult(
@@ -84,8 +108,8 @@ def generate_pdfs(
             )
             continue
 
-        html_path = _resolve_html_report(vessel, vessel_id, reports_root, html_files)
-        if not html_path or not html_path.exists():
+        html_path = _resolve_html_report(get, vessel_id, reports_root, html_index)
+        if not html_path:
             results.append(
                 PdfResult(
                     vessel_id=vessel_id,
@@ -100,56 +124,124 @@ def generate_pdfs(
                 logger.warning("PDF skipped: missing HTML report for %s", vessel_id)
             continue
 
-        if renderer is None:
-            results.append(
-                PdfResult(
-                    vessel_id=vessel_id,
-                    status="skipped",
-                    pdf_path=None,
-                    reason="No PDF renderer available.",
-                    renderer_name=None,
-                    renderer_version=None,
-                )
-            )
-            if logger:
-                logger.warning("PDF skipped: renderer unavailable for %s", vessel_id)
-            continue
-
-        pdf_path = _pdf_output_path(html_path)
+        jobs.append((len(results), vessel_id, html_path, _pdf_output_path(html_path)))
+        results.append(None)
 
-        try:
-            renderer.render(html_path, pdf_path)
-        except Exception as exc:  # noqa: BLE001 - per-vessel failure only
-            reason = _format_exception_reason(exc)
-            results.append(
-                PdfResult(
-                    vessel_id=vessel_id,
-                    status="failed",
-                    pdf_path=None,
-                    reason=reason,
-                    renderer_name=renderer_name,
-                    renderer_version=renderer_version,
-                )
-            )
-            if logger:
-                logger.exception("PDF generation failed for %s", vessel_id)
-            continue
+    _prepare_output_dirs(jobs)
+    concurrency = _coerce_positive_int(_get_option(options, "pdf_concurrency", 1)) or 1
+    if concurrency > 1 and len(jobs) > 1:
+        errors = _render_in_processes(renderer_name, jobs, concurrency)
+    else:
+        errors = [_render_safely(renderer, html_path, pdf_path) for _, _, html_path, pdf_path in jobs]
 
-        results.append(
-            PdfResult(
+    for (index, vessel_id, _, pdf_path), error in zip(jobs, errors):
+        if error is not None:
+            results[index] = PdfResult(
                 vessel_id=vessel_id,
-                status="generated",
-                pdf_path=pdf_path,
-                reason=None,
+                status="failed",
+                pdf_path=None,
+                reason=_format_exception_reason(error),
                 renderer_name=renderer_name,
                 renderer_version=renderer_version,
             )
+            if logger:
+                logger.error("PDF generation failed for %s", vessel_id, exc_info=error)
+            continue
+
+        results[index] = PdfResult(
+            vessel_id=vessel_id,
+            status="generated",
+            pdf_path=pdf_path,
+            reason=None,
+            renderer_name=renderer_name,
+            renderer_version=renderer_version,
         )
         if logger:
             logger.info("PDF generated for %s", vessel_id)
 
     # TODO: Append PDF results to summary.json in an append-only manner.
-    return results
+    return [result for result in results if result is not None]
+
+
+def _result_vessel_id(result: PdfResult) -> str:
+    return result.vessel_id
+
+
+def _prepare_output_dirs(jobs: list[tuple[int, str, Path, Path]]) -> None:
+    # Every vessel usually shares one pdf directory, so create each distinct
+    # directory once up front instead of once per render (and per worker).
+    # A directory that cannot be created is left for the render to report.
+    for pdf_dir in {pdf_path.parent for _, _, _, pdf_path in jobs}:
+        try:
+            pdf_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            continue
+
+
+def _render_safely(renderer: PdfRenderer, html_path: Path, pdf_path: Path) -> Exception | None:
+    try:
+        renderer.render(html_path, pdf_path)
+    except Exception as exc:  # noqa: BLE001 - per-vessel failure only
+        return exc
+    return None
+
+
+def _render_in_processes(
+    renderer_name: str | None,
+    jobs: list[tuple[int, str, Path, Path]],
+    concurrency: int,
+) -> list[Exception | None]:
+    # Rendering is CPU-bound, so it runs in worker processes. Each worker
+    # picks its renderer by name instead of receiving a pickled instance.
+    # A worker that dies breaks the whole pool: every vessel not yet
+    # rendered fails with BrokenProcessPool. The same goes for a pool that
+    # breaks or cannot start a worker on submit, so nothing escapes
+    # generate_pdfs; the vessels are not retried in this process, where a
+    # crashing render would take the run down with it.
+    errors: list[Exception | None] = []
+    with ProcessPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+        futures: list[Future[None]] = []
+        for _, _, html_path, pdf_path in jobs:
+            try:
+                futures.append(executor.submit(_render_worker, renderer_name, html_path, pdf_path))
+            except (BrokenProcessPool, OSError) as exc:
+                futures.extend(_failed_future(exc) for _ in range(len(jobs) - len(futures)))
+                break
+        for future in futures:
+            try:
+                future.result()
+            except Exception as exc:  # noqa: BLE001 - per-vessel failure only
+                errors.append(exc)
+            else:
+                errors.append(None)
+    return errors
+
+
+def _failed_future(error: Exception) -> Future[None]:
+    future: Future[None] = Future()
+    future.set_exception(error)
+    return future
+
+
+def _render_worker(renderer_name: str | None, html_path: Path, pdf_path: Path) -> None:
+    renderer = choose_renderer(renderer_name)
+    if renderer is None:
+        raise RuntimeError("No PDF renderer available in worker process.")
+    renderer.render(html_path, pdf_path)
+
+
+def _skip_all(vessels: Iterable[object], *, reason: str) -> list[PdfResult]:
+    return [
+        PdfResult(
+            vessel_id=_coerce_vessel_id(vessel) or "UNKNOWN",
+            status="skipped",
+            pdf_path=None,
+            reason=reason,
+            renderer_name=None,
+            renderer_version=None,
+        )
+        for vessel in vessels
+    ]
 
 
 def _resolve_reports_root(run_paths: object) -> Path:
@@ -164,34 +256,26 @@ def _resolve_reports_root(run_paths: object) -> Path:
 
 
 def _list_html_files(reports_root: Path) -> list[Path]:
-    if not reports_root.exists():
-        return []
-    return sorted(path for path in reports_root.rglob("*.html") if path.is_file())
+    return iter_files_with_suffix(reports_root, ".html")
 
 
 def _resolve_html_report(
-    vessel: object,
+    get: _Getter,
     vessel_id: str,
     reports_root: Path,
-    html_files: list[Path],
+    html_index: Callable[[], StemIndex],
 ) -> Path | None:
-    explicit = _extract_report_path(vessel, reports_root)
+    # Only returns paths known to exist: explicit paths are checked here
+    # and index hits come from the directory walk, so callers skip a
+    # second stat.
+    explicit = _extract_report_path(get, reports_root)
     if explicit and explicit.exists():
         return explicit
 
-    normalized = vessel_id.strip().lower()
-    exact = [path for path in html_files if path.stem.lower() == normalized]
-    if exact:
-        return exact[0]
+    return html_index().find(vessel_id)
 
-    contains = [path for path in html_files if normalized and normalized in path.stem.lower()]
-    if not contains:
-        return None
-
-    return sorted(contains, key=_path_sort_key)[0]
 
-
-def _extract_report_path(vessel: object, reports_root: Path) -> Path | None:
+def _extract_report_path(get: _Getter, reports_root: Path) -> Path | None:
     for key in (
         "report_path",
         "report_file",
@@ -199,7 +283,7 @@ def _extract_report_path(vessel: object, reports_root: Path) -> Path | None:
         "html_report",
         "html_report_path",
     ):
-        value = _get_option(vessel, key, None)
+        value = get(key, None)
         if not value:
             continue
         path = Path(str(value))
@@ -217,22 +301,18 @@ def _pdf_output_path(html_path: Path) -> Path:
     return pdf_dir / f"{html_path.stem}.pdf"
 
 
-def _renderer_metadata(renderer: PdfRenderer | None) -> tuple[str | None, str | None]:
-    if renderer is None:
-        return None, None
+def _renderer_metadata(renderer: PdfRenderer) -> tuple[str | None, str | None]:
     name = getattr(renderer, "name", None)
     version = getattr(renderer, "version", None)
     return name, version
 
 
-def _coerce_vessel_id(vessel: object) -> str:
+def _coerce_vessel_id(vessel: object, get: _Getter | None = None) -> str:
     if isinstance(vessel, str):
         return vessel.strip()
-    for key in ("ship_id", "vessel_id", "id"):
-        value = _get_option(vessel, key, None)
-        if value:
-            return str(value).strip()
-    return ""
+    get = get or _make_getter(vessel)
+    value = get("ship_id", None) or get("vessel_id", None) or get("id", None)
+    return str(value).strip() if value else ""
 
 
 def _get_option(container: object, name: str, default: object) -> object:
@@ -240,13 +320,30 @@ def _get_option(container: object, name: str, default: object) -> object:
         return default
     if isinstance(container, Mapping):
         return container.get(name, default)
-    if hasattr(container, name):
-        return getattr(container, name)
+    return getattr(container, name, default)
+
+
+def _make_getter(container: object) -> _Getter:
+    # Resolve the container shape once per vessel instead of per lookup.
+    if container is None:
+        return _default_getter
+    if isinstance(container, Mapping):
+        return container.get
+    return lambda name, default: getattr(container, name, default)
+
+
+def _default_getter(name: str, default: object) -> object:
     return default
 
 
-def _path_sort_key(path: Path) -> tuple[int, str]:
-    return (len(path.stem), str(path))
+def _coerce_positive_int(value: object) -> int | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
 
 
 def _format_exception_reason(exc: Exception) -> str:
@@ -6,15 +6,22 @@
 - Classifying inventory discrepancies into issue rows
 """
 
-from .compare import compare_inventory, normalize_edition
+from .compare import compare_inventory, get_inventory_diff, normalize_edition
 from .models import IssueRow, IssueType
-from .queries import get_ams_vessels, get_onboard_inventory, get_reference_inventory
+from .queries import (
+    ensure_query_indexes,
+    get_ams_vessels,
+    get_onboard_inventory,
+    get_reference_inventory,
+)
 
 __all__ = [
     "IssueRow",
     "IssueType",
     "compare_inventory",
+    "get_inventory_diff",
     "normalize_edition",
+    "ensure_query_indexes",
     "get_ams_vessels",
     "get_onboard_inventory",
     "get_reference_inventory",
@@ -1,93 +1,177 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Mapping, Optional
+import re
+import sqlite3
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
 
 from .models import IssueRow, IssueType
+from .queries import (
+    ONBOARD_EDITION,
+    ONBOARD_ITEM,
+    REFERENCE_EDITION,
+    REFERENCE_ITEM,
+    iter_inventory_join,
+)
+
+
+# Matches anything whitespace collapsing would change: leading/trailing
+# whitespace, runs of whitespace, or whitespace other than a plain space.
+_UNNORMALIZED_WS = re.compile(r"^\s|\s$|\s\s|[^\S ]")
+
+
+# (raw onboard item, onboard edition, matched (raw, normalized) current edition)
+_Match = tuple[Any, Optional[str], Optional[tuple[Optional[str], Optional[str]]]]
 
 
 def normalize_edition(edition: Optional[str], *, case_fold: bool) -> Optional[str]:
     if edition is None:
         return None
     text = edition if isinstance(edition, str) else str(edition)
-    normalized = " ".join(text.strip().split())
+    # Most editions are already single-spaced; one regex scan detects that
+    # and skips the split/join allocations.
+    if _UNNORMALIZED_WS.search(text) is not None:
+        text = " ".join(text.split())
     if case_fold:
-        normalized = normalized.casefold()
-    return normalized
+        text = text.casefold()
+    return text
 
 
 def compare_inventory(
     ship_id: str,
-    onboard_items: Iterable[Mapping[str, Any]],
-    reference_items: Iterable[Mapping[str, Any]],
+    onboard_items: Iterable[Mapping[str, Any] | Sequence[Any]],
+    reference_items: Iterable[Mapping[str, Any] | Sequence[Any]],
     *,
     case_fold_items: bool = True,
     case_fold_editions: bool = False,
     deduplicate: bool = True,
 ) -> list[IssueRow]:
-    reference_by_item: dict[str, Mapping[str, Any]] = {}
+    # Item key -> (raw current edition, normalized current edition), built
+    # once so onboard rows never re-extract or re-normalize reference data.
+    reference_index: dict[str, tuple[Optional[str], Optional[str]]] = {}
     for record in reference_items:
-        item_key = _normalize_item(record.get("item"), case_fold=case_fold_items)
-        if not item_key:
+        if isinstance(record, Mapping):
+            raw_item = record.get("item")
+            current_edition = _extract_edition(
+                record, prefer_keys=("current_edition", "edition")
+            )
+        else:
+            raw_item = record[REFERENCE_ITEM]
+            current_edition = _coerce_edition(record[REFERENCE_EDITION])
+        item_key = _normalize_item(raw_item, case_fold=case_fold_items)
+        if not item_key or item_key in reference_index:
             continue
-        if item_key not in reference_by_item:
-            reference_by_item[item_key] = record
+        reference_index[item_key] = (
+            current_edition,
+            normalize_edition(current_edition, case_fold=case_fold_editions),
+        )
+
+    def _matches() -> Iterator[_Match]:
+        for record in onboard_items:
+            if isinstance(record, Mapping):
+                raw_item = record.get("item")
+                onboard_edition = _extract_edition(
+                    record, prefer_keys=("onboard_edition", "edition")
+                )
+            else:
+                raw_item = record[ONBOARD_ITEM]
+                onboard_edition = _coerce_edition(record[ONBOARD_EDITION])
+            item_key = _normalize_item(raw_item, case_fold=case_fold_items)
+            yield raw_item, onboard_edition, reference_index.get(item_key)
+
+    return _classify(
+        ship_id,
+        _matches(),
+        case_fold_editions=case_fold_editions,
+        deduplicate=deduplicate,
+    )
+
+
+def get_inventory_diff(
+    conn: sqlite3.Connection,
+    ship_id: str,
+    *,
+    case_fold_items: bool = True,
+    case_fold_editions: bool = False,
+    deduplicate: bool = True,
+) -> list[IssueRow]:
+    """Compare a vessel's onboard inventory against the reference in SQLite.
+
+    The item join runs as a single LEFT JOIN inside the database; editions
+    are still classified with normalize_edition so results match
+    compare_inventory. Item case folding uses SQLite's LOWER(), which only
+    folds ASCII letters.
+    """
+
+    def _matches() -> Iterator[_Match]:
+        for raw_item, onboard_edition, current_edition, matched in iter_inventory_join(
+            conn, ship_id, case_fold_items=case_fold_items
+        ):
+            current_edition = _coerce_edition(current_edition)
+            reference_entry = (
+                (current_edition, normalize_edition(current_edition, case_fold=case_fold_editions))
+                if matched
+                else None
+            )
+            yield raw_item, _coerce_edition(onboard_edition), reference_entry
+
+    return _classify(
+        ship_id,
+        _matches(),
+        case_fold_editions=case_fold_editions,
+        deduplicate=deduplicate,
+    )
 
+
+def _classify(
+    ship_id: str,
+    matches: Iterable[_Match],
+    *,
+    case_fold_editions: bool,
+    deduplicate: bool,
+) -> list[IssueRow]:
     issues: list[IssueRow] = []
-    for record in onboard_items:
-        raw_item = record.get("item")
-        display_item = _clean_item(raw_item)
-        item_key = _normalize_item(raw_item, case_fold=case_fold_items)
-        reference_record = reference_by_item.get(item_key)
+    # Duplicates are dropped as they are classified, so no IssueRow is built
+    # for them and no second pass over the issue list is needed.
+    seen: set[tuple[str, Optional[str], IssueType]] | None = set() if deduplicate else None
+
+    def _emit(
+        item: str,
+        onboard_edition: Optional[str],
+        current_edition: Optional[str],
+        issue_type: IssueType,
+    ) -> None:
+        if seen is not None:
+            key = (item, onboard_edition, issue_type)
+            if key in seen:
+                return
+            seen.add(key)
+        issues.append(
+            IssueRow(
+                ship_id=ship_id,
+                item=item,
+                onboard_edition=onboard_edition,
+                current_edition=current_edition,
+                issue_type=issue_type,
+            )
+        )
 
-        onboard_edition = _extract_edition(record, prefer_keys=("onboard_edition", "edition"))
+    for raw_item, onboard_edition, reference_entry in matches:
+        display_item = _clean_item(raw_item)
         normalized_onboard = normalize_edition(onboard_edition, case_fold=case_fold_editions)
 
         if normalized_onboard is None or normalized_onboard == "":
-            current_edition = None
-            if reference_record is not None:
-                current_edition = _extract_edition(
-                    reference_record, prefer_keys=("current_edition", "edition")
-                )
-            issues.append(
-                IssueRow(
-                    ship_id=ship_id,
-                    item=display_item,
-                    onboard_edition=onboard_edition,
-                    current_edition=current_edition,
-                    issue_type=IssueType.MISSING_ONBOARD,
-                )
-            )
+            current_edition = reference_entry[0] if reference_entry else None
+            _emit(display_item, onboard_edition, current_edition, IssueType.MISSING_ONBOARD)
             continue
 
-        if reference_record is None:
-            issues.append(
-                IssueRow(
-                    ship_id=ship_id,
-                    item=display_item,
-                    onboard_edition=onboard_edition,
-                    current_edition=None,
-                    issue_type=IssueType.MISSING_REFERENCE,
-                )
-            )
+        if reference_entry is None:
+            _emit(display_item, onboard_edition, None, IssueType.MISSING_REFERENCE)
             continue
 
-        current_edition = _extract_edition(
-            reference_record, prefer_keys=("current_edition", "edition")
-        )
-        normalized_current = normalize_edition(current_edition, case_fold=case_fold_editions)
+        current_edition, normalized_current = reference_entry
         if normalized_current != normalized_onboard:
-            issues.append(
-                IssueRow(
-                    ship_id=ship_id,
-                    item=display_item,
-                    onboard_edition=onboard_edition,
-                    current_edition=current_edition,
-                    issue_type=IssueType.OUTDATED,
-                )
-            )
+            _emit(display_item, onboard_edition, current_edition, IssueType.OUTDATED)
 
-    if deduplicate:
-        return _dedupe_issues(issues)
     return issues
 
 
@@ -109,20 +193,11 @@ def _extract_edition(
 ) -> Optional[str]:
     for key in prefer_keys:
         if key in record:
-            value = record.get(key)
-            if value is None:
-                return None
-            return value if isinstance(value, str) else str(value)
+            return _coerce_edition(record.get(key))
     return None
 
 
-def _dedupe_issues(issues: list[IssueRow]) -> list[IssueRow]:
-    seen: set[tuple[str, Optional[str], IssueType]] = set()
-    deduped: list[IssueRow] = []
-    for issue in issues:
-        key = (issue.item, issue.onboard_edition, issue.issue_type)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(issue)
-    return deduped
+def _coerce_edition(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
 
-class IssueType(Enum):
-    """Classification for inventory compliance issues."""
+class IssueType(StrEnum):
+    """Classification for inventory compliance issues.
+
+    A ``StrEnum`` so members hash and compare as their (cached) string
+    values; ``.value`` stays the label rendered in reports.
+    """
 
     OUTDATED = "OUTDATED"
     MISSING_ONBOARD = "MISSING_ONBOARD"
     MISSING_REFERENCE = "MISSING_REFERENCE"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IssueRow:
     """Domain record representing a single compliance issue."""
 
@@ -1,19 +1,46 @@
-"""Read-only domain queries for Phase 3 comparison data."""
+"""Read-only domain queries for Phase 3 comparison data.
+
+Rows are streamed as plain tuples in the column order documented next to
+each query; the index constants below name the positions callers rely on.
+"""
 
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable
+from typing import Any, Iterator, Mapping, Sequence
+
+DEFAULT_CHUNK_SIZE = 500
+
+# get_ams_vessels: (ship_id, is_ams, vessel_email, office_email)
+VESSEL_SHIP_ID, VESSEL_IS_AMS, VESSEL_EMAIL, VESSEL_OFFICE_EMAIL = 0, 1, 2, 3
+# get_onboard_inventory: (ship_id, item, edition)
+ONBOARD_SHIP_ID, ONBOARD_ITEM, ONBOARD_EDITION = 0, 1, 2
+# get_reference_inventory: (item, edition)
+REFERENCE_ITEM, REFERENCE_EDITION = 0, 1
+
+QUERY_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_onboard_ship_item ON onboard_inventory(ship_id, item);
+CREATE INDEX IF NOT EXISTS idx_reference_item ON reference_inventory(item);
+"""
 
+# Characters str.strip() removes that SQLite's one-argument TRIM() keeps.
+_TRIM_CHARS = "char(32, 9, 10, 11, 12, 13)"
 
-def _ensure_row_factory(conn: sqlite3.Connection) -> None:
-    if conn.row_factory is None:
-        conn.row_factory = sqlite3.Row
 
+def ensure_query_indexes(conn: sqlite3.Connection) -> None:
+    """Create the indexes backing the inventory queries if they are missing.
 
-def get_ams_vessels(conn: sqlite3.Connection) -> Iterable[sqlite3.Row]:
+    Intended to run once by whichever layer creates the inventory tables.
+    """
+    with conn:
+        conn.executescript(QUERY_INDEX_SQL)
+
+
+def get_ams_vessels(
+    conn: sqlite3.Connection, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[Any, ...]]:
     """Return all vessels marked as AMS."""
-    _ensure_row_factory(conn)
+    # Columns: ship_id, is_ams, vessel_email, office_email
     query = """
         SELECT
             ship_id,
@@ -24,14 +51,14 @@ def get_ams_vessels(conn: sqlite3.Connection) -> Iterable[sqlite3.Row]:
         WHERE is_ams = 1
         ORDER BY ship_id
     """
-    return conn.execute(query).fetchall()
+    yield from _iter_rows(conn, query, (), chunk_size)
 
 
 def get_onboard_inventory(
-    conn: sqlite3.Connection, ship_id: str
-) -> Iterable[sqlite3.Row]:
+    conn: sqlite3.Connection, ship_id: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[Any, ...]]:
     """Return onboard inventory records for the given vessel."""
-    _ensure_row_factory(conn)
+    # Columns: ship_id, item, edition
     query = """
         SELECT
             ship_id,
@@ -41,17 +68,83 @@ def get_onboard_inventory(
         WHERE ship_id = ?
         ORDER BY item
     """
-    return conn.execute(query, (ship_id,)).fetchall()
+    yield from _iter_rows(conn, query, (ship_id,), chunk_size)
 
 
-def get_reference_inventory(conn: sqlite3.Connection) -> Iterable[sqlite3.Row]:
+def get_reference_inventory(
+    conn: sqlite3.Connection, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[Any, ...]]:
     """Return reference (IC) inventory records."""
-    _ensure_row_factory(conn)
+    # Columns: item, edition
     query = """
         SELECT
             item,
             edition
         FROM reference_inventory
-        ORDER BY item
     """
-    return conn.execute(query).fetchall()
+    yield from _iter_rows(conn, query, (), chunk_size)
+
+
+def iter_inventory_join(
+    conn: sqlite3.Connection,
+    ship_id: str,
+    *,
+    case_fold_items: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[Any, ...]]:
+    """Return onboard records joined to their reference record by item.
+
+    Items are matched on their trimmed (and, when requested, lower-cased)
+    text; the first reference row per item wins, as in compare_inventory.
+    """
+    # Columns: onboard item, onboard edition, reference edition, matched
+    item_key = (
+        f"CASE WHEN :fold THEN LOWER(TRIM({{column}}, {_TRIM_CHARS})) "
+        f"ELSE TRIM({{column}}, {_TRIM_CHARS}) END"
+    )
+    query = f"""
+        WITH reference AS (
+            SELECT item_key, edition
+            FROM (
+                SELECT
+                    {item_key.format(column="item")} AS item_key,
+                    edition,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY {item_key.format(column="item")}
+                        ORDER BY rowid
+                    ) AS position
+                FROM reference_inventory
+            )
+            WHERE position = 1 AND item_key != ''
+        )
+        SELECT
+            o.item,
+            o.edition,
+            r.edition,
+            r.item_key IS NOT NULL
+        FROM onboard_inventory AS o
+        LEFT JOIN reference AS r
+            ON r.item_key = {item_key.format(column="o.item")}
+        WHERE o.ship_id = :ship_id
+        ORDER BY o.item
+    """
+    params = {"fold": int(case_fold_items), "ship_id": ship_id}
+    yield from _iter_rows(conn, query, params, chunk_size)
+
+
+def _iter_rows(
+    conn: sqlite3.Connection,
+    query: str,
+    params: Sequence[Any] | Mapping[str, Any],
+    chunk_size: int,
+) -> Iterator[tuple[Any, ...]]:
+    # Stream the result set in chunks rather than materializing it up front.
+    cursor = conn.execute(query, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield from rows
+    finally:
+        cursor.close()
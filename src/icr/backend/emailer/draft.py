@@ -10,28 +10,46 @@ Responsibilities:
 from __future__ import annotations
 
 import json
+import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from email.message import EmailMessage
+from functools import lru_cache, partial
 from pathlib import Path
 from string import Formatter
 from typing import Any, Mapping, Sequence
 
 EMAIL_PHASE = "email_drafting"
 DEFAULT_SUBJECT_TEMPLATE = "Inventory Compliance - {SHIPNAME}"
+# Reference definition of an acceptable address; _is_valid_email implements
+# the same fullmatch with plain string operations.
 EMAIL_REGEX = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# Deletes every ASCII character that is not allowed in a draft filename.
+_FILENAME_ASCII_DELETE = str.maketrans(
+    "",
+    "",
+    "".join(ch for ch in map(chr, range(128)) if not (ch.isalnum() or ch in "-_")),
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DraftAttachment:
-    """Binary attachment included with the draft email."""
+    """File-backed attachment included with the draft email."""
 
     filename: str
     content_type: str
-    data: bytes
+    source: Path
 
+    @property
+    def data(self) -> bytes:
+        """Return the attachment bytes, read from the source file on demand."""
 
-@dataclass(frozen=True)
+        return self.source.read_bytes()
+
+
+@dataclass(frozen=True, slots=True)
 class DraftEmail:
     """In-memory representation of a drafted email."""
 
@@ -41,10 +59,26 @@ class DraftEmail:
     html_body: str
     attachments: tuple[DraftAttachment, ...]
     eml_path: Path | None
-    eml_bytes: bytes | None
+
+    @property
+    def eml_bytes(self) -> bytes | None:
+        """Return the written .eml draft, read back from disk on demand."""
+
+        return self.eml_path.read_bytes() if self.eml_path is not None else None
+
+    def build_message(self, *, from_email: str | None = None) -> EmailMessage:
+        """Build the MIME message for this draft on demand."""
+
+        return _build_email_message(
+            to_addresses=self.to_addresses,
+            subject=self.subject,
+            html_body=self.html_body,
+            attachments=self.attachments,
+            from_email=from_email,
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DraftIssue:
     """Validation error or warning encountered during drafting."""
 
@@ -53,7 +87,7 @@ class DraftIssue:
     severity: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DraftingResult:
     """Aggregate result of draft email generation."""
 
@@ -74,6 +108,7 @@ def draft_emails(
     eml_output_dir: Path | str | None = None,
     from_email: str | None = None,
     run_id: str | None = None,
+    concurrency: int = 1,
 ) -> DraftingResult:
     """Draft per-vessel emails and update summary.json.
 
@@ -88,60 +123,119 @@ def draft_emails(
         eml_output_dir: Optional directory to write .eml drafts.
         from_email: Optional From header for .eml drafts.
         run_id: Optional run_id to use for templating.
+        concurrency: Number of vessels to draft in parallel threads.
     """
 
     summary = _read_summary(summary_path)
     resolved_run_id = run_id or _coerce_text(summary.get("run_id"))
 
+    draft_one = partial(
+        _draft_one,
+        html_reports=html_reports,
+        subject_template=subject_template,
+        default_office_email=default_office_email,
+        include_pdf=include_pdf,
+        pdf_reports=pdf_reports,
+        eml_output_dir=eml_output_dir,
+        from_email=from_email,
+        run_id=resolved_run_id,
+    )
+    # Names are settled up front, in vessel order, so no two drafts share a
+    # file and threaded runs write exactly what a serial run would.
+    eml_filenames = (
+        _assign_eml_filenames(vessels) if eml_output_dir else [None] * len(vessels)
+    )
+    workers = min(max(1, concurrency), len(vessels))
+    if workers > 1:
+        # Drafting is dominated by file I/O, which releases the GIL. map()
+        # keeps outcomes in vessel order so results stay deterministic.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(draft_one, vessels, eml_filenames))
+    else:
+        outcomes = [
+            draft_one(vessel, eml_filename)
+            for vessel, eml_filename in zip(vessels, eml_filenames)
+        ]
+
     drafts: list[DraftEmail] = []
     errors: list[DraftIssue] = []
     warnings: list[DraftIssue] = []
-    processed = 0
+    for draft, vessel_errors, vessel_warnings in outcomes:
+        if draft is not None:
+            drafts.append(draft)
+        errors.extend(vessel_errors)
+        warnings.extend(vessel_warnings)
 
-    for vessel in vessels:
-        ship_id = _coerce_text(vessel.get("ship_id"))
-        if not ship_id:
-            errors.append(
-                DraftIssue(
-                    vessel_id=None,
-                    message="Missing required vessel identifier: ship_id.",
-                    severity="error",
-                )
-            )
-            continue
+    _update_summary(
+        summary_path,
+        summary,
+        processed_increment=len(drafts),
+        issues=errors + warnings,
+    )
 
-        vessel_errors: list[DraftIssue] = []
-        vessel_warnings: list[DraftIssue] = []
+    return DraftingResult(
+        drafts=tuple(drafts),
+        errors=tuple(errors),
+        warnings=tuple(warnings),
+    )
 
-        recipients = _resolve_recipients(
-            vessel,
-            default_office_email=default_office_email,
-            errors=vessel_errors,
-        )
 
-        report_html = _resolve_html_report(
-            html_reports.get(ship_id), ship_id=ship_id, errors=vessel_errors
+def _draft_one(
+    vessel: Mapping[str, Any],
+    eml_filename: str | None,
+    *,
+    html_reports: Mapping[str, str | Path],
+    subject_template: str,
+    default_office_email: str | None,
+    include_pdf: bool,
+    pdf_reports: Mapping[str, str | Path] | None,
+    eml_output_dir: Path | str | None,
+    from_email: str | None,
+    run_id: str,
+) -> tuple[DraftEmail | None, list[DraftIssue], list[DraftIssue]]:
+    ship_id = _coerce_text(vessel.get("ship_id"))
+    if not ship_id:
+        missing_id = DraftIssue(
+            vessel_id=None,
+            message="Missing required vessel identifier: ship_id.",
+            severity="error",
         )
+        return None, [missing_id], []
 
-        subject = _format_subject(
-            subject_template,
-            vessel,
-            run_id=resolved_run_id,
-            warnings=vessel_warnings,
-        )
+    vessel_errors: list[DraftIssue] = []
+    vessel_warnings: list[DraftIssue] = []
 
-        attachments = _resolve_attachments(
-            ship_id,
-            include_pdf=include_pdf,
-            pdf_reports=pdf_reports,
-            warnings=vessel_warnings,
-        )
+    recipients = _resolve_recipients(
+        vessel,
+        default_office_email=default_office_email,
+        errors=vessel_errors,
+    )
 
-        if vessel_errors:
-            errors.extend(vessel_errors)
-            warnings.extend(vessel_warnings)
-            continue
+    report_html = _resolve_html_report(
+        html_reports.get(ship_id), ship_id=ship_id, errors=vessel_errors
+    )
 
+    subject = _format_subject(
+        subject_template,
+        vessel,
+        run_id=run_id,
+        warnings=vessel_warnings,
+    )
+
+    attachments = _resolve_attachments(
+        ship_id,
+        include_pdf=include_pdf,
+        pdf_reports=pdf_reports,
+        warnings=vessel_warnings,
+    )
+
+    if vessel_errors:
+        return None, vessel_errors, vessel_warnings
+
+    eml_path: Path | None = None
+    if eml_output_dir and eml_filename:
+        # The message (and its encoded attachments) only lives long
+        # enough to be serialized to disk.
         message = _build_email_message(
             to_addresses=recipients,
             subject=subject,
@@ -149,43 +243,21 @@ def draft_emails(
             attachments=attachments,
             from_email=from_email,
         )
-
-        eml_path: Path | None = None
-        eml_bytes: bytes | None = None
-        if eml_output_dir:
-            eml_dir = Path(eml_output_dir)
-            eml_dir.mkdir(parents=True, exist_ok=True)
-            filename = _format_eml_filename(ship_id, vessel.get("ship_name"))
-            eml_path = eml_dir / filename
-            eml_bytes = message.as_bytes()
-            eml_path.write_bytes(eml_bytes)
-
-        drafts.append(
-            DraftEmail(
-                vessel_id=ship_id,
-                to_addresses=tuple(recipients),
-                subject=subject,
-                html_body=report_html,
-                attachments=tuple(attachments),
-                eml_path=eml_path,
-                eml_bytes=eml_bytes,
-            )
-        )
-        processed += 1
-        warnings.extend(vessel_warnings)
-
-    _update_summary(
-        summary_path,
-        summary,
-        processed_increment=processed,
-        issues=errors + warnings,
-    )
-
-    return DraftingResult(
-        drafts=tuple(drafts),
-        errors=tuple(errors),
-        warnings=tuple(warnings),
+        eml_dir = Path(eml_output_dir)
+        eml_dir.mkdir(parents=True, exist_ok=True)
+        eml_path = eml_dir / eml_filename
+        _write_eml_atomic(eml_path, message.as_bytes())
+        del message
+
+    draft = DraftEmail(
+        vessel_id=ship_id,
+        to_addresses=tuple(recipients),
+        subject=subject,
+        html_body=report_html,
+        attachments=tuple(attachments),
+        eml_path=eml_path,
     )
+    return draft, [], vessel_warnings
 
 
 def _resolve_recipients(
@@ -245,7 +317,7 @@ def _resolve_html_report(
         return ""
 
     if isinstance(report_source, Path):
-        return report_source.read_text(encoding="utf-8")
+        return _read_html(report_source, report_source.stat())
 
     text = _coerce_text(report_source)
     if not text:
@@ -259,9 +331,24 @@ def _resolve_html_report(
         return ""
 
     candidate = Path(text)
-    if candidate.exists():
-        return candidate.read_text(encoding="utf-8")
-    return text
+    try:
+        stat_result = candidate.stat()
+    except (OSError, ValueError):
+        return text
+    return _read_html(candidate, stat_result)
+
+
+def _read_html(path: Path, stat_result: os.stat_result) -> str:
+    # Vessels often share a report file; key on size and mtime so edits made
+    # during a run are still picked up.
+    return _read_html_cached(
+        str(path.resolve()), stat_result.st_mtime_ns, stat_result.st_size
+    )
+
+
+@lru_cache(maxsize=256)
+def _read_html_cached(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
 
 
 def _format_subject(
@@ -287,11 +374,8 @@ def _format_subject(
         "SHIPNAME": ship_name or ship_id,
         "RUN_ID": run_id,
     }
-    formatter = Formatter()
     missing_fields = [
-        field_name
-        for _, field_name, _, _ in formatter.parse(template)
-        if field_name and field_name not in values
+        field_name for field_name in _parse_template_fields(template) if field_name not in values
     ]
     for field_name in missing_fields:
         warnings.append(
@@ -305,6 +389,13 @@ def _format_subject(
     return template.format_map(_DefaultDict(values))
 
 
+@lru_cache(maxsize=32)
+def _parse_template_fields(template: str) -> tuple[str, ...]:
+    return tuple(
+        field_name for _, field_name, _, _ in Formatter().parse(template) if field_name
+    )
+
+
 def _resolve_attachments(
     ship_id: str,
     *,
@@ -328,6 +419,8 @@ def _resolve_attachments(
 
     pdf_source = pdf_reports[ship_id]
     pdf_path = Path(pdf_source) if not isinstance(pdf_source, Path) else pdf_source
+    # The single stat here is the only filesystem access until the .eml is
+    # serialized; the bytes themselves are read on demand.
     if not pdf_path.exists():
         warnings.append(
             DraftIssue(
@@ -342,7 +435,7 @@ def _resolve_attachments(
         DraftAttachment(
             filename=pdf_path.name,
             content_type="application/pdf",
-            data=pdf_path.read_bytes(),
+            source=pdf_path,
         )
     )
     return attachments
@@ -375,26 +468,107 @@ def _build_email_message(
     return message
 
 
+def _assign_eml_filenames(vessels: Sequence[Mapping[str, Any]]) -> list[str | None]:
+    """Give each vessel a distinct .eml file name, in vessel order.
+
+    Different IDs can sanitize to one name ("V/1" and "V:1") and ship_ids can
+    repeat, so later vessels get a counter suffix (``_02``, ``_03`` ...), as
+    run directories do. Names are compared case-insensitively so they stay
+    distinct on Windows. Vessels without a ship_id get None.
+    """
+
+    taken: set[str] = set()
+    filenames: list[str | None] = []
+    for vessel in vessels:
+        ship_id = _coerce_text(vessel.get("ship_id"))
+        if not ship_id:
+            filenames.append(None)
+            continue
+        filename = _format_eml_filename(ship_id, vessel.get("ship_name"))
+        stem = filename.removesuffix(".eml")
+        candidate = filename
+        counter = 1
+        while candidate.casefold() in taken:
+            counter += 1
+            candidate = f"{stem}_{counter:02d}.eml"
+        taken.add(candidate.casefold())
+        filenames.append(candidate)
+    return filenames
+
+
 def _format_eml_filename(ship_id: str, ship_name: Any) -> str:
+    return _format_eml_filename_cached(ship_id, _coerce_text(ship_name))
+
+
+@lru_cache(maxsize=1024)
+def _format_eml_filename_cached(ship_id: str, ship_name: str) -> str:
     safe_id = _sanitize_filename(ship_id or "UNKNOWN")
-    safe_name = _sanitize_filename(_coerce_text(ship_name))
+    safe_name = _sanitize_filename(ship_name)
     if safe_name:
         return f"{safe_id}_{safe_name}.eml"
     return f"{safe_id}.eml"
 
 
+def _current_umask() -> int:
+    # os.umask only reads by setting, so it is read once at import instead
+    # of being toggled while drafting threads create files.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_EML_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _write_eml_atomic(path: Path, payload: bytes) -> None:
+    # Write to a unique sibling temp file and rename over the target so
+    # concurrent readers never see a partial file and concurrent writers
+    # never share a temp. There is no fsync: drafts are regenerated on a
+    # rerun, so durability across power loss is not promised.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            # mkstemp creates owner-only files; give drafts the mode a plain
+            # write would, honouring the process umask.
+            os.chmod(tmp_path, _EML_FILE_MODE)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _sanitize_filename(value: str) -> str:
-    cleaned = "".join(ch for ch in value if ch.isalnum() or ch in ("-", "_"))
+    cleaned = value.translate(_FILENAME_ASCII_DELETE)
+    if not cleaned.isascii():
+        # Non-ASCII letters and digits are kept, matching str.isalnum().
+        cleaned = "".join(ch for ch in cleaned if ch.isalnum() or ch in ("-", "_"))
     return cleaned or "UNKNOWN"
 
 
 def _is_valid_email(address: str) -> bool:
-    return bool(EMAIL_REGEX.fullmatch(address.strip()))
+    candidate = address.strip()
+    at = candidate.find("@")
+    if at <= 0 or at != candidate.rfind("@"):
+        return False
+    # The domain needs a dot with at least one character on either side.
+    dot = candidate.find(".", at + 2)
+    if dot < 0 or dot == len(candidate) - 1:
+        return False
+    return not any(ch.isspace() for ch in candidate)
 
 
 def _read_summary(summary_path: Path | str) -> dict[str, Any]:
     path = Path(summary_path)
-    data = json.loads(path.read_text(encoding="utf-8"))
+    if _ORJSON is not None:
+        data = _ORJSON.loads(path.read_bytes())
+    else:
+        data = json.loads(path.read_text(encoding="utf-8"))
     if "run_id" not in data:
         raise ValueError("summary.json must include run_id.")
     if "errors" not in data or not isinstance(data["errors"], list):
@@ -411,22 +585,34 @@ def _update_summary(
 ) -> None:
     updated = dict(summary)
     updated_errors = list(updated.get("errors", []))
-    existing_keys = {_summary_key(entry) for entry in updated_errors}
+    added = 0
+    if issues:
+        existing_keys: set[str] = {_summary_key(entry) for entry in updated_errors}
+        for issue in issues:
+            key = "\x1f".join(
+                (EMAIL_PHASE, issue.vessel_id or "", _coerce_text(issue.message), issue.severity)
+            )
+            if key in existing_keys:
+                continue
+            updated_errors.append(_issue_to_entry(issue))
+            existing_keys.add(key)
+            added += 1
 
-    for issue in issues:
-        entry = _issue_to_entry(issue)
-        key = _summary_key(entry)
-        if key in existing_keys:
-            continue
-        updated_errors.append(entry)
-        existing_keys.add(key)
+    if not added and not processed_increment:
+        # Nothing changed; leave the file untouched.
+        return
 
     updated["errors"] = updated_errors
     if processed_increment:
         updated["vessels_processed"] = int(updated.get("vessels_processed", 0)) + processed_increment
 
     path = Path(summary_path)
-    path.write_text(json.dumps(updated, indent=2), encoding="utf-8")
+    if _ORJSON is not None:
+        path.write_bytes(_ORJSON.dumps(updated))
+        return
+    # Compact separators keep json on its C encoder; indent forces the
+    # pure-Python one.
+    path.write_text(json.dumps(updated, separators=(",", ":")), encoding="utf-8")
 
 
 def _issue_to_entry(issue: DraftIssue) -> dict[str, Any]:
@@ -440,21 +626,42 @@ def _issue_to_entry(issue: DraftIssue) -> dict[str, Any]:
     return entry
 
 
-def _summary_key(entry: Mapping[str, Any] | Any) -> tuple[str, str, str, str]:
+def _summary_key(entry: Mapping[str, Any] | Any) -> str:
+    # One joined string per entry hashes cheaper than a 4-tuple; the unit
+    # separator keeps fields from running together.
     if not isinstance(entry, Mapping):
-        return ("", "", _coerce_text(entry), "")
-    return (
-        _coerce_text(entry.get("phase")),
-        _coerce_text(entry.get("vessel_id")),
-        _coerce_text(entry.get("message")),
-        _coerce_text(entry.get("severity")),
+        return f"\x1f\x1f{_coerce_text(entry)}\x1f"
+    get = entry.get
+    return "\x1f".join(
+        (
+            _coerce_text(get("phase")),
+            _coerce_text(get("vessel_id")),
+            _coerce_text(get("message")),
+            _coerce_text(get("severity")),
+        )
     )
 
 
+def _load_orjson() -> Any | None:
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except Exception:
+        return None
+    return orjson
+
+
+# Optional faster JSON codec for summary.json; stdlib json is the fallback.
+_ORJSON = _load_orjson()
+
+
 def _coerce_text(value: Any) -> str:
+    # Exact type check: skips the isinstance MRO walk on this hot path; str
+    # subclasses are simply converted to plain str.
+    if type(value) is str:
+        return value
     if value is None:
         return ""
-    return value if isinstance(value, str) else str(value)
+    return str(value)
 
 
 class _DefaultDict(dict[str, str]):
@@ -10,11 +10,17 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import sqlite3
-from dataclasses import dataclass
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, Protocol, Sequence
+from typing import Any, Callable, Iterable, Iterator, Mapping, Protocol, Sequence
 
 from openpyxl import load_workbook
 
@@ -24,7 +30,7 @@ logger = logging.getLogger(__name__)
 class DatabaseLike(Protocol):
     """Database contract required by the ingestion boundary."""
 
-    def connect(self) -> sqlite3.Connection: ...
+    def connect(self, *, bulk: bool = False) -> sqlite3.Connection: ...
 
 
 class RuntimePathsLike(Protocol):
@@ -33,7 +39,7 @@ class RuntimePathsLike(Protocol):
     run_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """Structured validation issue captured during ingestion."""
 
@@ -51,6 +57,10 @@ class IngestionFatalError(RuntimeError):
         super().__init__(message)
         self.issues = tuple(issues)
 
+    def __reduce__(self):
+        # Rebuild with the issues when raised in a parse worker process.
+        return type(self), (str(self), self.issues)
+
 
 @dataclass(frozen=True)
 class IngestionStats:
@@ -81,13 +91,59 @@ class SheetSpec:
     key_columns: tuple[str, ...]
     warning_columns: tuple[str, ...]
     table_name: str
-    row_mapper: Callable[[Mapping[str, object]], Mapping[str, object]]
+    # (target column, normalized source header or None for a NULL constant)
+    mapping: tuple[tuple[str, str | None], ...]
+    # Set False to skip raw_excel_rows for sources that do not need audit rows.
+    persist_raw: bool = True
+    ordered_columns: tuple[str, ...] = field(init=False)
+    source_columns: tuple[str | None, ...] = field(init=False)
+    insert_prefix: str = field(init=False)
+    insert_sql: str = field(init=False)
+    required_set: frozenset[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # The mapping is fixed, so the target-table INSERT is derived once
+        # here instead of per write.
+        columns = tuple(target for target, _ in self.mapping)
+        object.__setattr__(self, "source_columns", tuple(source for _, source in self.mapping))
+        prefix = f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES"
+        object.__setattr__(self, "ordered_columns", columns)
+        object.__setattr__(self, "insert_prefix", prefix)
+        object.__setattr__(self, "insert_sql", _values_sql(prefix, len(columns), 1))
+        object.__setattr__(self, "required_set", frozenset(self.required_columns))
+
+
+# ((row_number, raw row JSON) or None, mapped table values) for one row.
+_RowPayload = tuple[tuple[int, bytes] | None, list[object]]
+
+
+@dataclass(frozen=True, slots=True)
+class _ParsedWorkbook:
+    """Fully parsed source awaiting its SQLite write."""
+
+    file_path: Path
+    spec: SheetSpec
+    payloads: tuple[_RowPayload | None, ...]
+    header_issues: list[ValidationIssue]
+    row_issues: list[ValidationIssue]
 
 
 TABLE_VESSEL = "vessel"
 TABLE_VESSEL_INVENTORY = "vessel_inventory_row"
 TABLE_IC_INVENTORY = "ic_inventory_row"
 
+# Rows buffered before each flush to SQLite during ingestion.
+INGEST_CHUNK_SIZE = 1000
+# Consecutive empty rows after which a worksheet is treated as exhausted.
+EMPTY_TAIL_THRESHOLD = 100
+# Bound parameters per INSERT statement.
+SQLITE_MAX_PARAMS = 999
+RAW_INSERT_PREFIX = "INSERT INTO raw_excel_rows (row_number, row_json) VALUES"
+VALIDATION_INSERT_PREFIX = (
+    "INSERT INTO validation_errors "
+    "(row_number, column_name, error_type, message, severity) VALUES"
+)
+
 
 IC_REQUIRED = (
     "item",
@@ -120,18 +176,26 @@ VESSEL_INVENTORY_REQUIRED = (
 )
 
 
+@lru_cache(maxsize=64)
+def _values_sql(prefix: str, width: int, count: int) -> str:
+    """Build an INSERT with ``count`` VALUES groups of ``width`` placeholders."""
+
+    group = f"({', '.join('?' * width)})"
+    return f"{prefix} {', '.join([group] * count)};"
+
+
 IC_SPEC = SheetSpec(
     source_name="safe_ic_inventory",
     required_columns=IC_REQUIRED,
     key_columns=("item",),
     warning_columns=(),
     table_name=TABLE_IC_INVENTORY,
-    row_mapper=lambda row: {
-        "item": row.get("item"),
-        "current_edition": row.get("edition"),
-        "description": row.get("itmdesc"),
-        "current_date": row.get("currdate"),
-    },
+    mapping=(
+        ("item", "item"),
+        ("current_edition", "edition"),
+        ("description", "itmdesc"),
+        ("current_date", "currdate"),
+    ),
 )
 
 VESSEL_INDEX_SPEC = SheetSpec(
@@ -140,16 +204,16 @@ VESSEL_INDEX_SPEC = SheetSpec(
     key_columns=("shipid",),
     warning_columns=("email",),
     table_name=TABLE_VESSEL,
-    row_mapper=lambda row: {
-        "ship_id": row.get("shipid"),
-        "ship_name": row.get("shipname"),
-        "customer_no": row.get("custno"),
-        "imo_no": row.get("imono"),
-        "ship_status": row.get("shipstat"),
-        "ship_email": row.get("email"),
-        "office_email": None,
-        "ams": None,
-    },
+    mapping=(
+        ("ship_id", "shipid"),
+        ("ship_name", "shipname"),
+        ("customer_no", "custno"),
+        ("imo_no", "imono"),
+        ("ship_status", "shipstat"),
+        ("ship_email", "email"),
+        ("office_email", None),
+        ("ams", None),
+    ),
 )
 
 VESSEL_INVENTORY_SPEC = SheetSpec(
@@ -158,13 +222,13 @@ VESSEL_INVENTORY_SPEC = SheetSpec(
     key_columns=("shipid", "item"),
     warning_columns=(),
     table_name=TABLE_VESSEL_INVENTORY,
-    row_mapper=lambda row: {
-        "ship_id": row.get("shipid"),
-        "item": row.get("item"),
-        "onboard_edition": row.get("edition"),
-        "store_edition": row.get("storeedt"),
-        "description": row.get("descrip"),
-    },
+    mapping=(
+        ("ship_id", "shipid"),
+        ("item", "item"),
+        ("onboard_edition", "edition"),
+        ("store_edition", "storeedt"),
+        ("description", "descrip"),
+    ),
 )
 
 
@@ -175,18 +239,41 @@ def ingest_excel_files(
     vessels_inventory_path: Path | str,
     db: DatabaseLike,
     paths: RuntimePathsLike,
+    parse_workers: int = 1,
+    parse_processes: bool = False,
 ) -> IngestionSummary:
     """Ingest the three required Excel workbooks into SQLite.
 
+    By default each workbook is streamed straight into SQLite in turn. With
+    ``parse_workers`` > 1 the workbooks are parsed concurrently in threads
+    and buffered in memory, then written one at a time in source order.
+    ``parse_processes`` runs those parses in worker processes instead, so
+    openpyxl's CPU-bound XML parsing is not serialized by the GIL.
+
     Raises:
         IngestionFatalError: If a fatal schema or file error occurs.
     """
 
-    results = (
-        _ingest_single_file(Path(ic_inventory_path), IC_SPEC, db, paths),
-        _ingest_single_file(Path(vessels_index_path), VESSEL_INDEX_SPEC, db, paths),
-        _ingest_single_file(Path(vessels_inventory_path), VESSEL_INVENTORY_SPEC, db, paths),
+    sources = (
+        (Path(ic_inventory_path), IC_SPEC),
+        (Path(vessels_index_path), VESSEL_INDEX_SPEC),
+        (Path(vessels_inventory_path), VESSEL_INVENTORY_SPEC),
     )
+    workers = min(max(1, parse_workers), len(sources))
+    # One bulk connection serves the whole run; each source still commits in
+    # its own transaction so a later fatal source keeps earlier ones.
+    conn = db.connect(bulk=True)
+    try:
+        if workers > 1:
+            results = _ingest_parsed_concurrently(
+                sources, conn, paths, workers, processes=parse_processes
+            )
+        else:
+            results = tuple(
+                _ingest_source(conn, file_path, spec, paths) for file_path, spec in sources
+            )
+    finally:
+        conn.close()
     warnings = tuple(issue for result in results for issue in result.warnings)
     return IngestionSummary(results=results, warnings=warnings, has_warnings=bool(warnings))
 
@@ -199,8 +286,116 @@ def _ingest_single_file(
 ) -> IngestionStats:
     """Ingest a single Excel workbook into its target table."""
 
+    conn = db.connect(bulk=True)
+    try:
+        return _ingest_source(conn, file_path, spec, paths)
+    finally:
+        conn.close()
+
+
+def _ingest_source(
+    conn: sqlite3.Connection,
+    file_path: Path,
+    spec: SheetSpec,
+    paths: RuntimePathsLike,
+) -> IngestionStats:
+    """Stream one workbook into its target table over an open connection."""
+
+    try:
+        close, worksheet, header_map, header_issues = _open_worksheet(file_path, spec)
+    except IngestionFatalError as exc:
+        _log_warnings(exc.issues, paths.run_id)
+        _persist_validation_issues(conn, exc.issues)
+        raise
+
+    try:
+        row_issues: list[ValidationIssue] = []
+        return _write_source(
+            conn,
+            file_path,
+            spec,
+            _iter_payloads(worksheet, spec, header_map, row_issues),
+            header_issues,
+            row_issues,
+            paths,
+            release=close,
+        )
+    finally:
+        close()
+
+
+def _ingest_parsed_concurrently(
+    sources: Sequence[tuple[Path, SheetSpec]],
+    conn: sqlite3.Connection,
+    paths: RuntimePathsLike,
+    workers: int,
+    *,
+    processes: bool = False,
+) -> tuple[IngestionStats, ...]:
+    """Parse workbooks in parallel workers, then write them in source order."""
+
+    results: list[IngestionStats] = []
+    executor_type: type[Executor] = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_type(max_workers=workers) as executor:
+        # Workers only receive picklable paths and specs; the connection and
+        # run context never leave this process.
+        futures = [
+            executor.submit(_parse_workbook, file_path, spec) for file_path, spec in sources
+        ]
+        # SQLite has a single writer, so writes stay sequential; a fatal
+        # source stops the run before any later source is written.
+        for future in futures:
+            try:
+                parsed = future.result()
+            except IngestionFatalError as exc:
+                _log_warnings(exc.issues, paths.run_id)
+                _persist_validation_issues(conn, exc.issues)
+                raise
+            results.append(
+                _write_source(
+                    conn,
+                    parsed.file_path,
+                    parsed.spec,
+                    parsed.payloads,
+                    parsed.header_issues,
+                    parsed.row_issues,
+                    paths,
+                )
+            )
+    return tuple(results)
+
+
+def _parse_workbook(file_path: Path, spec: SheetSpec) -> _ParsedWorkbook:
+    """Read and validate a workbook fully in memory without touching SQLite."""
+
+    close, worksheet, header_map, header_issues = _open_worksheet(file_path, spec)
     try:
-        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        row_issues: list[ValidationIssue] = []
+        payloads = tuple(_iter_payloads(worksheet, spec, header_map, row_issues))
+    finally:
+        close()
+    return _ParsedWorkbook(
+        file_path=file_path,
+        spec=spec,
+        payloads=payloads,
+        header_issues=header_issues,
+        row_issues=row_issues,
+    )
+
+
+def _open_worksheet(
+    file_path: Path,
+    spec: SheetSpec,
+) -> tuple[Callable[[], None], Any, dict[str, int], list[ValidationIssue]]:
+    """Open a workbook and validate its header row.
+
+    Returns a callable that closes the workbook, its first worksheet, the
+    header map, and header warnings. Fatal problems raise IngestionFatalError;
+    logging and persisting their issues is left to the caller.
+    """
+
+    try:
+        workbook, close = _load_workbook(file_path)
     except Exception as exc:  # pragma: no cover - error surface only
         issue = ValidationIssue(
             row_number=None,
@@ -209,7 +404,6 @@ def _ingest_single_file(
             message=f"{spec.source_name}: failed to read {file_path}: {exc}",
             severity="fatal",
         )
-        _persist_validation_issues(db, [issue])
         raise IngestionFatalError(issue.message, [issue]) from exc
 
     try:
@@ -221,7 +415,6 @@ def _ingest_single_file(
                 message=f"{spec.source_name}: workbook has no worksheets: {file_path}",
                 severity="fatal",
             )
-            _persist_validation_issues(db, [issue])
             raise IngestionFatalError(issue.message, [issue])
 
         worksheet = workbook.worksheets[0]
@@ -234,7 +427,6 @@ def _ingest_single_file(
                 message=f"{spec.source_name}: worksheet is empty in {file_path}",
                 severity="fatal",
             )
-            _persist_validation_issues(db, [issue])
             raise IngestionFatalError(issue.message, [issue])
 
         if not any(not _is_blank(cell) for cell in header_values):
@@ -245,11 +437,10 @@ def _ingest_single_file(
                 message=f"{spec.source_name}: missing header row in {file_path}",
                 severity="fatal",
             )
-            _persist_validation_issues(db, [issue])
             raise IngestionFatalError(issue.message, [issue])
 
         header_map, header_warnings = _normalize_headers(header_values, spec)
-        missing_columns = sorted(set(spec.required_columns) - set(header_map))
+        missing_columns = sorted(spec.required_set.difference(header_map))
         issues: list[ValidationIssue] = []
         if header_warnings:
             issues.extend(header_warnings)
@@ -266,100 +457,217 @@ def _ingest_single_file(
                 for column_name in missing_columns
             ]
             issues.extend(fatal_issues)
-            _log_warnings(issues, paths.run_id)
-            _persist_validation_issues(db, issues)
             raise IngestionFatalError(
                 f"{spec.source_name}: missing required columns {missing_columns}", issues
             )
+    except BaseException:
+        close()
+        raise
 
-        rows_seen = 0
-        rows_inserted = 0
-        row_payloads: list[tuple[int, str]] = []
-        table_payloads: list[Mapping[str, object]] = []
-        row_issues: list[ValidationIssue] = []
+    return close, worksheet, header_map, issues
+
+
+def _write_source(
+    conn: sqlite3.Connection,
+    file_path: Path,
+    spec: SheetSpec,
+    payloads: Iterable[_RowPayload | None],
+    header_issues: Sequence[ValidationIssue],
+    row_issues: Sequence[ValidationIssue],
+    paths: RuntimePathsLike,
+    *,
+    release: Callable[[], None] | None = None,
+) -> IngestionStats:
+    """Write one source's rows and issues to SQLite in a single transaction.
 
-        for row_number, row in enumerate(
-            worksheet.iter_rows(min_row=2, values_only=True),
-            start=2,
-        ):
+    ``row_issues`` may still be filling while ``payloads`` is consumed; it is
+    only read once every payload has been written. ``release`` runs as soon
+    as the payloads are exhausted, before the final writes.
+    """
+
+    rows_seen = 0
+    rows_inserted = 0
+    raw_buffer: list[tuple[int, bytes]] = []
+    table_buffer: list[list[object]] = []
+
+    # Rows flow into SQLite in fixed-size chunks inside one transaction, so a
+    # streamed workbook is never buffered whole.
+    with _immediate_transaction(conn):
+        for payload in payloads:
             rows_seen += 1
-            normalized_row = _extract_row(row, header_map)
-            if _is_empty_row(normalized_row):
+            if payload is None:
+                continue
+            raw_row, table_row = payload
+            if raw_row is not None:
+                raw_buffer.append(raw_row)
+            table_buffer.append(table_row)
+            rows_inserted += 1
+            if len(table_buffer) >= INGEST_CHUNK_SIZE:
+                _flush_rows(conn, spec, raw_buffer, table_buffer)
+
+        if release is not None:
+            # Release the zip handle and shared strings before the final
+            # writes; callers tolerate a second close.
+            release()
+        _flush_rows(conn, spec, raw_buffer, table_buffer)
+
+        all_issues = [*header_issues, *row_issues]
+        if all_issues:
+            _log_warnings(all_issues, paths.run_id)
+            _insert_validation_issues(conn, all_issues)
+
+    warnings = tuple(issue for issue in all_issues if issue.severity == "warning")
+    return IngestionStats(
+        source_name=spec.source_name,
+        file_path=file_path,
+        rows_seen=rows_seen,
+        rows_inserted=rows_inserted,
+        warnings=warnings,
+    )
+
+
+def _iter_payloads(
+    worksheet,
+    spec: SheetSpec,
+    header_map: Mapping[str, int],
+    row_issues: list[ValidationIssue],
+) -> Iterator[_RowPayload | None]:
+    """Yield raw and mapped insert values per data row, None for skipped rows."""
+
+    map_table = _make_table_mapper(spec, header_map)
+    for row_number, normalized_row in _iter_validated_rows(
+        worksheet, spec, header_map, row_issues
+    ):
+        if normalized_row is None:
+            yield None
+            continue
+        # Table values come straight from the one normalized row, which also
+        # feeds the raw JSON; no intermediate mapped dict is built.
+        yield (
+            (row_number, _serialize_row(spec.source_name, normalized_row))
+            if spec.persist_raw
+            else None,
+            map_table(normalized_row),
+        )
+
+
+def _iter_validated_rows(
+    worksheet,
+    spec: SheetSpec,
+    header_map: Mapping[str, int],
+    row_issues: list[ValidationIssue],
+) -> Iterator[tuple[int, dict[str, object] | None]]:
+    """Yield every data row, with None for rows skipped by validation.
+
+    Validation issues are appended to ``row_issues`` as rows are read. After
+    EMPTY_TAIL_THRESHOLD consecutive empty rows the scan stops with a
+    warning, so styled phantom rows at the end of a sheet are not parsed.
+    """
+
+    extract = _make_row_extractor(header_map)
+    threshold = EMPTY_TAIL_THRESHOLD
+    consecutive_empty = 0
+    for row_number, row in enumerate(
+        worksheet.iter_rows(min_row=2, values_only=True),
+        start=2,
+    ):
+        normalized_row = extract(row)
+        # One pass decides emptiness, key and warning checks together. Cells
+        # are already stripped, so blank means None or "".
+        present = {
+            key for key, value in normalized_row.items() if value is not None and value != ""
+        }
+        if not present:
+            row_issues.append(
+                ValidationIssue(
+                    row_number=row_number,
+                    column_name=None,
+                    error_type="empty_row",
+                    message=f"{spec.source_name}: empty row {row_number}",
+                    severity="warning",
+                )
+            )
+            yield row_number, None
+            consecutive_empty += 1
+            if consecutive_empty >= threshold:
                 row_issues.append(
                     ValidationIssue(
                         row_number=row_number,
                         column_name=None,
-                        error_type="empty_row",
-                        message=f"{spec.source_name}: empty row {row_number}",
+                        error_type="early_stop_empty_tail",
+                        message=(
+                            f"{spec.source_name}: stopped reading after {consecutive_empty} "
+                            f"consecutive empty rows at row {row_number}"
+                        ),
                         severity="warning",
                     )
                 )
-                continue
+                return
+            continue
 
-            missing_keys = [
-                key for key in spec.key_columns if _is_blank(normalized_row.get(key))
-            ]
-            if missing_keys:
-                for key in missing_keys:
-                    row_issues.append(
-                        ValidationIssue(
-                            row_number=row_number,
-                            column_name=key,
-                            error_type="missing_key_field",
-                            message=(
-                                f"{spec.source_name}: missing key field '{key}' "
-                                f"on row {row_number}"
-                            ),
-                            severity="warning",
-                        )
+        consecutive_empty = 0
+        missing_keys = [key for key in spec.key_columns if key not in present]
+        if missing_keys:
+            for key in missing_keys:
+                row_issues.append(
+                    ValidationIssue(
+                        row_number=row_number,
+                        column_name=key,
+                        error_type="missing_key_field",
+                        message=(
+                            f"{spec.source_name}: missing key field '{key}' "
+                            f"on row {row_number}"
+                        ),
+                        severity="warning",
                     )
-                continue
+                )
+            yield row_number, None
+            continue
 
-            for warn_column in spec.warning_columns:
-                if _is_blank(normalized_row.get(warn_column)):
-                    row_issues.append(
-                        ValidationIssue(
-                            row_number=row_number,
-                            column_name=warn_column,
-                            error_type="missing_optional_field",
-                            message=(
-                                f"{spec.source_name}: missing optional field "
-                                f"'{warn_column}' on row {row_number}"
-                            ),
-                            severity="warning",
-                        )
+        for warn_column in spec.warning_columns:
+            if warn_column not in present:
+                row_issues.append(
+                    ValidationIssue(
+                        row_number=row_number,
+                        column_name=warn_column,
+                        error_type="missing_optional_field",
+                        message=(
+                            f"{spec.source_name}: missing optional field "
+                            f"'{warn_column}' on row {row_number}"
+                        ),
+                        severity="warning",
                     )
+                )
+        yield row_number, normalized_row
 
-            row_payloads.append((row_number, _serialize_row(spec.source_name, normalized_row)))
-            table_payloads.append(spec.row_mapper(normalized_row))
-            rows_inserted += 1
 
-        all_issues = [*issues, *row_issues]
-        if all_issues:
-            _log_warnings(all_issues, paths.run_id)
+class _MappedFile(mmap.mmap):
+    """Memory map exposing the seekable file protocol zipfile expects."""
 
-        with db.connect() as conn:
-            with conn:
-                if row_payloads:
-                    conn.executemany(
-                        "INSERT INTO raw_excel_rows (row_number, row_json) VALUES (?, ?);",
-                        row_payloads,
-                    )
-                if table_payloads:
-                    _insert_table_rows(conn, spec.table_name, table_payloads)
-                if all_issues:
-                    _insert_validation_issues(conn, all_issues)
-
-        warnings = tuple(issue for issue in all_issues if issue.severity == "warning")
-        return IngestionStats(
-            source_name=spec.source_name,
-            file_path=file_path,
-            rows_seen=rows_seen,
-            rows_inserted=rows_inserted,
-            warnings=warnings,
-        )
-    finally:
+    def seekable(self) -> bool:
+        return True
+
+
+def _load_workbook(file_path: Path) -> tuple[Any, Callable[[], None]]:
+    """Load a read-only workbook whose zip archive reads from a memory map.
+
+    The map is read-only, so the raw input file is never altered. Returns the
+    workbook and an idempotent callable that closes it and then the map.
+    """
+
+    with open(file_path, "rb") as handle:
+        mapped = _MappedFile(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        workbook = load_workbook(mapped, read_only=True, data_only=True, keep_links=False)
+    except BaseException:
+        mapped.close()
+        raise
+
+    def close() -> None:
         workbook.close()
+        mapped.close()
+
+    return workbook, close
 
 
 def _read_header_row(worksheet) -> Sequence[object] | None:
@@ -405,9 +713,10 @@ def _normalize_header(value: object) -> str:
 
     if value is None:
         return ""
-    if isinstance(value, str):
-        return value.strip().casefold()
-    return str(value).strip().casefold()
+    text = (value if isinstance(value, str) else str(value)).strip()
+    # For ASCII text lower() equals casefold() and skips the Unicode
+    # special-casing tables.
+    return text.lower() if text.isascii() else text.casefold()
 
 
 def _normalize_cell(value: object) -> object:
@@ -428,6 +737,74 @@ def _extract_row(row: Sequence[object], header_map: Mapping[str, int]) -> dict[s
     return normalized
 
 
+def _make_row_extractor(
+    header_map: Mapping[str, int],
+) -> Callable[[Sequence[object]], dict[str, object]]:
+    """Specialize _extract_row for one sheet's fixed header layout.
+
+    Column indices are bound once into an itemgetter so full-width rows are
+    picked in C; rows shorter than the header fall back to _extract_row.
+    """
+
+    headers = tuple(header_map)
+    indices = tuple(header_map.values())
+    if not indices:
+        return lambda row: {}
+    width = max(indices) + 1
+    pick = itemgetter(*indices)
+    single = len(indices) == 1
+
+    def extract(row: Sequence[object]) -> dict[str, object]:
+        if len(row) < width:
+            return _extract_row(row, header_map)
+        values = (pick(row),) if single else pick(row)
+        return dict(
+            zip(headers, [v.strip() if isinstance(v, str) else v for v in values])
+        )
+
+    return extract
+
+
+def _map_table_row(
+    row: Mapping[str, object], source_columns: Sequence[str | None]
+) -> list[object]:
+    """Build target-table values from a normalized row, one column at a time."""
+
+    get = row.get
+    return [None if source is None else _adapt_sql_value(get(source)) for source in source_columns]
+
+
+def _make_table_mapper(
+    spec: SheetSpec,
+    header_map: Mapping[str, int],
+) -> Callable[[Mapping[str, object]], list[object]]:
+    """Specialize _map_table_row for one sheet's spec and header layout.
+
+    When every mapped source is in the header and the NULL constant columns
+    trail the mapping, sources are fetched with one itemgetter and the
+    constants appended as a fixed tail; otherwise the generic path is used.
+    """
+
+    source_columns = spec.source_columns
+    mapped = tuple(source for source in source_columns if source is not None)
+    if (
+        not mapped
+        or source_columns[: len(mapped)] != mapped
+        or not all(source in header_map for source in mapped)
+    ):
+        return lambda row: _map_table_row(row, source_columns)
+    pick = itemgetter(*mapped)
+    single = len(mapped) == 1
+    tail = [None] * (len(source_columns) - len(mapped))
+    temporal = (datetime, date)
+
+    def map_row(row: Mapping[str, object]) -> list[object]:
+        values = (pick(row),) if single else pick(row)
+        return [v.isoformat() if isinstance(v, temporal) else v for v in values] + tail
+
+    return map_row
+
+
 def _is_blank(value: object) -> bool:
     if value is None:
         return True
@@ -436,15 +813,29 @@ def _is_blank(value: object) -> bool:
     return False
 
 
-def _is_empty_row(row: Mapping[str, object]) -> bool:
-    return all(_is_blank(value) for value in row.values())
+def _serialize_row(source_name: str, row: Mapping[str, object]) -> bytes:
+    """Serialize a row for raw storage with a source label.
 
+    Returns UTF-8 JSON bytes, which sqlite3 binds directly as a BLOB.
+    """
 
-def _serialize_row(source_name: str, row: Mapping[str, object]) -> str:
-    """Serialize a row for raw storage with a source label."""
-
+    if _ORJSON is not None:
+        # orjson encodes dates natively, so no per-value _json_safe pass.
+        return _ORJSON.dumps({"source": source_name, "row": row})
     payload = {"source": source_name, "row": {k: _json_safe(v) for k, v in row.items()}}
-    return json.dumps(payload, ensure_ascii=True)
+    return json.dumps(payload, ensure_ascii=True).encode("ascii")
+
+
+def _load_orjson() -> Any | None:
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except Exception:
+        return None
+    return orjson
+
+
+# Optional faster JSON encoder for raw rows; stdlib json is the fallback.
+_ORJSON = _load_orjson()
 
 
 def _json_safe(value: object) -> object:
@@ -459,50 +850,77 @@ def _adapt_sql_value(value: object) -> object:
     return value
 
 
-def _insert_table_rows(
+def _flush_rows(
     conn: sqlite3.Connection,
-    table_name: str,
-    rows: Iterable[Mapping[str, object]],
+    spec: SheetSpec,
+    raw_rows: list[tuple[int, bytes]],
+    table_rows: list[list[object]],
 ) -> None:
-    """Insert mapped rows into the target table."""
+    """Write one chunk of raw and mapped rows, then clear the buffers."""
 
-    rows_list = list(rows)
-    if not rows_list:
-        return
-    columns = list(rows_list[0].keys())
-    placeholders = ", ".join("?" for _ in columns)
-    column_list = ", ".join(columns)
-    sql = f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders});"
-    conn.executemany(
-        sql,
-        ([_adapt_sql_value(row.get(col)) for col in columns] for row in rows_list),
-    )
+    if raw_rows:
+        _bulk_insert(conn, RAW_INSERT_PREFIX, 2, raw_rows)
+        raw_rows.clear()
+    if table_rows:
+        _bulk_insert(conn, spec.insert_prefix, len(spec.ordered_columns), table_rows)
+        table_rows.clear()
+
+
+def _bulk_insert(
+    conn: sqlite3.Connection,
+    prefix: str,
+    width: int,
+    rows: Sequence[Sequence[object]],
+) -> None:
+    """Insert rows with multi-row VALUES statements.
+
+    Each statement binds at most SQLITE_MAX_PARAMS values, the historical
+    SQLite default limit.
+    """
+
+    batch = max(1, SQLITE_MAX_PARAMS // width)
+    for start in range(0, len(rows), batch):
+        chunk = rows[start : start + batch]
+        conn.execute(_values_sql(prefix, width, len(chunk)), list(chain.from_iterable(chunk)))
 
 
-def _persist_validation_issues(db: DatabaseLike, issues: Sequence[ValidationIssue]) -> None:
+def _persist_validation_issues(
+    conn: sqlite3.Connection, issues: Sequence[ValidationIssue]
+) -> None:
     """Persist validation issues in their own transaction."""
 
     if not issues:
         return
-    with db.connect() as conn:
-        with conn:
-            _insert_validation_issues(conn, issues)
+    with _immediate_transaction(conn):
+        _insert_validation_issues(conn, issues)
+
+
+@contextmanager
+def _immediate_transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """Run the block in an explicit ``BEGIN IMMEDIATE`` transaction.
+
+    Bulk connections run in autocommit mode, so the write lock is taken up
+    front and the lifecycle is spelled out rather than left to sqlite3.
+    """
+
+    conn.execute("BEGIN IMMEDIATE;")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK;")
+        raise
+    conn.execute("COMMIT;")
 
 
 def _insert_validation_issues(
     conn: sqlite3.Connection, issues: Sequence[ValidationIssue]
 ) -> None:
-    conn.executemany(
-        """
-        INSERT INTO validation_errors (
-            row_number,
-            column_name,
-            error_type,
-            message,
-            severity
-        )
-        VALUES (?, ?, ?, ?, ?);
-        """,
+    # Issues share the multi-row VALUES path with data rows; a sheet with
+    # many blank rows can produce thousands of them.
+    _bulk_insert(
+        conn,
+        VALIDATION_INSERT_PREFIX,
+        5,
         [
             (
                 issue.row_number,
@@ -7,6 +7,7 @@ WAL mode activation, and append-only enforcement for raw and validation data.
 
 from __future__ import annotations
 
+import os
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -44,13 +45,13 @@ CREATE TABLE metadata (
 );
 
 CREATE TABLE raw_excel_rows (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     row_number INTEGER NOT NULL,
-    row_json TEXT NOT NULL
+    row_json BLOB NOT NULL
 );
 
 CREATE TABLE validation_errors (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     row_number INTEGER,
     column_name TEXT,
     error_type TEXT NOT NULL,
@@ -84,6 +85,18 @@ END;
 """
 
 
+BULK_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA cache_size=-65536;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",
+)
+# Prepared statements kept per bulk connection. Ingestion prepares a full
+# and a tail multi-row INSERT per table, and each one is compiled together
+# with the append-only triggers, so all of them must stay cached.
+BULK_CACHED_STATEMENTS = 256
+
+
 class Database:
     """Run-scoped database wrapper with explicit connection management."""
 
@@ -99,10 +112,27 @@ class Database:
 
         return self._db_path
 
-    def connect(self) -> sqlite3.Connection:
-        """Create a new SQLite connection to the run database."""
+    def connect(self, *, bulk: bool = False) -> sqlite3.Connection:
+        """Create a new SQLite connection to the run database.
+
+        With ``bulk``, the connection is tuned for insert-heavy work: commits
+        no longer fsync under WAL, the page cache is enlarged, and the
+        connection runs in autocommit mode so callers issue their own
+        ``BEGIN IMMEDIATE``/``COMMIT``. Bulk connections may also be handed
+        to worker threads; callers must serialize access themselves.
+        """
 
-        return sqlite3.connect(self._db_path)
+        if not bulk:
+            return sqlite3.connect(self._db_path)
+        conn = sqlite3.connect(
+            self._db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=BULK_CACHED_STATEMENTS,
+        )
+        for pragma in BULK_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
     def initialize(self, metadata: RunMetadata) -> None:
         """Create the database, initialize schema, and insert run metadata.
@@ -115,8 +145,13 @@ class Database:
         if metadata.run_id != self._run_id:
             raise ValueError("Run metadata run_id must match runtime paths run_id.")
 
-        if self._db_path.exists():
-            raise FileExistsError(f"Run database already exists: {self._db_path}")
+        # Claim the file atomically so the "must not exist" check and the
+        # creation cannot race; sqlite3 then opens the empty file as a new DB.
+        try:
+            fd = os.open(self._db_path, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+        except FileExistsError:
+            raise FileExistsError(f"Run database already exists: {self._db_path}") from None
+        os.close(fd)
 
         conn = sqlite3.connect(self._db_path)
         try:
@@ -11,6 +11,7 @@ import os
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 APP_DIR_NAME = "InventoryComplianceReporter"
@@ -36,6 +37,21 @@ def _resolve_user_data_base() -> Path:
     return Path.home() / ".local" / "share"
 
 
+@lru_cache(maxsize=16)
+def _ensure_dir(path: Path) -> Path:
+    """Create a base directory once per process and return it.
+
+    Keyed on the path as built by the caller (not resolved), so a changed
+    data root gives a new key and is still honoured. A directory deleted
+    after its first call is not recreated by a cache hit; _reserve_run_dir
+    clears the cache and recreates it when that happens. Run directories
+    are not routed through here because run IDs vary.
+    """
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def get_app_data_dir() -> Path:
     """Return the per-user app data base directory.
 
@@ -44,9 +60,7 @@ def get_app_data_dir() -> Path:
     if it does not exist.
     """
 
-    base_dir = _resolve_user_data_base() / APP_DIR_NAME
-    base_dir.mkdir(parents=True, exist_ok=True)
-    return base_dir
+    return _ensure_dir(_resolve_user_data_base() / APP_DIR_NAME)
 
 
 def get_runs_base_dir() -> Path:
@@ -57,9 +71,7 @@ def get_runs_base_dir() -> Path:
     it does not exist.
     """
 
-    runs_dir = get_app_data_dir() / RUNS_DIR_NAME
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    return runs_dir
+    return _ensure_dir(get_app_data_dir() / RUNS_DIR_NAME)
 
 
 def get_run_dir(run_id: str) -> Path:
@@ -88,22 +100,32 @@ def _generate_run_id(suffix: str | None = None) -> str:
 
 
 def _reserve_run_dir(runs_base_dir: Path, run_id: str) -> tuple[str, Path]:
-    """Create a unique run directory under the runs base directory."""
+    """Create a unique run directory under the runs base directory.
+
+    The base directory normally already exists, so each attempt is a single
+    mkdir syscall that raises ``FileExistsError`` on collision. If the base
+    directory was removed since it was cached, the directory cache is
+    cleared, the base directory recreated, and the attempt retried.
+    """
 
     candidate = run_id
     counter = 1
     while True:
         run_dir = runs_base_dir / candidate
         try:
-            run_dir.mkdir(parents=True, exist_ok=False)
+            os.mkdir(run_dir)
         except FileExistsError:
             counter += 1
             candidate = f"{run_id}_{counter:02d}"
             continue
+        except FileNotFoundError:
+            _ensure_dir.cache_clear()
+            runs_base_dir.mkdir(parents=True, exist_ok=True)
+            continue
         return candidate, run_dir
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimePaths:
     """Resolved, run-scoped filesystem layout for a single execution."""
 
@@ -133,8 +155,9 @@ class RuntimePaths:
 
         resolved_run_id, run_dir = _reserve_run_dir(runs_base_dir, resolved_run_id)
         subdirs = {name: run_dir / name for name in RUN_SUBDIRS}
+        # The run directory was just created, so its subdirectories are new.
         for path in subdirs.values():
-            path.mkdir(parents=True, exist_ok=True)
+            os.mkdir(path)
 
         logs_dir = subdirs["logs"]
         log_file = logs_dir / "run.log"
@@ -7,11 +7,105 @@ Responsibilities:
 
 from __future__ import annotations
 
-from html import escape
-from typing import Any, Mapping, Sequence
+from functools import lru_cache
+from io import StringIO
+from operator import attrgetter
+from typing import Any, Callable, Mapping, Sequence
 
 from icr.backend.domain.models import IssueType
 
+# Same replacements as html.escape(quote=True), applied in one pass.
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+# Static page skeletons; only the %-placeholders vary per report, so literal
+# percent signs are written as %%.
+_BASE_STYLE = (
+    "body { font-family: Arial, sans-serif; color: #222; margin: 24px; }\n"
+    "h1, h2 { margin-bottom: 0.3em; }\n"
+    ".meta { margin: 0.2em 0; }\n"
+    "table { border-collapse: collapse; width: 100%%; margin-top: 12px; }\n"
+    "th, td { border: 1px solid #ccc; padding: 6px 8px; text-align: left; }\n"
+    "th { background: #f2f2f2; }\n"
+)
+
+_VESSEL_REPORT_HEAD = (
+    "<!doctype html>\n"
+    '<html lang="en">\n'
+    "<head>\n"
+    '<meta charset="utf-8">\n'
+    "<title>Vessel Report - %(ship_id)s</title>\n"
+    "<style>\n"
+    + _BASE_STYLE
+    + ".ok { color: #1b5e20; font-weight: bold; }\n"
+    "</style>\n"
+    "</head>\n"
+    "<body>\n"
+    "<h1>Inventory Compliance Report</h1>\n"
+    '<p class="meta"><strong>Vessel:</strong> %(vessel)s</p>\n'
+    '<p class="meta"><strong>Run timestamp:</strong> %(run_timestamp)s</p>\n'
+    "<h2>Source Files</h2>\n"
+)
+
+_VESSEL_REPORT_DISCREPANCIES = "\n<h2>Discrepancies</h2>\n"
+
+_RUN_SUMMARY_HEAD = (
+    "<!doctype html>\n"
+    '<html lang="en">\n'
+    "<head>\n"
+    '<meta charset="utf-8">\n'
+    "<title>Run Summary</title>\n"
+    "<style>\n"
+    + _BASE_STYLE
+    + "</style>\n"
+    "</head>\n"
+    "<body>\n"
+    "<h1>Run Summary</h1>\n"
+    '<p class="meta"><strong>Run timestamp:</strong> %(run_timestamp)s</p>\n'
+    '<p class="meta"><strong>Vessels processed:</strong> %(total)d</p>\n'
+    '<p class="meta"><strong>Vessels with issues:</strong> %(with_issues)d</p>\n'
+    '<p class="meta"><strong>Vessels with no issues:</strong> %(without_issues)d</p>\n'
+    "<h2>Vessels</h2>\n"
+)
+
+_REPORT_TAIL = "\n</body>\n</html>"
+
+# Report fragments are emitted through a bound StringIO.write.
+_Writer = Callable[[str], object]
+
+_ISSUE_TYPE_LABELS = {
+    IssueType.OUTDATED.value: "Outdated",
+    IssueType.MISSING_ONBOARD.value: "Missing onboard edition",
+    IssueType.MISSING_REFERENCE.value: "Missing reference edition",
+}
+
+_ISSUE_FIELDS = ("item", "onboard_edition", "current_edition", "issue_type")
+_ISSUE_ATTRS = attrgetter(*_ISSUE_FIELDS)
+
+_ISSUE_TABLE_HEAD = (
+    "<table>\n"
+    "<tr>"
+    "<th>Item</th>"
+    "<th>Onboard Edition</th>"
+    "<th>Current Edition</th>"
+    "<th>Issue Type</th>"
+    "</tr>\n"
+)
+
+_ISSUE_ROW = "<tr><td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>\n"
+_VESSEL_ROW_WITH_LINK = '<tr><td>%s</td><td>%s</td><td><a href="%s">%s</a></td></tr>\n'
+_VESSEL_ROW_NO_LINK = "<tr><td>%s</td><td>%s</td><td></td></tr>\n"
+
+_VESSEL_SUMMARY_TABLE_HEAD = (
+    "<table>\n"
+    "<tr>"
+    "<th>Vessel</th>"
+    "<th>Issue Count</th>"
+    "<th>Report File</th>"
+    "</tr>\n"
+)
+
 
 def render_vessel_report(
     vessel: Mapping[str, Any],
@@ -25,38 +119,26 @@ def render_vessel_report(
     ship_name = _coerce_text(vessel.get("ship_name"))
     vessel_label = _format_vessel_label(ship_id, ship_name)
 
-    lines = [
-        "<!doctype html>",
-        '<html lang="en">',
-        "<head>",
-        '<meta charset="utf-8">',
-        f"<title>Vessel Report - {escape(ship_id)}</title>",
-        "<style>",
-        "body { font-family: Arial, sans-serif; color: #222; margin: 24px; }",
-        "h1, h2 { margin-bottom: 0.3em; }",
-        ".meta { margin: 0.2em 0; }",
-        "table { border-collapse: collapse; width: 100%; margin-top: 12px; }",
-        "th, td { border: 1px solid #ccc; padding: 6px 8px; text-align: left; }",
-        "th { background: #f2f2f2; }",
-        ".ok { color: #1b5e20; font-weight: bold; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        "<h1>Inventory Compliance Report</h1>",
-        f'<p class="meta"><strong>Vessel:</strong> {escape(vessel_label)}</p>',
-        f'<p class="meta"><strong>Run timestamp:</strong> {escape(run_timestamp)}</p>',
-        "<h2>Source Files</h2>",
-        _render_source_files(source_files),
-        "<h2>Discrepancies</h2>",
-    ]
-
+    # Every fragment is written into one buffer; no section is built as an
+    # intermediate string first.
+    buf = StringIO()
+    write = buf.write
+    write(
+        _VESSEL_REPORT_HEAD
+        % {
+            "ship_id": _esc(ship_id),
+            "vessel": _esc(vessel_label),
+            "run_timestamp": _esc(run_timestamp),
+        }
+    )
+    _write_source_files(write, source_files)
+    write(_VESSEL_REPORT_DISCREPANCIES)
     if issues:
-        lines.append(_render_issue_table(issues))
+        _write_issue_table(write, issues)
     else:
-        lines.append('<p class="ok">No issues found for this vessel.</p>')
-
-    lines.extend(["</body>", "</html>"])
-    return "\n".join(lines)
+        write('<p class="ok">No issues found for this vessel.</p>')
+    write(_REPORT_TAIL)
+    return buf.getvalue()
 
 
 def render_run_summary(
@@ -65,106 +147,87 @@ def render_run_summary(
     run_timestamp: str,
 ) -> str:
     """Render a run-level summary report as HTML."""
-    total = len(vessels)
-    with_issues = sum(1 for vessel in vessels if _coerce_int(vessel.get("issue_count")) > 0)
+    # Each vessel's issue count is coerced once and shared with the table.
+    counted = [(vessel, _coerce_int(vessel.get("issue_count"))) for vessel in vessels]
+    total = len(counted)
+    with_issues = sum(1 for _, issue_count in counted if issue_count > 0)
     without_issues = total - with_issues
 
-    lines = [
-        "<!doctype html>",
-        '<html lang="en">',
-        "<head>",
-        '<meta charset="utf-8">',
-        "<title>Run Summary</title>",
-        "<style>",
-        "body { font-family: Arial, sans-serif; color: #222; margin: 24px; }",
-        "h1, h2 { margin-bottom: 0.3em; }",
-        ".meta { margin: 0.2em 0; }",
-        "table { border-collapse: collapse; width: 100%; margin-top: 12px; }",
-        "th, td { border: 1px solid #ccc; padding: 6px 8px; text-align: left; }",
-        "th { background: #f2f2f2; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        "<h1>Run Summary</h1>",
-        f'<p class="meta"><strong>Run timestamp:</strong> {escape(run_timestamp)}</p>',
-        f'<p class="meta"><strong>Vessels processed:</strong> {total}</p>',
-        f'<p class="meta"><strong>Vessels with issues:</strong> {with_issues}</p>',
-        f'<p class="meta"><strong>Vessels with no issues:</strong> {without_issues}</p>',
-        "<h2>Vessels</h2>",
-    ]
-
+    buf = StringIO()
+    write = buf.write
+    write(
+        _RUN_SUMMARY_HEAD
+        % {
+            "run_timestamp": _esc(run_timestamp),
+            "total": total,
+            "with_issues": with_issues,
+            "without_issues": without_issues,
+        }
+    )
     if vessels:
-        lines.append(_render_vessel_summary_table(vessels))
+        _write_vessel_summary_table(write, counted)
     else:
-        lines.append("<p>No vessels processed.</p>")
-
-    lines.extend(["</body>", "</html>"])
-    return "\n".join(lines)
+        write("<p>No vessels processed.</p>")
+    write(_REPORT_TAIL)
+    return buf.getvalue()
 
 
-def _render_source_files(source_files: Sequence[str]) -> str:
+def _write_source_files(write: _Writer, source_files: Sequence[str]) -> None:
     if not source_files:
-        return "<p>No source files provided.</p>"
-    items = "\n".join(f"<li>{escape(_coerce_text(name))}</li>" for name in source_files)
-    return f"<ul>\n{items}\n</ul>"
-
-
-def _render_issue_table(issues: Sequence[Any]) -> str:
-    rows = []
+        write("<p>No source files provided.</p>")
+        return
+    write("<ul>\n")
+    for name in source_files:
+        write("<li>")
+        write(_esc(_coerce_text(name)))
+        write("</li>\n")
+    write("</ul>")
+
+
+def _write_issue_table(write: _Writer, issues: Sequence[Any]) -> None:
+    write(_ISSUE_TABLE_HEAD)
+    # The record shape is probed once; rows of another type take the generic
+    # per-field lookup.
+    probe_type = type(issues[0]) if issues else None
+    read_fast = _issue_field_reader(issues[0]) if issues else _read_issue_generic
     for issue in issues:
-        item = _coerce_text(_get_field(issue, "item"))
-        onboard = _format_optional(_get_field(issue, "onboard_edition"))
-        current = _format_optional(_get_field(issue, "current_edition"))
-        issue_type = _format_issue_type(_get_field(issue, "issue_type"))
-        rows.append(
-            "<tr>"
-            f"<td>{escape(item)}</td>"
-            f"<td>{escape(onboard)}</td>"
-            f"<td>{escape(current)}</td>"
-            f"<td>{escape(issue_type)}</td>"
-            "</tr>"
+        read = read_fast if type(issue) is probe_type else _read_issue_generic
+        raw_item, raw_onboard, raw_current, raw_issue_type = read(issue)
+        item = _coerce_text(raw_item)
+        onboard = _format_optional(raw_onboard)
+        current = _format_optional(raw_current)
+        issue_type = _format_issue_type(raw_issue_type)
+        write(
+            _ISSUE_ROW
+            % (
+                _esc(item),
+                _escape_repeated(onboard),
+                _escape_repeated(current),
+                _escape_repeated(issue_type),
+            )
         )
-
-    header = (
-        "<tr>"
-        "<th>Item</th>"
-        "<th>Onboard Edition</th>"
-        "<th>Current Edition</th>"
-        "<th>Issue Type</th>"
-        "</tr>"
-    )
-    return f"<table>\n{header}\n" + "\n".join(rows) + "\n</table>"
+    write("</table>")
 
 
-def _render_vessel_summary_table(vessels: Sequence[Mapping[str, Any]]) -> str:
-    rows = []
-    for vessel in vessels:
+def _write_vessel_summary_table(
+    write: _Writer, counted: Sequence[tuple[Mapping[str, Any], int]]
+) -> None:
+    write(_VESSEL_SUMMARY_TABLE_HEAD)
+    for vessel, issue_count in counted:
         ship_id = _coerce_text(vessel.get("ship_id")) or "UNKNOWN"
         ship_name = _coerce_text(vessel.get("ship_name"))
         label = _format_vessel_label(ship_id, ship_name)
-        issue_count = _coerce_int(vessel.get("issue_count"))
         report_name = _coerce_text(vessel.get("report_filename"))
-        report_cell = escape(report_name)
         if report_name:
-            report_cell = f'<a href="{escape(report_name)}">{escape(report_name)}</a>'
-        rows.append(
-            "<tr>"
-            f"<td>{escape(label)}</td>"
-            f"<td>{issue_count}</td>"
-            f"<td>{report_cell}</td>"
-            "</tr>"
-        )
-
-    header = (
-        "<tr>"
-        "<th>Vessel</th>"
-        "<th>Issue Count</th>"
-        "<th>Report File</th>"
-        "</tr>"
-    )
-    return f"<table>\n{header}\n" + "\n".join(rows) + "\n</table>"
+            escaped_name = _esc(report_name)
+            write(_VESSEL_ROW_WITH_LINK % (_esc(label), issue_count, escaped_name, escaped_name))
+        else:
+            write(_VESSEL_ROW_NO_LINK % (_esc(label), issue_count))
+    write("</table>")
 
 
+# Shared by the run summary and each vessel report for the same vessel.
+@lru_cache(maxsize=1024)
 def _format_vessel_label(ship_id: str, ship_name: str | None) -> str:
     if ship_name:
         return f"{ship_id} - {ship_name}"
@@ -178,17 +241,64 @@ def _format_optional(value: Any) -> str:
     return text
 
 
+def _esc(text: str) -> str:
+    """Escape text for HTML content and attributes like ``html.escape``."""
+
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=512)
+def _escape_repeated(text: str) -> str:
+    """Escape cell text drawn from a small set of values (editions, types)."""
+
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
 def _format_issue_type(value: Any) -> str:
+    # IssueType is a StrEnum, so members and canonical labels hit the table
+    # directly; other strings share cache entries.
+    if isinstance(value, str):
+        label = _ISSUE_TYPE_LABELS.get(value)
+        if label is not None:
+            return label
+        return _format_issue_type_cached(value)
+    return _format_issue_type_uncached(value)
+
+
+@lru_cache(maxsize=16)
+def _format_issue_type_cached(value: str) -> str:
+    return _format_issue_type_uncached(value)
+
+
+def _format_issue_type_uncached(value: Any) -> str:
     if isinstance(value, IssueType):
         value = value.value
-    text = _coerce_text(value).upper()
-    if text == "OUTDATED":
-        return "Outdated"
-    if text == "MISSING_ONBOARD":
-        return "Missing onboard edition"
-    if text == "MISSING_REFERENCE":
-        return "Missing reference edition"
-    return _coerce_text(value) or "Unknown"
+    label = _ISSUE_TYPE_LABELS.get(_coerce_text(value).upper())
+    return label or _coerce_text(value) or "Unknown"
+
+
+def _issue_field_reader(probe: Any) -> Callable[[Any], tuple[Any, ...]]:
+    """Pick the issue-field reader matching ``_get_field`` for this shape."""
+
+    if isinstance(probe, Mapping) and not hasattr(probe, "item"):
+        return _read_issue_mapping
+    return _read_issue_attrs
+
+
+def _read_issue_mapping(issue: Mapping[str, Any]) -> tuple[Any, ...]:
+    get = issue.get
+    return get("item"), get("onboard_edition"), get("current_edition"), get("issue_type")
+
+
+def _read_issue_attrs(issue: Any) -> tuple[Any, ...]:
+    try:
+        return _ISSUE_ATTRS(issue)
+    except AttributeError:
+        return _read_issue_generic(issue)
+
+
+def _read_issue_generic(issue: Any) -> tuple[Any, ...]:
+    return tuple(_get_field(issue, field) for field in _ISSUE_FIELDS)
 
 
 def _get_field(record: Any, field: str) -> Any:
@@ -200,12 +310,17 @@ def _get_field(record: Any, field: str) -> Any:
 
 
 def _coerce_text(value: Any) -> str:
+    # Exact-type check first: nearly every value is already a plain str.
+    if type(value) is str:
+        return value
     if value is None:
         return ""
     return value if isinstance(value, str) else str(value)
 
 
 def _coerce_int(value: Any) -> int:
+    if type(value) is int:
+        return value
     if value is None:
         return 0
     if isinstance(value, int):
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
 from typing import Any, Protocol, TypeVar
 
 import icr.backend
@@ -10,6 +12,13 @@ from icr.frontend import messages, selection
 
 VesselT = TypeVar("VesselT")
 
+# Consecutive messages are joined so each reaches the IO layer in one call.
+_WELCOME_BLOCK = f"{messages.WELCOME['title']}\n{messages.WELCOME['body']}"
+
+# Summary keys shown on completion, in display order; each COMPLETION template
+# is formatted with the value under its own key.
+_SUMMARY_FIELDS = ("run_id", "vessels_processed", "vessels_with_issues", "total_issue_rows")
+
 
 class FrontendIO(Protocol):
     """UI-agnostic IO surface for the frontend workflow."""
@@ -27,8 +36,12 @@ class FrontendIO(Protocol):
 class ConsoleIO:
     """Terminal-based IO implementation for the frontend."""
 
+    __slots__ = ()
+
     def display(self, message: str) -> None:
-        print(message)
+        # One write without print()'s sep/end/file handling. sys.stdout is
+        # looked up per call so redirected streams are honoured.
+        sys.stdout.write(f"{message}\n")
 
     def prompt(self, message: str) -> str:
         return input(message)
@@ -56,14 +69,14 @@ def run_flow(
     resolved_backend = backend or icr.backend
 
     try:
-        if not _has_callable(resolved_backend, "discover_ams_vessels") or not _has_callable(
-            resolved_backend, "process_vessels"
-        ):
+        # Backend entry points are looked up once and reused below.
+        discover_vessels = getattr(resolved_backend, "discover_ams_vessels", None)
+        process_vessels = getattr(resolved_backend, "process_vessels", None)
+        if not callable(discover_vessels) or not callable(process_vessels):
             _display_error(resolved_io, messages.ERRORS["backend_unavailable"])
             return
 
-        resolved_io.display(messages.WELCOME["title"])
-        resolved_io.display(messages.WELCOME["body"])
+        resolved_io.display(_WELCOME_BLOCK)
 
         input_check = _get_callable(
             resolved_backend,
@@ -77,7 +90,7 @@ def run_flow(
         resolved_io.display(messages.PROGRESS["discovering_vessels"])
         vessels = _call_backend_with_result(
             resolved_io,
-            resolved_backend.discover_ams_vessels,
+            discover_vessels,
             messages.ERRORS["discover_vessels"],
         )
         if vessels is None:
@@ -96,15 +109,14 @@ def run_flow(
             resolved_io.display(messages.STATUS["selection_empty"])
             return
 
-        confirm_prompt = messages.PROMPTS["confirm_selection"].format(count=len(selected_ids))
-        if not resolved_io.confirm(confirm_prompt):
+        if not resolved_io.confirm(_confirm_selection_prompt(len(selected_ids))):
             resolved_io.display(messages.STATUS["selection_cancelled"])
             return
 
         resolved_io.display(messages.PROGRESS["processing"])
         summary = _call_backend_with_result(
             resolved_io,
-            lambda: resolved_backend.process_vessels(selected_ids),
+            lambda: process_vessels(selected_ids),
             messages.ERRORS["processing"],
         )
         if summary is None:
@@ -119,32 +131,23 @@ def run_flow(
 def _display_summary(io: FrontendIO, summary: object) -> None:
     if not isinstance(summary, Mapping):
         return
-    if "run_id" in summary:
-        io.display(messages.COMPLETION["run_id"].format(run_id=summary["run_id"]))
-    if "vessels_processed" in summary:
-        io.display(
-            messages.COMPLETION["vessels_processed"].format(
-                vessels_processed=summary["vessels_processed"],
-            )
-        )
-    if "vessels_with_issues" in summary:
-        io.display(
-            messages.COMPLETION["vessels_with_issues"].format(
-                vessels_with_issues=summary["vessels_with_issues"],
-            )
-        )
-    if "total_issue_rows" in summary:
-        io.display(
-            messages.COMPLETION["total_issue_rows"].format(
-                total_issue_rows=summary["total_issue_rows"],
-            )
-        )
+    lines = [
+        messages.COMPLETION[key].format_map({key: summary[key]})
+        for key in _SUMMARY_FIELDS
+        if key in summary
+    ]
+    if lines:
+        io.display("\n".join(lines))
+
+
+@lru_cache(maxsize=64)
+def _confirm_selection_prompt(count: int) -> str:
+    # Repeated runs usually confirm the same few selection sizes.
+    return messages.PROMPTS["confirm_selection"].format(count=count)
 
 
 def _display_error(io: FrontendIO, error: Mapping[str, str]) -> None:
-    io.display(error["title"])
-    io.display(error["body"])
-    io.display(error["next_step"])
+    io.display(f"{error['title']}\n{error['body']}\n{error['next_step']}")
 
 
 def _call_backend(
@@ -172,12 +175,9 @@ def _call_backend_with_result(
         return None
 
 
-def _has_callable(backend: Any, name: str) -> bool:
-    return callable(getattr(backend, name, None))
-
-
 def _get_callable(backend: Any, names: Sequence[str]) -> Callable[[], Any] | None:
     for name in names:
-        if callable(getattr(backend, name, None)):
-            return getattr(backend, name)
+        func = getattr(backend, name, None)
+        if callable(func):
+            return func
     return None
@@ -9,6 +9,24 @@ from icr.frontend import messages
 
 VesselT = TypeVar("VesselT")
 
+# Static parts of the selection screen, joined once at import.
+_HEADER_BLOCK = "\n".join(
+    (
+        messages.SELECTION["title"],
+        messages.SELECTION["instructions"],
+        messages.SELECTION["list_header"],
+    )
+)
+_STATIC_OPTIONS = "\n".join(
+    (
+        messages.SELECTION["options_header"],
+        messages.SELECTION["option_all"],
+        messages.SELECTION["option_none"],
+        messages.SELECTION["option_toggle"],
+        messages.SELECTION["option_done"],
+    )
+)
+
 
 class SelectionIO(Protocol):
     """UI-agnostic interface for vessel selection prompts."""
@@ -37,36 +55,46 @@ def select_vessels(
     id_getter = get_vessel_id or _default_vessel_id
     label_getter = get_vessel_label or _default_vessel_label
     vessel_ids = [id_getter(vessel) for vessel in vessel_list]
+    vessel_id_set = frozenset(vessel_ids)
     vessel_labels = [label_getter(vessel) for vessel in vessel_list]
+    # The vessel list does not change between redraws, so it is formatted once.
+    format_item = messages.SELECTION["list_item"].format
+    screen_head = "\n".join(
+        [
+            _HEADER_BLOCK,
+            *(
+                format_item(identifier=vessel_id, label=vessel_label)
+                for vessel_id, vessel_label in zip(vessel_ids, vessel_labels, strict=False)
+            ),
+        ]
+    )
     selected_ids: set[str] = set()
 
     while True:
         _display_selection(
             io,
-            vessel_ids=vessel_ids,
-            vessel_labels=vessel_labels,
-            selected_ids=selected_ids,
+            screen_head=screen_head,
+            selected_count=len(selected_ids),
+            total_count=len(vessel_ids),
         )
         action = io.prompt(messages.SELECTION["prompt_action"]).strip().lower()
-        if action in {"a", "all"}:
-            selected_ids = set(vessel_ids)
-            continue
-        if action in {"n", "none"}:
-            selected_ids.clear()
+        handler = _ACTIONS.get(action)
+        if handler is not None:
+            selected_ids = handler(io, vessel_id_set, selected_ids)
             continue
-        if action in {"t", "toggle"}:
-            selected_ids = _handle_toggle(io, vessel_ids, selected_ids)
-            continue
-        if action in {"d", "done"}:
+        if action in _DONE_ACTIONS:
             break
         io.display(messages.SELECTION["invalid_action"])
 
-    return [vessel_id for vessel_id in vessel_ids if vessel_id in selected_ids]
+    # Original order is preserved; the filter loop runs in C.
+    return list(filter(selected_ids.__contains__, vessel_ids))
 
 
-def _handle_toggle(io: SelectionIO, vessel_ids: list[str], selected_ids: set[str]) -> set[str]:
+def _handle_toggle(
+    io: SelectionIO, vessel_id_set: frozenset[str], selected_ids: set[str]
+) -> set[str]:
     vessel_id = io.prompt(messages.SELECTION["prompt_toggle"]).strip()
-    if vessel_id not in vessel_ids:
+    if vessel_id not in vessel_id_set:
         io.display(messages.SELECTION["invalid_toggle"].format(vessel_id=vessel_id))
         return selected_ids
     updated = set(selected_ids)
@@ -77,34 +105,44 @@ def _handle_toggle(io: SelectionIO, vessel_ids: list[str], selected_ids: set[str
     return updated
 
 
+def _select_all(
+    io: SelectionIO, vessel_id_set: frozenset[str], selected_ids: set[str]
+) -> set[str]:
+    # The identifier set is frozen; the selection itself stays mutable.
+    return set(vessel_id_set)
+
+
+def _select_none(
+    io: SelectionIO, vessel_id_set: frozenset[str], selected_ids: set[str]
+) -> set[str]:
+    return set()
+
+
+# Action keyword -> handler returning the new selection; "done" ends the loop.
+_ACTIONS: dict[str, Callable[[SelectionIO, frozenset[str], set[str]], set[str]]] = {
+    "a": _select_all,
+    "all": _select_all,
+    "n": _select_none,
+    "none": _select_none,
+    "t": _handle_toggle,
+    "toggle": _handle_toggle,
+}
+_DONE_ACTIONS = frozenset({"d", "done"})
+
+
 def _display_selection(
     io: SelectionIO,
     *,
-    vessel_ids: list[str],
-    vessel_labels: list[str],
-    selected_ids: set[str],
+    screen_head: str,
+    selected_count: int,
+    total_count: int,
 ) -> None:
-    io.display(messages.SELECTION["title"])
-    io.display(messages.SELECTION["instructions"])
-    io.display(messages.SELECTION["list_header"])
-    for vessel_id, vessel_label in zip(vessel_ids, vessel_labels, strict=False):
-        io.display(
-            messages.SELECTION["list_item"].format(
-                identifier=vessel_id,
-                label=vessel_label,
-            )
-        )
-    io.display(
-        messages.SELECTION["selected_count"].format(
-            selected_count=len(selected_ids),
-            total_count=len(vessel_ids),
-        )
+    # One display call per redraw instead of one per line.
+    count_line = messages.SELECTION["selected_count"].format(
+        selected_count=selected_count,
+        total_count=total_count,
     )
-    io.display(messages.SELECTION["options_header"])
-    io.display(messages.SELECTION["option_all"])
-    io.display(messages.SELECTION["option_none"])
-    io.display(messages.SELECTION["option_toggle"])
-    io.display(messages.SELECTION["option_done"])
+    io.display(f"{screen_head}\n{count_line}\n{_STATIC_OPTIONS}")
 
 
 def _default_vessel_id(vessel: VesselT) -> str:
@@ -0,0 +1,18 @@
+"""Assertion helpers shared by test modules."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+
+def assert_all(items: Iterable[object], **predicates: Callable[[object], object]) -> None:
+    """Assert every predicate holds for every item, in a single pass.
+
+    Predicates are named by keyword so a failure reports which check broke
+    and on which item.
+    """
+
+    checks = tuple(predicates.items())
+    for position, item in enumerate(items):
+        for name, predicate in checks:
+            assert predicate(item), f"{name} failed for item {position}: {item!r}"
@@ -0,0 +1,11 @@
+"""Fakes shared by test modules."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True, slots=True)
+class FakeRunPaths:
+    output_dir: Path
@@ -0,0 +1,52 @@
+"""Filesystem helpers shared by test modules."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+
+def fingerprint(path: Path) -> tuple[int, int, bytes]:
+    """Return ``(size, mtime_ns, digest)`` for ``path`` from one open."""
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        info = os.fstat(fd)
+        data = os.read(fd, info.st_size)
+    finally:
+        os.close(fd)
+    return info.st_size, info.st_mtime_ns, hashlib.blake2b(data, digest_size=16).digest()
+
+
+def bulk_write(items: list[tuple[Path, bytes]]) -> None:
+    """Write each ``(path, content)`` pair, opening each parent directory once.
+
+    Files are created relative to a directory descriptor (``openat``) where
+    the platform supports it, so the parent path is resolved once per
+    directory rather than once per file.
+    """
+
+    if os.open not in os.supports_dir_fd:
+        for path, content in items:
+            path.write_bytes(content)
+        return
+
+    by_dir: dict[Path, list[tuple[str, bytes]]] = {}
+    for path, content in items:
+        by_dir.setdefault(path.parent, []).append((path.name, content))
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    for directory, files in by_dir.items():
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for name, content in files:
+                fd = os.open(name, flags, 0o644, dir_fd=dir_fd)
+                try:
+                    view = memoryview(content)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                finally:
+                    os.close(fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from icr.backend.delivery._fsutil import iter_files_with_suffix
+from icr.backend.delivery import _stem_index as stem_index
+from icr.backend.delivery._stem_index import StemIndex
+
+
+def test_exact_stem_match_is_case_insensitive() -> None:
+    index = StemIndex.build([Path("emails/vessel_a_extra.eml"), Path("emails/VESSEL_A.eml")])
+
+    assert index.find("vessel_a") == Path("emails/VESSEL_A.eml")
+
+
+def test_substring_match_prefers_shortest_stem() -> None:
+    index = StemIndex.build(
+        [
+            Path("emails/run_VESSEL_A_final.eml"),
+            Path("emails/x_VESSEL_A.eml"),
+            Path("emails/VESSEL_B.eml"),
+        ]
+    )
+
+    assert index.find("VESSEL_A") == Path("emails/x_VESSEL_A.eml")
+
+
+def test_short_keys_fall_back_to_full_scan() -> None:
+    index = StemIndex.build([Path("reports/ship_7x.html"), Path("reports/other.html")])
+
+    assert index.find("7x") == Path("reports/ship_7x.html")
+
+
+def test_no_match_returns_none() -> None:
+    index = StemIndex.build([Path("emails/VESSEL_A.eml")])
+
+    assert index.find("VESSEL_Z") is None
+    assert index.find("   ") is None
+
+
+def test_iter_files_with_suffix_walks_nested_dirs(tmp_path: Path) -> None:
+    (tmp_path / "emails" / "nested").mkdir(parents=True)
+    (tmp_path / "emails" / "VESSEL_B.eml").write_bytes(b"b")
+    (tmp_path / "emails" / "nested" / "VESSEL_A.eml").write_bytes(b"a")
+    (tmp_path / "emails" / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "emails" / "dir.eml").mkdir()
+
+    assert iter_files_with_suffix(tmp_path, ".eml") == [
+        tmp_path / "emails" / "VESSEL_B.eml",
+        tmp_path / "emails" / "nested" / "VESSEL_A.eml",
+    ]
+    assert iter_files_with_suffix(tmp_path / "missing", ".eml") == []
+
+
+class _NaiveAutomaton:
+    def __init__(self) -> None:
+        self.words: dict[str, str] = {}
+
+    def add_word(self, key: str, value: str) -> None:
+        self.words[key] = value
+
+    def make_automaton(self) -> None:
+        return None
+
+    def iter(self, haystack: str):
+        for key, value in self.words.items():
+            start = haystack.find(key)
+            while start != -1:
+                yield start + len(key) - 1, value
+                start = haystack.find(key, start + 1)
+
+
+def test_large_batches_precompute_substring_hits(monkeypatch) -> None:
+    monkeypatch.setattr(stem_index, "_AUTOMATON_MIN_PAIRS", 1)
+    monkeypatch.setattr(stem_index, "_load_automaton", _NaiveAutomaton)
+
+    index = StemIndex.build(
+        [Path("a/run_VESSEL_A_final.eml"), Path("a/x_VESSEL_A.eml"), Path("a/VESSEL_B.eml")],
+        keys=["VESSEL_A", "VESSEL_B", "VESSEL_Z"],
+    )
+
+    assert index.substring_hits == {"vessel_a": 1, "vessel_z": None}
+    assert index.find("VESSEL_A") == Path("a/x_VESSEL_A.eml")
+    assert index.find("VESSEL_B") == Path("a/VESSEL_B.eml")
+    assert index.find("VESSEL_Z") is None
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from icr.backend.delivery import DeliveryResults
+
+
+@dataclass(frozen=True)
+class _Result:
+    vessel_id: str
+    status: str
+
+
+def _results(*pairs: tuple[str, str]) -> DeliveryResults[_Result]:
+    return DeliveryResults(
+        [_Result(vessel_id, status) for vessel_id, status in pairs],
+        key=lambda result: result.vessel_id,
+    )
+
+
+def test_delivery_results_behave_as_sequence() -> None:
+    results = _results(("VESSEL_A", "sent"), ("VESSEL_B", "failed"))
+
+    assert len(results) == 2
+    assert [result.vessel_id for result in results] == ["VESSEL_A", "VESSEL_B"]
+    assert results[0].status == "sent"
+    assert results[-1].status == "failed"
+    assert results[:1] == [_Result("VESSEL_A", "sent")]
+    assert results == [_Result("VESSEL_A", "sent"), _Result("VESSEL_B", "failed")]
+    assert _Result("VESSEL_B", "failed") in results
+
+
+def test_delivery_results_lookup_by_vessel_id() -> None:
+    results = _results(("VESSEL_A", "sent"), ("UNKNOWN", "skipped"), ("UNKNOWN", "failed"))
+
+    assert results["VESSEL_A"].status == "sent"
+    assert "VESSEL_A" in results
+    assert "VESSEL_Z" not in results
+    assert results.get("VESSEL_Z") is None
+    assert list(results.keys()) == ["VESSEL_A", "UNKNOWN"]
+    # Repeated ids resolve to the last result, like a dict comprehension.
+    assert results["UNKNOWN"].status == "failed"
+    with pytest.raises(KeyError):
+        results["VESSEL_Z"]
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from icr.backend.delivery.email import dispatch
 from icr.backend.delivery.email.models import EmailDeliveryPlan
+from icr.backend.delivery.email.transports import smtp
 from icr.backend.delivery.email.transports.base import TransportResult
-
-
-@dataclass
-class FakeRunPaths:
-    output_dir: Path
+from icr.backend.delivery.email.transports.smtp import SmtpConfig, SmtpTransport
+from tests._assertions import assert_all
+from tests._fakes import FakeRunPaths
+from tests._fsutil import bulk_write, fingerprint
 
 
 class FakeEmailTransport:
@@ -39,7 +43,9 @@ def run_paths(tmp_path: Path) -> FakeRunPaths:
     return FakeRunPaths(output_dir=tmp_path / "output")
 
 
-@pytest.fixture
+# Vessel rows are read-only in every test, so one list serves the session;
+# draft files stay per-test because several tests assert on a clean tree.
+@pytest.fixture(scope="session")
 def vessels() -> list[dict[str, str]]:
     return [
         {"ship_id": "VESSEL_A", "eml_filename": "emails/VESSEL_A.eml"},
@@ -51,11 +57,8 @@ def vessels() -> list[dict[str, str]]:
 def eml_drafts(run_paths: FakeRunPaths, vessels: list[dict[str, str]]) -> dict[str, Path]:
     drafts_dir = run_paths.output_dir / "emails"
     drafts_dir.mkdir(parents=True, exist_ok=True)
-    created: dict[str, Path] = {}
-    for vessel in vessels:
-        path = drafts_dir / f"{vessel['ship_id']}.eml"
-        path.write_bytes(b"DUMMY-EML")
-        created[vessel["ship_id"]] = path
+    created = {vessel["ship_id"]: drafts_dir / f"{vessel['ship_id']}.eml" for vessel in vessels}
+    bulk_write([(path, b"DUMMY-EML") for path in created.values()])
     return created
 
 
@@ -75,8 +78,11 @@ def test_email_delivery_disabled_skips_all(
     )
 
     assert len(results) == len(vessels)
-    assert all(result.status == "skipped" for result in results)
-    assert all("disabled" in (result.reason or "").lower() for result in results)
+    assert_all(
+        results,
+        skipped=lambda result: result.status == "skipped",
+        disabled_reason=lambda result: "disabled" in (result.reason or "").lower(),
+    )
 
 
 def test_email_delivery_not_confirmed(
@@ -95,8 +101,11 @@ def test_email_delivery_not_confirmed(
     )
 
     assert len(results) == len(vessels)
-    assert all(result.status == "skipped" for result in results)
-    assert all("confirm" in (result.reason or "").lower() for result in results)
+    assert_all(
+        results,
+        skipped=lambda result: result.status == "skipped",
+        confirm_reason=lambda result: "confirm" in (result.reason or "").lower(),
+    )
 
 
 def test_email_missing_draft_is_skipped(
@@ -119,7 +128,7 @@ def test_email_missing_draft_is_skipped(
         logger=None,
     )
 
-    by_vessel = {result.vessel_id: result for result in results}
+    by_vessel = results
     assert by_vessel["VESSEL_C"].status == "skipped"
     assert "draft" in (by_vessel["VESSEL_C"].reason or "").lower()
     assert by_vessel["VESSEL_A"].status == "sent"
@@ -167,7 +176,7 @@ def test_email_delivery_failure_isolated(
         logger=None,
     )
 
-    by_vessel = {result.vessel_id: result for result in results}
+    by_vessel = results
     assert by_vessel["VESSEL_B"].status == "failed"
     assert by_vessel["VESSEL_A"].status == "sent"
     assert len(results) == len(vessels)
@@ -219,8 +228,7 @@ def test_email_delivery_does_not_modify_eml(
     )
 
     eml_path = eml_drafts["VESSEL_A"]
-    before_bytes = eml_path.read_bytes()
-    before_mtime = eml_path.stat().st_mtime_ns
+    before = fingerprint(eml_path)
 
     dispatch.deliver_emails(
         run_paths,
@@ -229,8 +237,500 @@ def test_email_delivery_does_not_modify_eml(
         logger=None,
     )
 
-    after_bytes = eml_path.read_bytes()
-    after_mtime = eml_path.stat().st_mtime_ns
+    assert fingerprint(eml_path) == before
+
+
+class FakeSmtpServer:
+    instances: list["FakeSmtpServer"] = []
+
+    def __init__(self, host: str, port: int, timeout: int) -> None:
+        self.sent: list[bytes] = []
+        self.noops = 0
+        self.quit_called = False
+        FakeSmtpServer.instances.append(self)
+
+    def starttls(self) -> None:
+        return None
+
+    def login(self, username: str, password: str) -> None:
+        return None
+
+    def noop(self) -> tuple[int, bytes]:
+        self.noops += 1
+        return (250, b"OK")
+
+    def sendmail(self, from_addr: str, to_addrs: list[str], msg: bytes) -> dict[str, object]:
+        self.sent.append(msg)
+        return {}
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+    def close(self) -> None:
+        return None
+
+
+def test_smtp_transport_reuses_connection_across_vessels(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], eml_drafts: dict[str, Path], monkeypatch
+) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+
+    plan = EmailDeliveryPlan(
+        send_now=True,
+        confirm_send=True,
+        transport="smtp",
+        transport_config={
+            "host": "example.com",
+            "port": 587,
+            "envelope_from": "sender@example.com",
+            "envelope_to": ("rcpt@example.com",),
+        },
+    )
+
+    results = dispatch.deliver_emails(run_paths, vessels, plan, logger=None)
+
+    assert [result.status for result in results] == ["sent", "sent"]
+    assert len(FakeSmtpServer.instances) == 1
+    server = FakeSmtpServer.instances[0]
+    assert server.sent == [b"DUMMY-EML", b"DUMMY-EML"]
+    assert server.quit_called
+
+
+def test_smtp_transport_reconnects_when_session_drops(tmp_path: Path, monkeypatch) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+
+    eml_path = tmp_path / "VESSEL_A.eml"
+    eml_path.write_bytes(b"DUMMY-EML")
+    config = SmtpConfig(
+        host="example.com",
+        port=587,
+        envelope_from="sender@example.com",
+        envelope_to=("rcpt@example.com",),
+    )
+
+    with SmtpTransport(config) as transport:
+        assert transport.send(eml_path).success
 
-    assert before_bytes == after_bytes
-    assert before_mtime == after_mtime
+        def _dropped() -> tuple[int, bytes]:
+            raise smtplib.SMTPServerDisconnected("gone")
+
+        FakeSmtpServer.instances[0].noop = _dropped  # type: ignore[method-assign]
+        assert transport.send(eml_path).success
+
+    assert len(FakeSmtpServer.instances) == 2
+    assert FakeSmtpServer.instances[1].sent == [b"DUMMY-EML"]
+
+
+def test_smtp_transport_serializes_sends_on_shared_session(
+    tmp_path: Path, monkeypatch
+) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+    eml_path = tmp_path / "VESSEL_A.eml"
+    eml_path.write_bytes(b"DUMMY-EML")
+    config = SmtpConfig(
+        host="example.com",
+        port=587,
+        envelope_from="sender@example.com",
+        envelope_to=("rcpt@example.com",),
+        messages_per_connection=None,
+    )
+    active = 0
+    overlaps: list[int] = []
+    original_sendmail = FakeSmtpServer.sendmail
+
+    def _slow_sendmail(self, *args: object) -> dict[str, object]:
+        nonlocal active
+        active += 1
+        overlaps.append(active)
+        time.sleep(0.001)
+        active -= 1
+        return original_sendmail(self, *args)
+
+    monkeypatch.setattr(FakeSmtpServer, "sendmail", _slow_sendmail)
+
+    with SmtpTransport(config) as transport:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(lambda _: transport.send(eml_path), range(8)))
+
+    assert all(outcome.success for outcome in outcomes)
+    assert max(overlaps) == 1
+    assert len(FakeSmtpServer.instances) == 1
+
+
+def _smtp_plan(**kwargs: object) -> EmailDeliveryPlan:
+    return EmailDeliveryPlan(
+        send_now=True,
+        confirm_send=True,
+        transport="smtp",
+        transport_config={
+            "host": "example.com",
+            "port": 587,
+            "envelope_from": "sender@example.com",
+            "envelope_to": ("rcpt@example.com",),
+        },
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_email_delivery_concurrent_workers_preserve_order(
+    run_paths: FakeRunPaths, monkeypatch
+) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+
+    drafts_dir = run_paths.output_dir / "emails"
+    drafts_dir.mkdir(parents=True)
+    vessel_ids = [f"VESSEL_{index}" for index in range(5)]
+    for vessel_id in vessel_ids:
+        (drafts_dir / f"{vessel_id}.eml").write_bytes(vessel_id.encode("ascii"))
+
+    results = dispatch.deliver_emails(run_paths, vessel_ids, _smtp_plan(concurrency=2), logger=None)
+
+    assert [result.vessel_id for result in results] == vessel_ids
+    assert all(result.status == "sent" for result in results)
+    assert 1 <= len(FakeSmtpServer.instances) <= 2
+    sent = sorted(msg for server in FakeSmtpServer.instances for msg in server.sent)
+    assert sent == sorted(vessel_id.encode("ascii") for vessel_id in vessel_ids)
+
+
+def test_email_delivery_recycles_connection_after_cap(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], eml_drafts: dict[str, Path], monkeypatch
+) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+
+    results = dispatch.deliver_emails(
+        run_paths, vessels, _smtp_plan(max_per_connection=1), logger=None
+    )
+
+    assert all(result.status == "sent" for result in results)
+    assert len(FakeSmtpServer.instances) == 2
+    assert all(server.quit_called for server in FakeSmtpServer.instances)
+
+
+
+def test_plan_connection_cap_overrides_smtp_config() -> None:
+    capped = dispatch._resolve_smtp_config(_smtp_plan(max_per_connection=3))
+    default = dispatch._resolve_smtp_config(_smtp_plan())
+
+    assert capped.messages_per_connection == 3
+    assert default.messages_per_connection == SmtpConfig("h", 25).messages_per_connection
+
+
+class FlakyTransport:
+    name = "flaky"
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.loads = 0
+        self.sends = 0
+        self.closes = 0
+
+    def load(self, eml_path: Path) -> bytes:
+        self.loads += 1
+        return eml_path.read_bytes()
+
+    def send(self, eml_path: Path) -> TransportResult:
+        return self.send_bytes(self.load(eml_path))
+
+    def send_bytes(self, eml_bytes: bytes) -> TransportResult:
+        self.sends += 1
+        if self.sends <= self.failures:
+            raise smtplib.SMTPServerDisconnected("dropped")
+        return TransportResult(success=True, provider_message_id="msg-1", error=None)
+
+    def close(self) -> None:
+        self.closes += 1
+
+
+def test_email_delivery_retries_transient_failures(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], eml_drafts: dict[str, Path], monkeypatch
+) -> None:
+    transport = FlakyTransport(failures=2)
+    delays: list[float] = []
+    monkeypatch.setattr(dispatch.time, "sleep", delays.append)
+    monkeypatch.setattr(
+        dispatch,
+        "_resolve_transport",
+        lambda _: dispatch._ResolvedTransport(transport, "flaky", None),  # type: ignore[attr-defined]
+    )
+
+    results = dispatch.deliver_emails(
+        run_paths,
+        vessels[:1],
+        EmailDeliveryPlan(
+            send_now=True,
+            confirm_send=True,
+            transport="flaky",
+            max_retries=3,
+            retry_base_seconds=0.0,
+        ),
+        logger=None,
+    )
+
+    assert results[0].status == "sent"
+    assert transport.sends == 3
+    assert transport.loads == 1
+    assert transport.closes == 2
+    assert len(delays) == 2
+
+
+def test_email_delivery_gives_up_after_max_retries(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], eml_drafts: dict[str, Path], monkeypatch
+) -> None:
+    transport = FlakyTransport(failures=5)
+    monkeypatch.setattr(dispatch.time, "sleep", lambda _: None)
+    monkeypatch.setattr(
+        dispatch,
+        "_resolve_transport",
+        lambda _: dispatch._ResolvedTransport(transport, "flaky", None),  # type: ignore[attr-defined]
+    )
+
+    results = dispatch.deliver_emails(
+        run_paths,
+        vessels[:1],
+        EmailDeliveryPlan(send_now=True, confirm_send=True, transport="flaky", max_retries=1),
+        logger=None,
+    )
+
+    assert results[0].status == "failed"
+    assert "SMTPServerDisconnected" in (results[0].reason or "")
+    assert transport.sends == 2
+
+
+def test_email_delivery_skips_directory_walk_for_explicit_paths(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], eml_drafts: dict[str, Path], monkeypatch
+) -> None:
+    def _no_walk(_: Path) -> list[Path]:
+        raise AssertionError("explicit draft paths should not trigger a directory walk")
+
+    transport = FakeEmailTransport()
+    monkeypatch.setattr(dispatch, "_list_eml_files", _no_walk)
+    monkeypatch.setattr(
+        dispatch,
+        "_resolve_transport",
+        lambda _: dispatch._ResolvedTransport(transport, "fake", None),  # type: ignore[attr-defined]
+    )
+
+    results = dispatch.deliver_emails(
+        run_paths,
+        vessels,
+        EmailDeliveryPlan(send_now=True, confirm_send=True, transport="fake"),
+        logger=None,
+    )
+
+    assert all(result.status == "sent" for result in results)
+
+
+def test_smtp_transport_recycles_session_at_message_cap(tmp_path: Path, monkeypatch) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+
+    eml_path = tmp_path / "VESSEL_A.eml"
+    eml_path.write_bytes(b"DUMMY-EML")
+    config = SmtpConfig(
+        host="example.com",
+        port=587,
+        envelope_from="sender@example.com",
+        envelope_to=("rcpt@example.com",),
+        messages_per_connection=2,
+    )
+
+    with SmtpTransport(config) as transport:
+        for _ in range(5):
+            assert transport.send(eml_path).success
+
+    assert [len(server.sent) for server in FakeSmtpServer.instances] == [2, 2, 1]
+    assert all(server.quit_called for server in FakeSmtpServer.instances)
+
+
+def test_smtp_missing_envelope_skips_all(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], eml_drafts: dict[str, Path], monkeypatch
+) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+
+    plan = EmailDeliveryPlan(
+        send_now=True,
+        confirm_send=True,
+        transport="smtp",
+        transport_config={"host": "example.com", "port": 587, "envelope_from": "sender@example.com"},
+    )
+
+    results = dispatch.deliver_emails(run_paths, vessels, plan, logger=None)
+
+    assert all(result.status == "skipped" for result in results)
+    assert all(result.reason == "Missing SMTP envelope_to configuration." for result in results)
+    assert FakeSmtpServer.instances == []
+
+
+class FakeAioSmtp:
+    instances: list["FakeAioSmtp"] = []
+
+    def __init__(self, **kwargs: object) -> None:
+        self.kwargs = kwargs
+        self.sent: list[bytes] = []
+        self.quit_called = False
+        FakeAioSmtp.instances.append(self)
+
+    async def connect(self) -> None:
+        return None
+
+    async def login(self, username: str, password: str) -> None:
+        return None
+
+    async def sendmail(
+        self, sender: str, recipients: tuple[str, ...], message: bytes
+    ) -> tuple[dict[str, object], str]:
+        self.sent.append(message)
+        return {}, "OK"
+
+    async def quit(self) -> None:
+        self.quit_called = True
+
+    def close(self) -> None:
+        return None
+
+
+class FakeAioSmtplib:
+    SMTP = FakeAioSmtp
+
+
+def test_email_delivery_async_pool(run_paths: FakeRunPaths, monkeypatch) -> None:
+    FakeAioSmtp.instances = []
+    monkeypatch.setattr(dispatch, "load_aiosmtplib", lambda: FakeAioSmtplib)
+
+    drafts_dir = run_paths.output_dir / "emails"
+    drafts_dir.mkdir(parents=True)
+    vessel_ids = [f"VESSEL_{index}" for index in range(4)] + ["VESSEL_MISSING"]
+    for vessel_id in vessel_ids[:-1]:
+        (drafts_dir / f"{vessel_id}.eml").write_bytes(vessel_id.encode("ascii"))
+
+    results = dispatch.deliver_emails(
+        run_paths, vessel_ids, _smtp_plan(async_concurrency=2), logger=None
+    )
+
+    assert [result.vessel_id for result in results] == vessel_ids
+    assert [result.status for result in results] == ["sent"] * 4 + ["skipped"]
+    assert len(FakeAioSmtp.instances) <= 2
+    assert all(client.quit_called for client in FakeAioSmtp.instances)
+    sent = sorted(msg for client in FakeAioSmtp.instances for msg in client.sent)
+    assert sent == sorted(vessel_id.encode("ascii") for vessel_id in vessel_ids[:-1])
+
+
+def test_email_delivery_async_loads_drafts_off_event_loop(
+    run_paths: FakeRunPaths, monkeypatch
+) -> None:
+    FakeAioSmtp.instances = []
+    monkeypatch.setattr(dispatch, "load_aiosmtplib", lambda: FakeAioSmtplib)
+    locate_threads: list[int] = []
+    load_threads: list[int] = []
+    original_locate = dispatch._locate_draft
+    original_load = SmtpTransport.load
+
+    def tracking_locate(*args: object, **kwargs: object):
+        locate_threads.append(threading.get_ident())
+        return original_locate(*args, **kwargs)
+
+    def tracking_load(path: Path) -> bytes:
+        load_threads.append(threading.get_ident())
+        return original_load(path)
+
+    monkeypatch.setattr(dispatch, "_locate_draft", tracking_locate)
+    monkeypatch.setattr(SmtpTransport, "load", staticmethod(tracking_load))
+
+    drafts_dir = run_paths.output_dir / "emails"
+    drafts_dir.mkdir(parents=True)
+    vessel_ids = [f"VESSEL_{index}" for index in range(3)]
+    for vessel_id in vessel_ids:
+        (drafts_dir / f"{vessel_id}.eml").write_bytes(vessel_id.encode("ascii"))
+
+    async def _run():
+        loop_thread = threading.get_ident()
+        results = await dispatch.deliver_emails_async(
+            run_paths, vessel_ids, _smtp_plan(async_concurrency=2), logger=None
+        )
+        return loop_thread, results
+
+    loop_thread, results = asyncio.run(_run())
+
+    assert [result.status for result in results] == ["sent"] * 3
+    assert len(locate_threads) == len(load_threads) == 3
+    assert loop_thread not in {*locate_threads, *load_threads}
+
+
+def test_email_delivery_async_holds_at_most_one_draft_per_session(
+    run_paths: FakeRunPaths, monkeypatch
+) -> None:
+    FakeAioSmtp.instances = []
+    monkeypatch.setattr(dispatch, "load_aiosmtplib", lambda: FakeAioSmtplib)
+    lock = threading.Lock()
+    held = 0
+    peak = 0
+    original_load = SmtpTransport.load
+    original_send = FakeAioSmtp.sendmail
+
+    def tracking_load(path: Path) -> bytes:
+        nonlocal held, peak
+        with lock:
+            held += 1
+            peak = max(peak, held)
+        return original_load(path)
+
+    async def tracking_send(self, sender, recipients, message):
+        nonlocal held
+        outcome = await original_send(self, sender, recipients, message)
+        with lock:
+            held -= 1
+        return outcome
+
+    monkeypatch.setattr(SmtpTransport, "load", staticmethod(tracking_load))
+    monkeypatch.setattr(FakeAioSmtp, "sendmail", tracking_send)
+
+    drafts_dir = run_paths.output_dir / "emails"
+    drafts_dir.mkdir(parents=True)
+    vessel_ids = [f"VESSEL_{index}" for index in range(6)]
+    for vessel_id in vessel_ids:
+        (drafts_dir / f"{vessel_id}.eml").write_bytes(vessel_id.encode("ascii"))
+
+    results = dispatch.deliver_emails(
+        run_paths, vessel_ids, _smtp_plan(async_concurrency=2), logger=None
+    )
+
+    assert [result.status for result in results] == ["sent"] * 6
+    assert peak <= 2
+
+
+def test_email_delivery_async_falls_back_without_aiosmtplib(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], eml_drafts: dict[str, Path], monkeypatch
+) -> None:
+    FakeSmtpServer.instances = []
+    monkeypatch.setattr(dispatch, "load_aiosmtplib", lambda: None)
+    monkeypatch.setattr(smtp.smtplib, "SMTP", FakeSmtpServer)
+
+    results = dispatch.deliver_emails(
+        run_paths, vessels, _smtp_plan(async_concurrency=4), logger=None
+    )
+
+    assert all(result.status == "sent" for result in results)
+    assert len(FakeSmtpServer.instances) == 1
+
+
+@pytest.mark.parametrize(
+    ("name", "expected_name", "reason"),
+    [
+        (" NiceMail ", "nicemail", "Nicemail transport not implemented."),
+        ("nice", "nicemail", "Nicemail transport not implemented."),
+        ("Carrier-Pigeon", "carrier-pigeon", "Unsupported transport selected."),
+        ("SMTP", "smtp", "SMTP configuration missing."),
+    ],
+)
+def test_resolve_transport_dispatch(name: str, expected_name: str, reason: str) -> None:
+    resolved = dispatch._resolve_transport({"transport": name})  # type: ignore[attr-defined]
+
+    assert resolved.transport is None
+    assert resolved.name == expected_name
+    assert resolved.reason == reason
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from icr.backend.delivery.pdf import render as pdf_render
-
-
-@dataclass
-class FakeRunPaths:
-    output_dir: Path
+from tests._assertions import assert_all
+from tests._fakes import FakeRunPaths
+from tests._fsutil import bulk_write, fingerprint
 
 
 class FakePdfRenderer:
@@ -37,7 +37,9 @@ def run_paths(tmp_path: Path) -> FakeRunPaths:
     return FakeRunPaths(output_dir=tmp_path / "output")
 
 
-@pytest.fixture
+# Vessel rows are read-only in every test, so one list serves the session;
+# HTML files stay per-test because several tests assert on a clean tree.
+@pytest.fixture(scope="session")
 def vessels() -> list[dict[str, str]]:
     return [
         {"ship_id": "VESSEL_001", "report_filename": "reports/html/VESSEL_001.html"},
@@ -49,11 +51,8 @@ def vessels() -> list[dict[str, str]]:
 def html_reports(run_paths: FakeRunPaths, vessels: list[dict[str, str]]) -> dict[str, Path]:
     reports_dir = run_paths.output_dir / "reports" / "html"
     reports_dir.mkdir(parents=True, exist_ok=True)
-    created: dict[str, Path] = {}
-    for vessel in vessels:
-        path = reports_dir / f"{vessel['ship_id']}.html"
-        path.write_text(f"<html>{vessel['ship_id']}</html>", encoding="utf-8")
-        created[vessel["ship_id"]] = path
+    created = {vessel["ship_id"]: reports_dir / f"{vessel['ship_id']}.html" for vessel in vessels}
+    bulk_write([(path, b"<html>%s</html>" % ship_id.encode()) for ship_id, path in created.items()])
     return created
 
 
@@ -72,8 +71,11 @@ def test_pdf_generation_disabled_skips_all(
     )
 
     assert len(results) == len(vessels)
-    assert all(result.status == "skipped" for result in results)
-    assert all(result.reason and "disabled" in result.reason.lower() for result in results)
+    assert_all(
+        results,
+        skipped=lambda result: result.status == "skipped",
+        disabled_reason=lambda result: result.reason and "disabled" in result.reason.lower(),
+    )
 
     pdf_dir = run_paths.output_dir / "reports" / "pdf"
     assert not pdf_dir.exists()
@@ -94,7 +96,7 @@ def test_pdf_missing_html_is_skipped(
         logger=None,
     )
 
-    by_vessel = {result.vessel_id: result for result in results}
+    by_vessel = results
     assert by_vessel["VESSEL_003"].status == "skipped"
     assert "html" in (by_vessel["VESSEL_003"].reason or "").lower()
     assert by_vessel["VESSEL_001"].status == "generated"
@@ -115,8 +117,11 @@ def test_pdf_renderer_unavailable(
     )
 
     assert len(results) == len(vessels)
-    assert all(result.status == "skipped" for result in results)
-    assert all("renderer" in (result.reason or "").lower() for result in results)
+    assert_all(
+        results,
+        skipped=lambda result: result.status == "skipped",
+        renderer_reason=lambda result: "renderer" in (result.reason or "").lower(),
+    )
 
     pdf_dir = run_paths.output_dir / "reports" / "pdf"
     assert not pdf_dir.exists()
@@ -134,9 +139,12 @@ def test_pdf_successful_generation(
         logger=None,
     )
 
-    assert all(result.status == "generated" for result in results)
-    assert all(result.renderer_name == "fake-renderer" for result in results)
-    assert all(result.renderer_version == "1.0" for result in results)
+    assert_all(
+        results,
+        generated=lambda result: result.status == "generated",
+        renderer_name=lambda result: result.renderer_name == "fake-renderer",
+        renderer_version=lambda result: result.renderer_version == "1.0",
+    )
 
     pdf_paths = {result.vessel_id: result.pdf_path for result in results}
     assert pdf_paths["VESSEL_001"] == run_paths.output_dir / "reports" / "pdf" / "VESSEL_001.pdf"
@@ -145,6 +153,26 @@ def test_pdf_successful_generation(
     assert pdf_paths["VESSEL_002"].exists()
 
 
+def test_pdf_output_dir_created_before_rendering(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], html_reports: dict[str, Path], monkeypatch
+) -> None:
+    class _NoMkdirRenderer(FakePdfRenderer):
+        def render(self, html_path: Path, pdf_path: Path) -> None:
+            pdf_path.write_bytes(b"%PDF-FAKE")
+
+    monkeypatch.setattr(pdf_render, "choose_renderer", lambda preference: _NoMkdirRenderer())
+
+    results = pdf_render.generate_pdfs(
+        run_paths,
+        vessels,
+        _options(pdf_enabled=True),
+        logger=None,
+    )
+
+    assert [result.status for result in results] == ["generated", "generated"]
+    assert all(result.pdf_path is not None and result.pdf_path.exists() for result in results)
+
+
 def test_pdf_renderer_failure_isolated(
     run_paths: FakeRunPaths, vessels: list[dict[str, str]], html_reports: dict[str, Path], monkeypatch
 ) -> None:
@@ -159,7 +187,7 @@ def test_pdf_renderer_failure_isolated(
         logger=None,
     )
 
-    by_vessel = {result.vessel_id: result for result in results}
+    by_vessel = results
     assert by_vessel["VESSEL_002"].status == "failed"
     assert by_vessel["VESSEL_001"].status == "generated"
     assert (by_vessel["VESSEL_002"].reason or "").lower()
@@ -173,7 +201,7 @@ def test_pdf_does_not_mutate_html(
     monkeypatch.setattr(pdf_render, "choose_renderer", lambda preference: FakePdfRenderer())
 
     html_path = html_reports["VESSEL_001"]
-    before_mtime = html_path.stat().st_mtime_ns
+    before = fingerprint(html_path)
 
     first = pdf_render.generate_pdfs(
         run_paths,
@@ -188,9 +216,162 @@ def test_pdf_does_not_mutate_html(
         logger=None,
     )
 
-    after_mtime = html_path.stat().st_mtime_ns
-    assert before_mtime == after_mtime
+    assert fingerprint(html_path) == before
 
-    first_path = {result.vessel_id: result.pdf_path for result in first}["VESSEL_001"]
-    second_path = {result.vessel_id: result.pdf_path for result in second}["VESSEL_001"]
+    first_path = first["VESSEL_001"].pdf_path
+    second_path = second["VESSEL_001"].pdf_path
     assert first_path == second_path
+
+
+def test_pdf_renderer_unavailable_skips_report_discovery(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], monkeypatch
+) -> None:
+    def _no_walk(_: Path) -> list[Path]:
+        raise AssertionError("reports should not be listed without a renderer")
+
+    monkeypatch.setattr(pdf_render, "choose_renderer", lambda preference: None)
+    monkeypatch.setattr(pdf_render, "_list_html_files", _no_walk)
+
+    results = pdf_render.generate_pdfs(
+        run_paths,
+        vessels + [{"ship_id": "VESSEL_404"}],
+        _options(pdf_enabled=True),
+        logger=None,
+    )
+
+    assert [result.vessel_id for result in results] == ["VESSEL_001", "VESSEL_002", "VESSEL_404"]
+    assert all(result.reason == "No PDF renderer available." for result in results)
+
+
+def test_pdf_concurrent_rendering_preserves_order(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], html_reports: dict[str, Path], monkeypatch
+) -> None:
+    renderer = FakePdfRenderer(fail_on={html_reports["VESSEL_001"]})
+    monkeypatch.setattr(pdf_render, "choose_renderer", lambda preference: renderer)
+    # Threads stand in for processes so the monkeypatched renderer is visible.
+    monkeypatch.setattr(pdf_render, "ProcessPoolExecutor", ThreadPoolExecutor)
+
+    results = pdf_render.generate_pdfs(
+        run_paths,
+        vessels + [{"ship_id": "VESSEL_404"}],
+        _options(pdf_enabled=True, pdf_concurrency=2),
+        logger=None,
+    )
+
+    assert [(result.vessel_id, result.status) for result in results] == [
+        ("VESSEL_001", "failed"),
+        ("VESSEL_002", "generated"),
+        ("VESSEL_404", "skipped"),
+    ]
+    assert results[0].reason == "RuntimeError: boom"
+    assert results[1].pdf_path is not None and results[1].pdf_path.exists()
+
+
+# Stand-in weasyprint importable by worker processes; each PDF records the
+# pid of the process that rendered it, and FAKE_WEASYPRINT_EXIT makes the
+# rendering process die instead.
+_FAKE_WEASYPRINT = b"""
+import os
+
+__version__ = "0-test"
+
+
+class HTML:
+    def __init__(self, filename):
+        self._filename = filename
+
+    def write_pdf(self, target):
+        if os.environ.get("FAKE_WEASYPRINT_EXIT"):
+            os._exit(3)
+        with open(target, "wb") as handle:
+            handle.write(b"%PDF-" + str(os.getpid()).encode())
+"""
+
+
+@pytest.fixture
+def worker_weasyprint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    module_dir = tmp_path / "fake_modules"
+    module_dir.mkdir()
+    (module_dir / "weasyprint.py").write_bytes(_FAKE_WEASYPRINT)
+    monkeypatch.syspath_prepend(str(module_dir))
+    # Spawned workers rebuild sys.path from the environment.
+    monkeypatch.setenv(
+        "PYTHONPATH", os.pathsep.join(filter(None, [str(module_dir), os.environ.get("PYTHONPATH")]))
+    )
+    yield
+    sys.modules.pop("weasyprint", None)
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("worker_weasyprint")
+def test_pdf_rendering_in_worker_processes_resolves_renderer(
+    run_paths: FakeRunPaths, vessels: list[dict[str, str]], html_reports: dict[str, Path]
+) -> None:
+    results = pdf_render.generate_pdfs(
+        run_paths,
+        vessels,
+        _options(pdf_enabled=True, pdf_concurrency=2),
+        logger=None,
+    )
+
+    assert [(result.vessel_id, result.status) for result in results] == [
+        ("VESSEL_001", "generated"),
+        ("VESSEL_002", "generated"),
+    ]
+    assert_all(results, renderer_is_weasyprint=lambda result: result.renderer_name == "weasyprint")
+    worker_pids = {result.pdf_path.read_bytes().removeprefix(b"%PDF-") for result in results}
+    assert str(os.getpid()).encode() not in worker_pids
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("worker_weasyprint")
+def test_pdf_worker_crash_fails_vessels_without_raising(
+    run_paths: FakeRunPaths,
+    vessels: list[dict[str, str]],
+    html_reports: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("FAKE_WEASYPRINT_EXIT", "1")
+
+    results = pdf_render.generate_pdfs(
+        run_paths,
+        vessels,
+        _options(pdf_enabled=True, pdf_concurrency=2),
+        logger=None,
+    )
+
+    assert [(result.vessel_id, result.status) for result in results] == [
+        ("VESSEL_001", "failed"),
+        ("VESSEL_002", "failed"),
+    ]
+    assert_all(
+        results,
+        reason_names_broken_pool=lambda result: result.reason.startswith("BrokenProcessPool"),
+        no_pdf_path=lambda result: result.pdf_path is None,
+    )
+
+
+def test_pdf_pool_that_cannot_start_fails_vessels(
+    run_paths: FakeRunPaths,
+    vessels: list[dict[str, str]],
+    html_reports: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class UnstartablePool(ThreadPoolExecutor):
+        def submit(self, *args: object, **kwargs: object):
+            raise OSError("cannot start worker")
+
+    monkeypatch.setattr(pdf_render, "choose_renderer", lambda preference: FakePdfRenderer())
+    monkeypatch.setattr(pdf_render, "ProcessPoolExecutor", UnstartablePool)
+
+    results = pdf_render.generate_pdfs(
+        run_paths,
+        vessels,
+        _options(pdf_enabled=True, pdf_concurrency=2),
+        logger=None,
+    )
+
+    assert [(result.status, result.reason) for result in results] == [
+        ("failed", "OSError: cannot start worker"),
+        ("failed", "OSError: cannot start worker"),
+    ]
@@ -2,8 +2,22 @@
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from pathlib import Path
 
 SRC_PATH = Path(__file__).resolve().parents[1] / "src"
-sys.path.insert(0, str(SRC_PATH))
+
+
+def _needs_src_path() -> bool:
+    # An editable install already makes this checkout's ``icr`` importable;
+    # only fall back to the path insert when it is missing or resolves to a
+    # different copy (for example a stale non-editable install).
+    spec = importlib.util.find_spec("icr")
+    if spec is None or spec.origin is None:
+        return True
+    return not Path(spec.origin).resolve().is_relative_to(SRC_PATH)
+
+
+if _needs_src_path():
+    sys.path.insert(0, str(SRC_PATH))
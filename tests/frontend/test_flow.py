@@ -3,11 +3,29 @@ from unittest.mock import Mock, call, patch
 from icr.frontend import flow, messages
 
 
+class _ScriptedConfirm:
+    """Replay confirm answers and record prompts without Mock bookkeeping."""
+
+    def __init__(self, responses: list[bool]) -> None:
+        self._responses = iter(responses)
+        self.messages: list[str] = []
+
+    def __call__(self, message: str) -> bool:
+        self.messages.append(message)
+        return bool(next(self._responses))
+
+    def assert_called_once_with(self, message: str) -> None:
+        assert self.messages == [message]
+
+    def assert_not_called(self) -> None:
+        assert self.messages == []
+
+
 def _make_io(confirm_responses: list[bool]) -> Mock:
     io = Mock()
     io.display = Mock()
     io.prompt = Mock()
-    io.confirm = Mock(side_effect=confirm_responses)
+    io.confirm = _ScriptedConfirm(confirm_responses)
     return io
 
 
@@ -19,6 +37,10 @@ def _make_backend() -> Mock:
     return backend
 
 
+def _error_block(error: dict[str, str]) -> str:
+    return "\n".join((error["title"], error["body"], error["next_step"]))
+
+
 def test_flow_happy_path() -> None:
     backend = _make_backend()
     io = _make_io([True])
@@ -26,8 +48,7 @@ def test_flow_happy_path() -> None:
     with patch("icr.frontend.flow.selection.select_vessels", return_value=["SHIP123"]) as selector:
         flow.run_flow(backend=backend, io=io, get_vessel_id=lambda vessel: vessel["ship_id"])
 
-    io.display.assert_any_call(messages.WELCOME["title"])
-    io.display.assert_any_call(messages.WELCOME["body"])
+    io.display.assert_any_call(f"{messages.WELCOME['title']}\n{messages.WELCOME['body']}")
     io.display.assert_any_call(messages.COMPLETION["success"])
     io.confirm.assert_called_once_with(messages.PROMPTS["confirm_selection"].format(count=1))
     assert backend.mock_calls[:3] == [
@@ -80,7 +101,7 @@ def test_flow_discovery_error_shows_message() -> None:
     selector.assert_not_called()
     backend.process_vessels.assert_not_called()
     io.confirm.assert_not_called()
-    io.display.assert_any_call(messages.ERRORS["discover_vessels"]["title"])
+    io.display.assert_any_call(_error_block(messages.ERRORS["discover_vessels"]))
 
 
 def test_flow_processing_error_shows_message() -> None:
@@ -93,7 +114,7 @@ def test_flow_processing_error_shows_message() -> None:
 
     backend.process_vessels.assert_called_once_with(["SHIP123"])
     io.confirm.assert_called_once_with(messages.PROMPTS["confirm_selection"].format(count=1))
-    io.display.assert_any_call(messages.ERRORS["processing"]["title"])
+    io.display.assert_any_call(_error_block(messages.ERRORS["processing"]))
 
 
 def test_flow_missing_backend_functions() -> None:
@@ -104,4 +125,29 @@ def test_flow_missing_backend_functions() -> None:
 
     flow.run_flow(backend=backend, io=io)
 
-    io.display.assert_any_call(messages.ERRORS["backend_unavailable"]["title"])
+    io.display.assert_any_call(_error_block(messages.ERRORS["backend_unavailable"]))
+
+
+def test_flow_summary_is_displayed_as_one_block() -> None:
+    backend = _make_backend()
+    backend.process_vessels.return_value = {"run_id": "RUN1", "vessels_processed": 1}
+    io = _make_io([True])
+
+    with patch("icr.frontend.flow.selection.select_vessels", return_value=["SHIP123"]):
+        flow.run_flow(backend=backend, io=io)
+
+    assert io.display.call_args_list[-1] == call(
+        messages.COMPLETION["run_id"].format(run_id="RUN1")
+        + "\n"
+        + messages.COMPLETION["vessels_processed"].format(vessels_processed=1)
+    )
+
+
+def test_console_io_display_writes_line(capsys) -> None:
+    console = flow.ConsoleIO()
+
+    console.display("first\nsecond")
+    console.display("")
+
+    assert capsys.readouterr().out == "first\nsecond\n\n"
+    assert not hasattr(console, "__dict__")
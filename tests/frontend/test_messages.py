@@ -3,6 +3,15 @@ import importlib
 from icr.frontend import messages
 
 
+def _public_messages() -> tuple[tuple[str, object], ...]:
+    return tuple(
+        (name, value) for name, value in vars(messages).items() if not name.startswith("_")
+    )
+
+
+_PUBLIC_MESSAGES = _public_messages()
+
+
 def _iter_message_values(value: object):
     if isinstance(value, str):
         yield value
@@ -15,9 +24,7 @@ def _iter_message_values(value: object):
 
 
 def test_messages_are_strings_and_non_empty() -> None:
-    for name, value in vars(messages).items():
-        if name.startswith("_"):
-            continue
+    for _, value in _PUBLIC_MESSAGES:
         assert not callable(value)
         assert isinstance(value, (str, dict))
         for message in _iter_message_values(value):
@@ -26,18 +33,12 @@ def test_messages_are_strings_and_non_empty() -> None:
 
 
 def test_messages_have_no_callables() -> None:
-    for name, value in vars(messages).items():
-        if name.startswith("_"):
-            continue
+    for _, value in _PUBLIC_MESSAGES:
         assert not callable(value)
 
 
 def test_messages_import_has_no_side_effects(capsys) -> None:
-    snapshot = {
-        name: value
-        for name, value in vars(messages).items()
-        if not name.startswith("_")
-    }
+    snapshot = dict(_public_messages())
 
     importlib.reload(messages)
 
@@ -45,9 +46,4 @@ def test_messages_import_has_no_side_effects(capsys) -> None:
     assert captured.out == ""
     assert captured.err == ""
 
-    reloaded = {
-        name: value
-        for name, value in vars(messages).items()
-        if not name.startswith("_")
-    }
-    assert reloaded == snapshot
+    assert dict(_public_messages()) == snapshot
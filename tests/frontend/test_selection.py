@@ -12,9 +12,12 @@ def _make_vessels() -> list[dict[str, str]]:
 
 
 def _make_io(responses: list[str]) -> Mock:
+    # Prompts are never asserted on, so a plain iterator replaces the Mock
+    # and its per-call bookkeeping; display stays a Mock for assertions.
     io = Mock()
     io.display = Mock()
-    io.prompt = Mock(side_effect=responses)
+    scripted = iter(responses)
+    io.prompt = lambda message: next(scripted)
     return io
 
 
@@ -120,3 +123,61 @@ def test_select_vessels_no_results_message() -> None:
 
     assert selected == []
     io.display.assert_any_call(messages.SELECTION["no_vessels"])
+
+
+def test_select_vessels_redraws_screen_in_one_display() -> None:
+    vessels = _make_vessels()
+    io = _make_io(["a", "d"])
+
+    selection.select_vessels(
+        vessels,
+        io,
+        get_vessel_id=lambda vessel: vessel["ship_id"],
+        get_vessel_label=lambda vessel: vessel["name"],
+    )
+
+    assert io.display.call_count == 2
+    screen = io.display.call_args_list[-1].args[0]
+    assert screen.splitlines() == [
+        messages.SELECTION["title"],
+        messages.SELECTION["instructions"],
+        messages.SELECTION["list_header"],
+        "SHIP123: Example Vessel",
+        "SHIP456: Second Vessel",
+        "SHIP789: Third Vessel",
+        messages.SELECTION["selected_count"].format(selected_count=3, total_count=3),
+        messages.SELECTION["options_header"],
+        messages.SELECTION["option_all"],
+        messages.SELECTION["option_none"],
+        messages.SELECTION["option_toggle"],
+        messages.SELECTION["option_done"],
+    ]
+
+
+def test_select_all_then_none_then_all_selects_every_vessel() -> None:
+    vessels = _make_vessels()
+    io = _make_io(["a", "n", "a", "d"])
+
+    selected = selection.select_vessels(
+        vessels,
+        io,
+        get_vessel_id=lambda vessel: vessel["ship_id"],
+        get_vessel_label=lambda vessel: vessel["name"],
+    )
+
+    assert selected == ["SHIP123", "SHIP456", "SHIP789"]
+
+
+def test_select_vessels_accepts_long_actions_and_rejects_unknown() -> None:
+    vessels = _make_vessels()
+    io = _make_io(["ALL", "bogus", "toggle", "SHIP123", "done"])
+
+    selected = selection.select_vessels(
+        vessels,
+        io,
+        get_vessel_id=lambda vessel: vessel["ship_id"],
+        get_vessel_label=lambda vessel: vessel["name"],
+    )
+
+    assert selected == ["SHIP456", "SHIP789"]
+    io.display.assert_any_call(messages.SELECTION["invalid_action"])
@@ -3,7 +3,7 @@ import pytest
 from icr.backend.reporting.html import render_run_summary
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def run_with_multiple_vessels() -> list[dict[str, object]]:
     return [
         {
@@ -21,7 +21,13 @@ def run_with_multiple_vessels() -> list[dict[str, object]]:
     ]
 
 
-@pytest.fixture
+# Rendering is pure, so the shared input is rendered once per module.
+@pytest.fixture(scope="module")
+def rendered_multi_vessels(run_with_multiple_vessels: list[dict[str, object]]) -> str:
+    return render_run_summary(run_with_multiple_vessels, run_timestamp="2024-05-03 14:00")
+
+
+@pytest.fixture(scope="module")
 def run_with_no_issues() -> list[dict[str, object]]:
     return [
         {
@@ -33,21 +39,21 @@ def run_with_no_issues() -> list[dict[str, object]]:
     ]
 
 
-def test_render_run_summary_multiple_vessels(
-    run_with_multiple_vessels: list[dict[str, object]],
-) -> None:
-    html = render_run_summary(run_with_multiple_vessels, run_timestamp="2024-05-03 14:00")
-
-    assert "<!doctype html>" in html
-    assert "<h1>Run Summary</h1>" in html
-    assert "2024-05-03 14:00" in html
-    assert "Vessels processed:</strong> 2" in html
-    assert "Vessels with issues:</strong> 1" in html
-    assert "Vessels with no issues:</strong> 1" in html
-    assert "VESSEL_001 - Ocean Star" in html
-    assert "VESSEL_002 - Calm Seas" in html
-    assert "VESSEL_001.html" in html
-    assert "VESSEL_002.html" in html
+def test_render_run_summary_multiple_vessels(rendered_multi_vessels: str) -> None:
+    needles = (
+        "<!doctype html>",
+        "<h1>Run Summary</h1>",
+        "2024-05-03 14:00",
+        "Vessels processed:</strong> 2",
+        "Vessels with issues:</strong> 1",
+        "Vessels with no issues:</strong> 1",
+        "VESSEL_001 - Ocean Star",
+        "VESSEL_002 - Calm Seas",
+        "VESSEL_001.html",
+        "VESSEL_002.html",
+    )
+    missing = [needle for needle in needles if needle not in rendered_multi_vessels]
+    assert not missing, missing
 
 
 def test_render_run_summary_no_issues(
@@ -76,9 +82,8 @@ def test_render_run_summary_no_vessels() -> None:
 
 
 def test_render_run_summary_is_deterministic(
-    run_with_multiple_vessels: list[dict[str, object]],
+    run_with_multiple_vessels: list[dict[str, object]], rendered_multi_vessels: str
 ) -> None:
-    first = render_run_summary(run_with_multiple_vessels, run_timestamp="2024-05-03 14:00")
     second = render_run_summary(run_with_multiple_vessels, run_timestamp="2024-05-03 14:00")
 
-    assert first == second
+    assert rendered_multi_vessels == second
@@ -1,22 +1,25 @@
+from html import escape
+
 import pytest
 
 from icr.backend.domain.models import IssueRow, IssueType
 from icr.backend.reporting.html import render_vessel_report
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def vessel_with_discrepancies() -> dict[str, str]:
     return {"ship_id": "VESSEL_001", "ship_name": "Ocean Star"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def vessel_without_discrepancies() -> dict[str, str]:
     return {"ship_id": "VESSEL_002", "ship_name": "Calm Seas"}
 
 
-@pytest.fixture
-def issues() -> list[IssueRow]:
-    return [
+@pytest.fixture(scope="module")
+def issues() -> tuple[IssueRow, ...]:
+    # A tuple, so the module-shared rows cannot be mutated by a test.
+    return (
         IssueRow(
             ship_id="VESSEL_001",
             item="PUB-100",
@@ -31,34 +34,47 @@ def issues() -> list[IssueRow]:
             current_edition="3.0",
             issue_type=IssueType.MISSING_ONBOARD,
         ),
-    ]
+    )
 
 
-def test_render_vessel_report_with_issues(
-    vessel_with_discrepancies: dict[str, str], issues: list[IssueRow]
-) -> None:
-    html = render_vessel_report(
-        vessel_with_discrepancies,
+_SOURCE_FILES = ("index.xlsx", "inventory.xlsx", "ic.xlsx")
+
+
+def _render_with_issues(vessel: dict[str, str], issues: tuple[IssueRow, ...]) -> str:
+    return render_vessel_report(
+        vessel,
         issues,
         run_timestamp="2024-05-01 10:30",
-        source_files=["index.xlsx", "inventory.xlsx", "ic.xlsx"],
+        source_files=list(_SOURCE_FILES),
     )
 
-    assert "<!doctype html>" in html
-    assert "<h1>Inventory Compliance Report</h1>" in html
-    assert "VESSEL_001 - Ocean Star" in html
-    assert "2024-05-01 10:30" in html
-    assert "index.xlsx" in html
-    assert "inventory.xlsx" in html
-    assert "ic.xlsx" in html
-    assert "<table>" in html
-    assert "<th>Item</th>" in html
-    assert "PUB-100" in html
-    assert "1.0" in html
-    assert "2.0" in html
-    assert "Outdated" in html
-    assert "Missing onboard edition" in html
-    assert "No issues found for this vessel." not in html
+
+# Rendering is pure, so the shared input is rendered once per module.
+@pytest.fixture(scope="module")
+def rendered_with_issues(
+    vessel_with_discrepancies: dict[str, str], issues: tuple[IssueRow, ...]
+) -> str:
+    return _render_with_issues(vessel_with_discrepancies, issues)
+
+
+def test_render_vessel_report_with_issues(rendered_with_issues: str) -> None:
+    needles = (
+        "<!doctype html>",
+        "<h1>Inventory Compliance Report</h1>",
+        "VESSEL_001 - Ocean Star",
+        "2024-05-01 10:30",
+        *_SOURCE_FILES,
+        "<table>",
+        "<th>Item</th>",
+        "PUB-100",
+        "1.0",
+        "2.0",
+        "Outdated",
+        "Missing onboard edition",
+    )
+    missing = [needle for needle in needles if needle not in rendered_with_issues]
+    assert not missing, missing
+    assert "No issues found for this vessel." not in rendered_with_issues
 
 
 def test_render_vessel_report_no_issues(
@@ -79,19 +95,51 @@ def test_render_vessel_report_no_issues(
 
 
 def test_render_vessel_report_is_deterministic(
-    vessel_with_discrepancies: dict[str, str], issues: list[IssueRow]
+    vessel_with_discrepancies: dict[str, str],
+    issues: tuple[IssueRow, ...],
+    rendered_with_issues: str,
 ) -> None:
-    html_first = render_vessel_report(
-        vessel_with_discrepancies,
-        issues,
-        run_timestamp="2024-05-01 10:30",
-        source_files=["index.xlsx", "inventory.xlsx", "ic.xlsx"],
-    )
-    html_second = render_vessel_report(
-        vessel_with_discrepancies,
-        issues,
-        run_timestamp="2024-05-01 10:30",
-        source_files=["index.xlsx", "inventory.xlsx", "ic.xlsx"],
+    html_second = _render_with_issues(vessel_with_discrepancies, issues)
+
+    assert rendered_with_issues == html_second
+
+
+def test_render_vessel_report_escapes_like_html_escape() -> None:
+    hostile = "<b>A&B</b> \"quoted\" 'single'"
+    html = render_vessel_report(
+        {"ship_id": hostile},
+        [IssueRow(hostile, hostile, hostile, "", IssueType.OUTDATED)],
+        run_timestamp=hostile,
+        source_files=[hostile],
     )
 
-    assert html_first == html_second
+    assert hostile not in html
+    assert html.count(escape(hostile)) == 6
+
+
+def test_render_vessel_report_accepts_mixed_issue_records(
+    vessel_with_discrepancies: dict[str, str],
+    issues: tuple[IssueRow, ...],
+) -> None:
+    as_mappings = [
+        {
+            "item": issue.item,
+            "onboard_edition": issue.onboard_edition,
+            "current_edition": issue.current_edition,
+            "issue_type": issue.issue_type,
+        }
+        for issue in issues
+    ]
+
+    def render(records: list[object]) -> str:
+        return render_vessel_report(
+            vessel_with_discrepancies,
+            records,
+            run_timestamp="2024-01-01T00:00:00Z",
+            source_files=[],
+        )
+
+    expected = render(issues)
+    assert render(as_mappings) == expected
+    assert render([issues[0], as_mappings[1]]) == expected
+    assert render([as_mappings[0], issues[1]]) == expected
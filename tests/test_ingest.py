@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
+import io
+import json
 from pathlib import Path
 import sqlite3
 
 import pytest
 from openpyxl import Workbook
 
+from icr.backend.ingest import excel_reader
 from icr.backend.ingest.excel_reader import (
     IngestionFatalError,
     ingest_excel_files,
 )
 from icr.backend.persistence import paths as paths_mod
 from icr.backend.persistence.db import Database, RunMetadata
+from tests._fsutil import bulk_write
 
 
 @dataclass(frozen=True)
@@ -86,14 +90,28 @@ def db(runtime_paths: paths_mod.RuntimePaths) -> Database:
     return db_instance
 
 
+# Encoded workbooks keyed by their contents; most tests write the same
+# valid sources, so each distinct sheet goes through openpyxl only once.
+_WORKBOOK_BYTES: dict[tuple[tuple[object, ...], ...], bytes] = {}
+
+
+def _workbook_bytes(headers: list[str], rows: list[list[object]]) -> bytes:
+    key = (tuple(headers), *map(tuple, rows))
+    data = _WORKBOOK_BYTES.get(key)
+    if data is None:
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        worksheet.append(headers)
+        for row in rows:
+            worksheet.append(row)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        data = _WORKBOOK_BYTES[key] = buffer.getvalue()
+    return data
+
+
 def _write_workbook(path: Path, headers: list[str], rows: list[list[object]]) -> None:
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.append(headers)
-    for row in rows:
-        worksheet.append(row)
-    workbook.save(path)
-    workbook.close()
+    path.write_bytes(_workbook_bytes(headers, rows))
 
 
 def _write_valid_sources(tmp_path: Path) -> dict[str, Path]:
@@ -101,30 +119,40 @@ def _write_valid_sources(tmp_path: Path) -> dict[str, Path]:
     vessels_index_path = tmp_path / "SAFE_VESSELS_INDEX.xlsx"
     vessels_inventory_path = tmp_path / "SAFE_VESSELS_INVENTORY.xlsx"
 
-    _write_workbook(
-        ic_path,
-        ["ITEM", "ITMDESC", "PLINID", "ITMCLSS", "UPCCODE", "EDITION", "CURRDATE"],
-        [["ITEM1", "Desc", "PLIN", "CLS", "UPC", "ED1", date(2024, 1, 1)]],
-    )
-    _write_workbook(
-        vessels_index_path,
+    bulk_write(
         [
-            "SHIPID",
-            "SHIPNAME",
-            "CUSTNO",
-            "IMONO",
-            "SHIPSTAT",
-            "EMAIL",
-            "NOTE1",
-            "NOTE2",
-            "NOTE3",
-        ],
-        [["S1", "Ship", "C1", "IMO", "Active", "ship@example.com", "N1", "N2", "N3"]],
-    )
-    _write_workbook(
-        vessels_inventory_path,
-        ["SHIPID", "SHIPNAME", "CUSTNO", "ITEM", "EDITION", "STOREEDT", "DESCRIP"],
-        [["S1", "Ship", "C1", "ITEM1", "ED1", "SE1", "Desc"]],
+            (
+                ic_path,
+                _workbook_bytes(
+                    ["ITEM", "ITMDESC", "PLINID", "ITMCLSS", "UPCCODE", "EDITION", "CURRDATE"],
+                    [["ITEM1", "Desc", "PLIN", "CLS", "UPC", "ED1", date(2024, 1, 1)]],
+                ),
+            ),
+            (
+                vessels_index_path,
+                _workbook_bytes(
+                    [
+                        "SHIPID",
+                        "SHIPNAME",
+                        "CUSTNO",
+                        "IMONO",
+                        "SHIPSTAT",
+                        "EMAIL",
+                        "NOTE1",
+                        "NOTE2",
+                        "NOTE3",
+                    ],
+                    [["S1", "Ship", "C1", "IMO", "Active", "ship@example.com", "N1", "N2", "N3"]],
+                ),
+            ),
+            (
+                vessels_inventory_path,
+                _workbook_bytes(
+                    ["SHIPID", "SHIPNAME", "CUSTNO", "ITEM", "EDITION", "STOREEDT", "DESCRIP"],
+                    [["S1", "Ship", "C1", "ITEM1", "ED1", "SE1", "Desc"]],
+                ),
+            ),
+        ]
     )
 
     return {
@@ -311,3 +339,369 @@ def test_missing_key_fields_skip_rows_with_warning(
 
         assert issues
         assert _fetch_count(conn, "ic_inventory_row") == 0
+
+
+def test_rows_stream_across_chunk_boundaries(
+    tmp_path: Path,
+    db: Database,
+    runtime_paths: paths_mod.RuntimePaths,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(excel_reader, "INGEST_CHUNK_SIZE", 2)
+    sources = _write_valid_sources(tmp_path)
+    _write_workbook(
+        sources["ic"],
+        ["ITEM", "ITMDESC", "PLINID", "ITMCLSS", "UPCCODE", "EDITION", "CURRDATE"],
+        [
+            [f"ITEM{index}", "Desc", "PLIN", "CLS", "UPC", "ED1", date(2024, 1, 1)]
+            for index in range(5)
+        ],
+    )
+
+    summary = ingest_excel_files(
+        ic_inventory_path=sources["ic"],
+        vessels_index_path=sources["vessels_index"],
+        vessels_inventory_path=sources["vessels_inventory"],
+        db=db,
+        paths=runtime_paths,
+    )
+
+    assert _result_for(summary, "safe_ic_inventory").rows_inserted == 5
+    with db.connect() as conn:
+        items = [row[0] for row in conn.execute("SELECT item FROM ic_inventory_row;")]
+        assert items == [f"ITEM{index}" for index in range(5)]
+        assert _fetch_count(conn, "raw_excel_rows") == 7
+        raw = conn.execute("SELECT row_json FROM raw_excel_rows ORDER BY id;").fetchone()[0]
+        assert isinstance(raw, bytes)
+        assert json.loads(raw)["source"] == "safe_ic_inventory"
+
+
+def test_row_extractor_matches_generic_extraction() -> None:
+    header_map = {"item": 0, "edition": 2, "note": 4}
+    extract = excel_reader._make_row_extractor(header_map)
+
+    for row in (
+        (" ITEM1 ", "skip", "ED1 ", None, 5),
+        ("ITEM2", None, " ED2"),
+        (),
+    ):
+        assert extract(row) == excel_reader._extract_row(row, header_map)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [excel_reader.IC_SPEC, excel_reader.VESSEL_INDEX_SPEC, excel_reader.VESSEL_INVENTORY_SPEC],
+    ids=lambda spec: spec.source_name,
+)
+def test_table_mapper_matches_generic_mapping(spec: excel_reader.SheetSpec) -> None:
+    header_map = {name: index for index, name in enumerate(spec.required_columns)}
+    map_table = excel_reader._make_table_mapper(spec, header_map)
+    values = ("A", date(2024, 1, 1), None, "", 7)
+    row = {
+        name: values[index % len(values)] for index, name in enumerate(spec.required_columns)
+    }
+
+    assert map_table(row) == excel_reader._map_table_row(row, spec.source_columns)
+
+
+def test_table_mapper_falls_back_for_missing_source() -> None:
+    spec = excel_reader.IC_SPEC
+    header_map = {"item": 0}
+    map_table = excel_reader._make_table_mapper(spec, header_map)
+
+    assert map_table({"item": "ITEM1"}) == ["ITEM1", None, None, None]
+
+
+def test_serialize_row_uses_optional_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeOrjson:
+        @staticmethod
+        def dumps(payload: object) -> bytes:
+            return json.dumps(payload, default=str).encode("utf-8")
+
+    row = {"item": "ITEM1", "currdate": date(2024, 1, 1)}
+    monkeypatch.setattr(excel_reader, "_ORJSON", FakeOrjson)
+    fast = excel_reader._serialize_row("safe_ic_inventory", row)
+    monkeypatch.setattr(excel_reader, "_ORJSON", None)
+    fallback = excel_reader._serialize_row("safe_ic_inventory", row)
+
+    assert json.loads(fast) == json.loads(fallback)
+
+
+@pytest.mark.parametrize("parse_processes", [False, True], ids=["threads", "processes"])
+def test_parallel_parsing_matches_serial_ingestion(
+    tmp_path: Path,
+    db: Database,
+    runtime_paths: paths_mod.RuntimePaths,
+    parse_processes: bool,
+) -> None:
+    sources = _write_valid_sources(tmp_path)
+
+    summary = ingest_excel_files(
+        ic_inventory_path=sources["ic"],
+        vessels_index_path=sources["vessels_index"],
+        vessels_inventory_path=sources["vessels_inventory"],
+        db=db,
+        paths=runtime_paths,
+        parse_workers=3,
+        parse_processes=parse_processes,
+    )
+
+    assert [result.source_name for result in summary.results] == [
+        "safe_ic_inventory",
+        "safe_vessels_index",
+        "safe_vessels_inventory",
+    ]
+    assert all(result.rows_inserted == 1 for result in summary.results)
+    with db.connect() as conn:
+        sources_in_order = [
+            json.loads(row[0])["source"]
+            for row in conn.execute("SELECT row_json FROM raw_excel_rows ORDER BY id;")
+        ]
+    assert sources_in_order == [result.source_name for result in summary.results]
+
+
+@pytest.mark.parametrize("parse_processes", [False, True], ids=["threads", "processes"])
+def test_parallel_parsing_fatal_source_stops_writes(
+    tmp_path: Path,
+    db: Database,
+    runtime_paths: paths_mod.RuntimePaths,
+    parse_processes: bool,
+) -> None:
+    sources = _write_valid_sources(tmp_path)
+    _write_workbook(sources["vessels_index"], ["SHIPID"], [["S1"]])
+
+    with pytest.raises(IngestionFatalError):
+        ingest_excel_files(
+            ic_inventory_path=sources["ic"],
+            vessels_index_path=sources["vessels_index"],
+            vessels_inventory_path=sources["vessels_inventory"],
+            db=db,
+            paths=runtime_paths,
+            parse_workers=3,
+            parse_processes=parse_processes,
+        )
+
+    with db.connect() as conn:
+        assert _fetch_count(conn, "ic_inventory_row") == 1
+        assert _fetch_count(conn, "vessel") == 0
+        assert _fetch_count(conn, "vessel_inventory_row") == 0
+        fatal = conn.execute(
+            "SELECT COUNT(*) FROM validation_errors WHERE severity='fatal';"
+        ).fetchone()[0]
+        assert fatal > 0
+
+
+def test_blank_optional_field_warns_but_inserts(
+    tmp_path: Path,
+    db: Database,
+    runtime_paths: paths_mod.RuntimePaths,
+) -> None:
+    sources = _write_valid_sources(tmp_path)
+    _write_workbook(
+        sources["vessels_index"],
+        ["SHIPID", "SHIPNAME", "CUSTNO", "IMONO", "SHIPSTAT", "EMAIL", "NOTE1", "NOTE2", "NOTE3"],
+        [["S1", "Ship", "C1", "IMO", "Active", "   ", "N1", "N2", "N3"]],
+    )
+
+    summary = ingest_excel_files(
+        ic_inventory_path=sources["ic"],
+        vessels_index_path=sources["vessels_index"],
+        vessels_inventory_path=sources["vessels_inventory"],
+        db=db,
+        paths=runtime_paths,
+    )
+
+    index_result = _result_for(summary, "safe_vessels_index")
+    assert index_result.rows_inserted == 1
+    assert [(issue.error_type, issue.column_name) for issue in index_result.warnings] == [
+        ("missing_optional_field", "email")
+    ]
+
+
+def test_sheet_specs_precompute_insert_sql() -> None:
+    spec = excel_reader.VESSEL_INVENTORY_SPEC
+
+    assert spec.ordered_columns == (
+        "ship_id",
+        "item",
+        "onboard_edition",
+        "store_edition",
+        "description",
+    )
+    assert spec.insert_sql == (
+        "INSERT INTO vessel_inventory_row "
+        "(ship_id, item, onboard_edition, store_edition, description) "
+        "VALUES (?, ?, ?, ?, ?);"
+    )
+
+
+def test_ingestion_run_uses_one_connection(
+    tmp_path: Path,
+    db: Database,
+    runtime_paths: paths_mod.RuntimePaths,
+) -> None:
+    sources = _write_valid_sources(tmp_path)
+    calls: list[bool] = []
+
+    class CountingDatabase:
+        def connect(self, *, bulk: bool = False) -> sqlite3.Connection:
+            calls.append(bulk)
+            return db.connect(bulk=bulk)
+
+    ingest_excel_files(
+        ic_inventory_path=sources["ic"],
+        vessels_index_path=sources["vessels_index"],
+        vessels_inventory_path=sources["vessels_inventory"],
+        db=CountingDatabase(),
+        paths=runtime_paths,
+    )
+
+    assert calls == [True]
+
+
+def test_bulk_insert_splits_batches_at_parameter_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(excel_reader, "SQLITE_MAX_PARAMS", 5)
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE pairs (a INTEGER, b TEXT);")
+
+    rows = [(index, f"v{index}") for index in range(7)]
+    excel_reader._bulk_insert(conn, "INSERT INTO pairs (a, b) VALUES", 2, rows)
+
+    assert conn.execute("SELECT a, b FROM pairs ORDER BY rowid;").fetchall() == rows
+    conn.close()
+
+
+def test_validation_issues_insert_across_statement_batches(
+    db: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(excel_reader, "SQLITE_MAX_PARAMS", 10)
+    issues = [
+        excel_reader.ValidationIssue(
+            row_number=index,
+            column_name=None,
+            error_type="empty_row",
+            message=f"empty row {index}",
+            severity="warning",
+        )
+        for index in range(2, 7)
+    ]
+    conn = db.connect(bulk=True)
+    try:
+        excel_reader._persist_validation_issues(conn, issues)
+        stored = conn.execute(
+            "SELECT row_number, column_name, error_type, message, severity "
+            "FROM validation_errors ORDER BY id;"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert stored == [
+        (issue.row_number, issue.column_name, issue.error_type, issue.message, issue.severity)
+        for issue in issues
+    ]
+
+
+def test_spec_without_raw_persistence_skips_raw_rows(
+    tmp_path: Path,
+    db: Database,
+    runtime_paths: paths_mod.RuntimePaths,
+) -> None:
+    sources = _write_valid_sources(tmp_path)
+    spec = replace(excel_reader.IC_SPEC, persist_raw=False)
+
+    stats = excel_reader._ingest_single_file(sources["ic"], spec, db, runtime_paths)
+
+    assert stats.rows_inserted == 1
+    with db.connect() as conn:
+        assert _fetch_count(conn, "ic_inventory_row") == 1
+        assert _fetch_count(conn, "raw_excel_rows") == 0
+
+
+def test_immediate_transaction_rolls_back_on_error(db: Database) -> None:
+    conn = db.connect(bulk=True)
+    try:
+        with pytest.raises(RuntimeError):
+            with excel_reader._immediate_transaction(conn):
+                conn.execute("INSERT INTO raw_excel_rows (row_number, row_json) VALUES (1, x'');")
+                raise RuntimeError("boom")
+        assert not conn.in_transaction
+        assert _fetch_count(conn, "raw_excel_rows") == 0
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [" SHIPID ", "Ship Name", "STRASSE", "Straße", "ΣΙΣ", 12, None],
+)
+def test_normalize_header_matches_casefold(value: object) -> None:
+    expected = "" if value is None else str(value).strip().casefold()
+
+    assert excel_reader._normalize_header(value) == expected
+
+
+def test_validation_issue_is_slotted() -> None:
+    issue = excel_reader.ValidationIssue(2, None, "empty_row", "Empty row skipped.", "warning")
+
+    assert not hasattr(issue, "__dict__")
+
+
+def test_load_workbook_reads_from_memory_map(tmp_path: Path) -> None:
+    path = tmp_path / "mapped.xlsx"
+    _write_workbook(path, ["ITEM", "EDITION"], [["A", 1], ["B", 2]])
+    original = path.read_bytes()
+
+    workbook, close = excel_reader._load_workbook(path)
+    try:
+        rows = list(workbook.worksheets[0].iter_rows(values_only=True))
+    finally:
+        close()
+    close()
+
+    assert rows == [("ITEM", "EDITION"), ("A", 1), ("B", 2)]
+    assert path.read_bytes() == original
+
+
+def test_trailing_empty_rows_stop_scan_with_warning(
+    tmp_path: Path,
+    db: Database,
+    runtime_paths: paths_mod.RuntimePaths,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(excel_reader, "EMPTY_TAIL_THRESHOLD", 3)
+    sources = _write_valid_sources(tmp_path)
+    blank = [None] * 7
+    _write_workbook(
+        sources["ic"],
+        ["ITEM", "ITMDESC", "PLINID", "ITMCLSS", "UPCCODE", "EDITION", "CURRDATE"],
+        [
+            ["ITEM1", "Desc", "PLIN", "CLS", "UPC", "ED1", date(2024, 1, 1)],
+            blank,
+            blank,
+            ["ITEM2", "Desc", "PLIN", "CLS", "UPC", "ED1", date(2024, 1, 1)],
+            blank,
+            blank,
+            blank,
+            ["ITEM3", "Desc", "PLIN", "CLS", "UPC", "ED1", date(2024, 1, 1)],
+        ],
+    )
+
+    summary = ingest_excel_files(
+        ic_inventory_path=sources["ic"],
+        vessels_index_path=sources["vessels_index"],
+        vessels_inventory_path=sources["vessels_inventory"],
+        db=db,
+        paths=runtime_paths,
+    )
+
+    ic_result = _result_for(summary, "safe_ic_inventory")
+    assert ic_result.rows_seen == 7
+    assert ic_result.rows_inserted == 2
+    early_stops = [
+        issue.row_number
+        for issue in ic_result.warnings
+        if issue.error_type == "early_stop_empty_tail"
+    ]
+    assert early_stops == [8]
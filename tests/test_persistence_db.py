@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import sqlite3
 from pathlib import Path
@@ -66,6 +67,7 @@ def test_schema_tables_exist(db_paths: DbRuntimePaths) -> None:
     table_names = {row[0] for row in tables}
 
     assert {"metadata", "raw_excel_rows", "validation_errors"} <= table_names
+    assert "sqlite_sequence" not in table_names
 
 
 def test_metadata_row_inserted(db_paths: DbRuntimePaths) -> None:
@@ -110,3 +112,41 @@ def test_connect_returns_new_connections(db_paths: DbRuntimePaths) -> None:
 
     with db.connect() as conn:
         assert conn.execute("SELECT 1;").fetchone()[0] == 1
+
+
+def test_bulk_connect_applies_pragmas(db_paths: DbRuntimePaths) -> None:
+    db = Database(db_paths)
+    db.initialize(_make_metadata(db_paths.run_id))
+
+    conn = db.connect(bulk=True)
+    try:
+        assert conn.isolation_level is None
+        assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size;").fetchone()[0] == -65536
+        assert conn.execute("PRAGMA temp_store;").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_bulk_connection_can_be_used_from_worker_thread(db_paths: DbRuntimePaths) -> None:
+    db = Database(db_paths)
+    db.initialize(_make_metadata(db_paths.run_id))
+
+    conn = db.connect(bulk=True)
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            count = executor.submit(
+                lambda: conn.execute("SELECT COUNT(*) FROM metadata;").fetchone()[0]
+            ).result()
+        assert count == 1
+    finally:
+        conn.close()
+
+
+def test_initialize_refuses_existing_database(db_paths: DbRuntimePaths) -> None:
+    db_paths.db_path.write_bytes(b"")
+
+    with pytest.raises(FileExistsError, match="already exists"):
+        Database(db_paths).initialize(_make_metadata(db_paths.run_id))
+
+    assert db_paths.db_path.read_bytes() == b""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 import pytest
@@ -72,3 +73,53 @@ def test_stable_attribute_access(runtime_base: Path) -> None:
     assert runtime_paths.logs_dir == logs_dir
     assert runtime_paths.output_dir == output_dir
     assert runtime_paths.tmp_dir == tmp_dir
+
+
+def test_runtime_paths_is_slotted(runtime_base: Path) -> None:
+    runtime_paths = paths_mod.RuntimePaths.create()
+
+    assert not hasattr(runtime_paths, "__dict__")
+
+
+def test_base_dirs_created_once_per_root(
+    runtime_base: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths_mod.get_runs_base_dir()
+    calls: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def tracking_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        calls.append(self)
+        original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", tracking_mkdir)
+
+    assert paths_mod.get_runs_base_dir() == runtime_base / paths_mod.APP_DIR_NAME / "runs"
+    assert calls == []
+
+
+def test_run_id_collisions_get_counter_suffix(runtime_base: Path) -> None:
+    first = paths_mod.RuntimePaths.create(run_id="fixed")
+    second = paths_mod.RuntimePaths.create(run_id="fixed")
+
+    assert first.run_id == "fixed"
+    assert second.run_id == "fixed_02"
+    assert second.data_dir.is_dir()
+
+
+def test_get_run_dir_recreates_deleted_directory(runtime_base: Path) -> None:
+    run_dir = paths_mod.get_run_dir("removed-run")
+    run_dir.rmdir()
+
+    assert paths_mod.get_run_dir("removed-run") == run_dir
+    assert run_dir.is_dir()
+
+
+def test_create_recovers_after_runs_dir_deleted(runtime_base: Path) -> None:
+    first = paths_mod.RuntimePaths.create(run_id="first")
+    shutil.rmtree(paths_mod.get_runs_base_dir())
+
+    second = paths_mod.RuntimePaths.create(run_id="second")
+
+    assert second.data_dir.is_dir()
+    assert second.run_dir.parent == first.run_dir.parent